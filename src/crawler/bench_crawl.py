@@ -0,0 +1,112 @@
+# 격자 크롤러 부하 테스트 (가짜 카카오 서버 mock_kakao.py 상대로 실제 크롤링 경로 전체 실행)
+# ------------------------------------------------------------
+# ✅ 실제 API / DB 없이 grid.AsyncGridCrawler.crawl_bbox 를 그대로 돌려서 측정
+#    - requests/s : 초당 API 호출 수 (재시도 포함)
+#    - cafes/s    : 초당 수집한 고유 카페 수
+#    - 낭비 요청 비율 : 1 - (고유 카페 수 / 15 를 올림한 최소 요청 수) / 실제 요청 수
+#      → 셀 겹침(중복 문서), 포화 셀 확인용 첫 페이지, 빈 셀, 429 재시도가 모두 낭비로 잡힘
+# ✅ 검색 방식(rect / circle), 동시 요청 수, 초당 요청 수, 응답 지연, 429 비율을 바꿔 가며 비교
+#    python -m crawler.bench_crawl 강남구 마포구 --mode rect circle --rps 200 --latency 30 --error-rate 0.01
+# ------------------------------------------------------------
+import argparse
+import math
+import os
+import tempfile
+import time
+
+from crawler import grid
+from crawler.districts import districts, resolve_district
+from crawler.geo import district_polygon
+from crawler.keypool import KeyPool
+from crawler.mock_kakao import MockKakao
+from crawler.ratelimit import TokenBucket
+
+BENCH_LEDGER = os.path.join(tempfile.gettempdir(), "bench_key_ledger.json")
+BENCH_COOLDOWN = 0.5  # 429 받은 키 휴식 시간 (초)
+BENCH_QUOTA = 10 ** 12  # 일일 한도 (측정 중에는 사실상 무제한)
+
+
+def reset(mode, rps):
+    """실행마다 grid 모듈의 공유 상태 초기화 (캐시 / 저널 / 지문 없이 매번 처음부터)"""
+    for k in grid.stats:
+        grid.stats[k] = 0
+    grid.cell_cache.clear()
+    grid.SEARCH_MODE = mode
+    grid.limiter = TokenBucket(rps)
+    grid.cache = None
+    # 주입한 429 로 키가 60초씩 쉬면 측정이 안 되므로 휴식 시간은 짧게
+    grid.keys = KeyPool(["bench-key"], daily_quota=BENCH_QUOTA, ledger_path=BENCH_LEDGER, cooldown=BENCH_COOLDOWN)
+
+
+def bench(names, mode, concurrency, rps):
+    """구 목록을 한 번 크롤링 → 측정 결과 dict"""
+    reset(mode, rps)
+    ids = set()
+    docs = 0
+
+    async def runner(crawler):
+        nonlocal docs
+        for name in names:
+            polygon = district_polygon(name)
+            if polygon is not None:
+                xmin, ymin, xmax, ymax = polygon.bbox
+            else:
+                xmin, xmax, ymin, ymax = districts[name]["bbox"]
+            results = await crawler.crawl_bbox(xmin, xmax, ymin, ymax, origin=grid.SEOUL_ORIGIN, polygon=polygon)
+            for _, _, cafes in results:
+                docs += len(cafes)
+                ids.update(c["id"] for c in cafes)
+
+    started = time.perf_counter()
+    grid._run(runner, concurrency)
+    elapsed = time.perf_counter() - started
+
+    requests = grid.stats["requests"]
+    ideal = math.ceil(len(ids) / grid.PAGE_SIZE)
+    return {
+        "mode": mode,
+        "seconds": elapsed,
+        "requests": requests,
+        "cafes": len(ids),
+        "docs": docs,
+        "requests_per_s": requests / elapsed if elapsed else 0.0,
+        "cafes_per_s": len(ids) / elapsed if elapsed else 0.0,
+        "wasted_ratio": 1 - ideal / requests if requests else 0.0,
+        "duplicate_ratio": 1 - len(ids) / docs if docs else 0.0,
+        "failed_pages": grid.stats["failed_pages"],
+    }
+
+
+def print_report(results, mock):
+    print(f"\n📈 부하 테스트 결과 (가짜 카페 {len(mock)}개, 주입한 429 {mock.throttled}회)")
+    print(f"{'mode':<8}{'초':>8}{'요청':>8}{'카페':>8}{'req/s':>9}{'cafes/s':>9}{'낭비 요청':>10}{'중복 문서':>10}{'실패':>6}")
+    for r in results:
+        print(f"{r['mode']:<8}{r['seconds']:>8.1f}{r['requests']:>8}{r['cafes']:>8}"
+              f"{r['requests_per_s']:>9.1f}{r['cafes_per_s']:>9.1f}"
+              f"{r['wasted_ratio'] * 100:>9.1f}%{r['duplicate_ratio'] * 100:>9.1f}%{r['failed_pages']:>6}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="가짜 카카오 서버로 격자 크롤러 처리량 측정")
+    parser.add_argument("districts", nargs="*", help="크롤링할 구 (생략 시 25개 구 전체)")
+    parser.add_argument("--mode", nargs="+", choices=grid.SEARCH_MODES, default=list(grid.SEARCH_MODES),
+                        help="비교할 검색 방식")
+    parser.add_argument("--concurrency", type=int, default=grid.CONCURRENCY, help="동시 요청 수")
+    parser.add_argument("--rps", type=float, default=200, help="초당 최대 요청 수 (가짜 서버라 실제 한도보다 크게)")
+    parser.add_argument("--latency", type=float, default=30, help="가짜 서버 평균 응답 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0, help="가짜 서버 일시적 429 비율 (0 ~ 1)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    names = [resolve_district(n) for n in (args.districts or districts)]
+    mock = MockKakao(args.latency / 1000, args.error_rate)
+    grid.CATEGORY_URL = mock.start_in_thread(port=args.port)
+    print(f"☕ 가짜 카카오 서버 {grid.CATEGORY_URL} (카페 {len(mock)}개)")
+
+    results = [bench(names, mode, args.concurrency, args.rps) for mode in args.mode]
+    print_report(results, mock)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# insert_cafe(한 건씩) vs insert_cafes_many(여러 row 한 문장) DB 저장 속도 비교
+# ------------------------------------------------------------
+# ✅ .env.local 의 DB 에 cafes 와 같은 구조의 임시 테이블(cafes_bench)을 만들어서 측정 → 실제 cafes 테이블은 건드리지 않음
+# ✅ 가짜 카페 row(mock_kakao.py 와 같은 데이터)를 INSERT 한 번 + 같은 row 를 다시 넣는 UPDATE 경로 한 번씩 측정
+#    python -m crawler.bench_insert --rows 5000 --batch-size 100 500 1000
+# ✅ 끝나면 임시 테이블 삭제 (--keep 이면 남겨둠)
+# ------------------------------------------------------------
+import argparse
+import time
+
+from sqlalchemy import text
+
+from crawler import db
+from crawler.insert_cafes import insert_cafe, insert_cafes_many
+from crawler.mock_kakao import generate_cafes
+
+BENCH_TABLE = "cafes_bench"
+
+
+def make_rows(n):
+    _, _, docs = generate_cafes()
+    return [{"kakao_id": c["id"], "name": c["place_name"], "address": c["road_address_name"],
+             "latitude": float(c["y"]), "longitude": float(c["x"]), "phone": c["phone"], "open_hours": None,
+             "avg_rating": None, "kakao_url": c["place_url"], "source": "KAKAO"} for c in docs[:n]]
+
+
+def reset_table():
+    with db.begin() as conn:
+        conn.execute(text(f"CREATE TABLE IF NOT EXISTS {BENCH_TABLE} LIKE cafes"))
+        conn.execute(text(f"TRUNCATE TABLE {BENCH_TABLE}"))
+
+
+def timed(fn):
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def bench(rows, batch_sizes):
+    """[(방식, insert 초, update 초), ...] - 방식마다 빈 테이블에서 INSERT 후 같은 row 로 다시 upsert"""
+    results = []
+
+    def per_row():
+        for row in rows:
+            insert_cafe(row, table=BENCH_TABLE)
+
+    reset_table()
+    results.append(("insert_cafe (1건씩)", timed(per_row), timed(per_row)))
+
+    for size in batch_sizes:
+        reset_table()
+        many = lambda: insert_cafes_many(rows, batch_size=size, table=BENCH_TABLE)
+        results.append((f"insert_cafes_many({size})", timed(many), timed(many)))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="insert_cafe vs insert_cafes_many 저장 속도 비교")
+    parser.add_argument("--rows", type=int, default=5000, help="저장할 가짜 카페 수")
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[100, 500, 1000], help="비교할 batch 크기")
+    parser.add_argument("--keep", action="store_true", help="측정 후 임시 테이블을 삭제하지 않음")
+    args = parser.parse_args(argv)
+
+    rows = make_rows(args.rows)
+    print(f"💾 {len(rows)}건으로 측정 (테이블 {BENCH_TABLE})")
+    try:
+        results = bench(rows, args.batch_size)
+    finally:
+        if not args.keep:
+            with db.begin() as conn:
+                conn.execute(text(f"DROP TABLE IF EXISTS {BENCH_TABLE}"))
+
+    base = results[0][1]
+    print(f"\n{'방식':<24}{'INSERT 초':>10}{'rows/s':>10}{'UPDATE 초':>10}{'rows/s':>10}{'배속':>8}")
+    for name, ins, upd in results:
+        print(f"{name:<24}{ins:>10.2f}{len(rows) / ins:>10.0f}{upd:>10.2f}{len(rows) / upd:>10.0f}{base / ins:>7.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    main()
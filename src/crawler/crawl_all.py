@@ -0,0 +1,150 @@
+# 서울시 전체 구를 여러 프로세스로 나눠서 크롤링 (crawl-all)
+# ------------------------------------------------------------
+# ✅ 구 단위로 프로세스 풀에 나눠 줌 → 25개 스크립트를 하나씩 돌릴 필요 없음
+#    python -m crawler.crawl_all                      → 25개 구 전체
+#    python -m crawler.crawl_all 강남구 mapo --workers 2
+# ✅ 모든 워커가 같이 쓰는 것
+#    - 요청 속도 : 공유 메모리 token bucket (SharedTokenBucket) → --rps 는 프로세스 수와 상관없이 전체 합계
+#    - 키 풀 : manager 프로세스에 KeyPool 하나만 두고 워커는 proxy 로 사용 → 키별 사용량 / 429 휴식 / 장부가 하나
+#    - 중복 제거 : manager dict 하나 → 다른 구 워커가 이미 저장한 카페는 insert 생략
+#    - 저장 끝난 셀 : manager dict 하나 → 이웃 구 워커가 이미 받아서 저장한 셀은 요청하지 않음
+# ✅ 저널은 구별 파일 (crawl_journal.<slug>.jsonl) → 끊긴 구만 이어서 진행
+# ✅ 셀 지문은 워커가 결과와 함께 돌려주고 부모 프로세스가 합쳐서 한 번에 저장
+# ------------------------------------------------------------
+import argparse
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.managers import SyncManager
+from typing import Callable
+
+from crawler import grid
+from crawler.dedup import SeenSet
+from crawler.districts import districts, resolve_district
+from crawler.fingerprint import FINGERPRINT_PATH, CellFingerprints
+from crawler.httpcache import DEFAULT_TTL, ResponseCache
+from crawler.journal import JOURNAL_PATH
+from crawler.keypool import KeyPool, keys_from_env
+from crawler.ratelimit import SharedTokenBucket
+
+WORKERS = int(os.getenv("KAKAO_WORKERS", "4"))
+KeyPoolProxy = Callable[..., KeyPool]  # manager.KeyPool(...) → KeyPool 처럼 쓰는 proxy
+
+
+class CrawlManager(SyncManager):
+    """워커 프로세스들이 같이 쓰는 객체(KeyPool, dict)를 들고 있는 manager 프로세스"""
+
+    KeyPool: KeyPoolProxy  # register 가 실행 중에 추가하는 메서드 (타입 검사용 선언)
+
+
+CrawlManager.register("KeyPool", KeyPool)
+
+
+def journal_for(base, name):
+    """구별 저널 파일 경로 : crawl_journal.jsonl → crawl_journal.gangnam.jsonl"""
+    root, ext = os.path.splitext(base)
+    return f"{root}.{districts[name]['slug']}{ext}"
+
+
+def _init_worker(limiter, key_pool, store, covered, options):
+    """워커 프로세스 시작 시 grid 모듈의 공유 자원을 프로세스 간 공유 객체로 교체"""
+    grid.limiter = limiter
+    grid.keys = key_pool
+    grid.seen = SeenSet(store)
+    grid.covered = covered
+    grid.fingerprints = CellFingerprints(options["fingerprints"], refresh=options["refresh"])
+    grid.SEARCH_MODE = options["mode"]
+    grid.cache = options["cache"]
+
+
+def _crawl_one(name, concurrency, journal_base):
+    """워커 : 구 하나 크롤링 → (구, 통계 증가분, 확정된 셀 지문)"""
+    before = dict(grid.stats)
+    journal_path = journal_for(journal_base, name) if journal_base else ""  # 빈 문자열 → 저널 없이 실행
+    grid.crawl_districts([name], concurrency, journal_path, save_fingerprints=False)
+    delta = {k: v - before.get(k, 0) for k, v in grid.stats.items()}
+    return name, delta, grid.fingerprints.pop_updates()
+
+
+def crawl_all(names=None, workers=WORKERS, concurrency=grid.CONCURRENCY, rps=grid.RATE, journal_base=JOURNAL_PATH,
+              mode=None, cache=None, fingerprint_path=FINGERPRINT_PATH, refresh=False):
+    """
+    여러 구를 프로세스 풀로 동시에 크롤링. rps 는 모든 워커를 합친 초당 요청 수.
+    concurrency 는 워커 하나의 동시 요청 수 (전체 속도는 공유 token bucket 이 제한)
+    """
+    names = [resolve_district(n) for n in (names or districts)]
+    workers = max(1, min(workers, len(names)))
+    started = time.time()
+    fingerprints = CellFingerprints(fingerprint_path, refresh=refresh)
+    options = {"fingerprints": fingerprint_path, "refresh": refresh, "mode": mode or grid.SEARCH_MODE, "cache": cache}
+    totals = Counter()
+    failed = []
+
+    with CrawlManager() as manager:
+        key_pool = manager.KeyPool(keys_from_env())
+        store = manager.dict()
+        covered = manager.dict()
+        limiter = SharedTokenBucket(rps)
+        print(f"🚀 {len(names)}개 구를 워커 {workers}개로 크롤링 (전체 {rps:g} req/s, 워커당 동시 요청 {concurrency})")
+        try:
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=(limiter, key_pool, store, covered, options)) as pool:
+                futures = {pool.submit(_crawl_one, name, concurrency, journal_base): name for name in names}
+                for future in as_completed(futures):
+                    try:
+                        name, delta, updates = future.result()
+                    except Exception as e:
+                        failed.append(futures[future])
+                        print(f"❌ {futures[future]} 크롤링 실패 (저널은 남아 있음 → 다시 실행하면 이어서 진행): {e!r}")
+                        continue
+                    totals.update(delta)
+                    fingerprints.merge(updates)
+                    print(f"✅ {name} 완료 ({sum(f.done() for f in futures)}/{len(names)})")
+        finally:
+            fingerprints.save()
+            key_pool.save()
+            summary = key_pool.summary()
+            cafes = len(store)
+
+    print(f"\n🎉 {len(names) - len(failed)}/{len(names)}개 구 크롤링 완료 - 총 {cafes}개 카페, "
+          f"API 호출 {totals['requests']}회, {time.time() - started:.0f}초")
+    if failed:
+        print(f"⚠️ 실패한 구: {', '.join(failed)}")
+    print(f"🔑 키별 오늘 사용량: {summary}")
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="서울시 구별 카페 수집을 여러 프로세스로 동시에 실행")
+    parser.add_argument("districts", nargs="*", help="크롤링할 구 이름 또는 slug (생략 시 25개 구 전체)")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="워커 프로세스 수")
+    parser.add_argument("--concurrency", type=int, default=grid.CONCURRENCY, help="워커 하나의 동시 요청 수")
+    parser.add_argument("--rps", type=float, default=grid.RATE, help="모든 워커를 합친 초당 최대 요청 수")
+    parser.add_argument("--mode", choices=grid.SEARCH_MODES, default=grid.SEARCH_MODE, help="셀 검색 방식")
+    parser.add_argument("--journal", default=JOURNAL_PATH, help="저널 파일 기본 이름 (구별로 .<slug> 가 붙음)")
+    parser.add_argument("--fresh", action="store_true", help="남아 있는 저널을 무시하고 처음부터 실행")
+    parser.add_argument("--cache-ttl", type=int, default=DEFAULT_TTL, help="응답 캐시 유효 시간(초), 0 이면 캐시 사용 안 함")
+    parser.add_argument("--replay", action="store_true", help="API 호출 없이 캐시된 응답만으로 실행")
+    parser.add_argument("--refresh", action="store_true", help="1페이지가 지난번 지문과 같은 셀은 나머지 페이지 생략")
+    parser.add_argument("--fingerprints", default=FINGERPRINT_PATH, help="셀 지문 파일")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        cache = ResponseCache(replay=True)
+    elif args.cache_ttl <= 0:
+        cache = None
+    else:
+        cache = ResponseCache(ttl=args.cache_ttl)
+    names = [resolve_district(n) for n in (args.districts or districts)]
+    if args.fresh and args.journal:
+        for name in names:
+            path = journal_for(args.journal, name)
+            if os.path.exists(path):
+                os.remove(path)
+    crawl_all(names, args.workers, args.concurrency, args.rps, args.journal, args.mode, cache,
+              args.fingerprints, args.refresh)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# 모든 단계(크롤러 저장, Selenium 보강 스크립트, 태그 생성)가 같이 쓰는 DB 연결
+# ------------------------------------------------------------
+# ✅ 스크립트마다 create_engine / pymysql.connect 를 따로 만들지 않고 여기 engine 하나를 공유
+#    - 처음 쓰는 순간에 만듦 (import 만 해서는 DB 에 연결하지 않음), 여러 스레드가 동시에 불러도 하나만 생성
+# ✅ 연결 풀 설정
+#    - pool_size / max_overflow : 동시에 열어둘 연결 수 (writer 스레드 + 보강 워커 수에 맞춰 .env.local 에서 조절)
+#    - pool_pre_ping : 꺼내기 전에 살아 있는지 확인 → 몇 시간짜리 Selenium 작업 중 "MySQL server has gone away" 방지
+#    - pool_recycle : 오래된 연결은 새로 만듦 (MySQL wait_timeout 보다 짧게)
+# ✅ 사용법
+#    with db.begin() as conn: conn.execute(text(...), params)     → SQLAlchemy (자동 commit/rollback)
+#    with db.connect() as conn: rows = conn.execute(text(...)).fetchall()
+#    with db.raw_connection() as conn: cursor = conn.cursor() ...  → pymysql 커서 그대로 (%s 바인딩)
+#    db.fetchall(sql, params) / db.execute(sql, params)             → pymysql 스타일 한 줄짜리
+#    for cafe_id, url, name in db.iter_cafes("cafe_id, kakao_url, name", "kakao_url IS NOT NULL"): ...
+#                                                                   → 테이블 전체를 cafe_id 순서로 조금씩 (아래 참고)
+# ✅ iter_cafes : fetchall() 로 전체를 메모리에 올리지 않고 cafe_id keyset 으로 CHUNK_SIZE 개씩 끊어서 조회
+#    - WHERE cafe_id > (지난 chunk 의 마지막 id) ORDER BY cafe_id LIMIT n → PK 인덱스만 타서 테이블이 커져도 chunk 당 비용 일정
+#    - 첫 chunk 가 오면 바로 작업 시작, 메모리는 chunk 하나만큼
+#    - chunk 사이에는 연결을 풀에 반납 (server-side cursor 처럼 몇 시간짜리 Selenium 작업 내내 연결을 붙잡지 않음)
+#    - 작업 중 UPDATE 된 row 가 조건에서 빠지거나 실패한 row 가 남아 있어도 건너뛰거나 다시 도는 일 없음
+#    - chunk 조회는 for 문이 다음 row 를 꺼낼 때 일어남 → 연결이 끊기면 여기서 새 연결로 다시 시도 (CHUNK_RETRIES 번)
+#      (호출 측 루프 안의 try/except 로는 잡을 수 없어서, 재시도 없이는 실행 전체가 멈춤)
+# ------------------------------------------------------------
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import pymysql
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+from sqlalchemy import exc as sa_exc
+
+load_dotenv(".env.local")
+
+DB_USER = os.getenv("DB_USER")
+DB_PW = os.getenv("DB_PW")
+DB_HOST = os.getenv("DB_URL")
+DB_NAME = os.getenv("DB_NAME", "cafeOn")
+
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))          # 항상 열어두는 연결 수
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))   # 바쁠 때 추가로 여는 연결 수
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 이 시간(초)보다 오래된 연결은 새로 만듦
+POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))    # 풀이 다 찼을 때 빈 연결을 기다리는 최대 시간(초)
+DB_ECHO = os.getenv("DB_ECHO", "0") == "1"                # 디버깅할 때만 .env.local 에 DB_ECHO=1
+CHUNK_SIZE = int(os.getenv("DB_CHUNK_SIZE", "500"))       # iter_cafes 가 한 번에 가져오는 row 수
+CHUNK_RETRIES = 5    # iter_cafes chunk 조회가 연결 오류로 실패했을 때 다시 시도하는 횟수
+RETRY_WAIT = 3       # 첫 재시도 전 대기 (초), 이후 2배씩 (최대 60초)
+
+# 연결이 끊겼을 때 나는 오류 (pymysql 커서에서 바로 나는 것 + SQLAlchemy 가 감싼 것)
+DB_ERRORS = (pymysql.err.OperationalError, pymysql.err.InterfaceError, sa_exc.OperationalError)
+
+_engine = None
+_lock = threading.Lock()
+
+
+def db_url():
+    return f"mysql+pymysql://{DB_USER}:{DB_PW}@{DB_HOST}:3306/{DB_NAME}?charset=utf8mb4"  # mysql+pymysql : MySQL을 PyMySQL드라이버로 연결
+
+
+def get_engine():
+    """공유 engine (처음 부를 때 생성)"""
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = create_engine(db_url(), echo=DB_ECHO, future=True, pool_size=POOL_SIZE,
+                                        max_overflow=MAX_OVERFLOW, pool_recycle=POOL_RECYCLE,
+                                        pool_timeout=POOL_TIMEOUT, pool_pre_ping=True)
+    return _engine
+
+
+def connect():
+    """SQLAlchemy 연결 (with 블록이 끝나면 풀로 반납)"""
+    return get_engine().connect()
+
+
+def begin():
+    """SQLAlchemy 트랜잭션 (with 블록이 끝나면 commit, 오류면 rollback 후 풀로 반납)"""
+    return get_engine().begin()
+
+
+@contextmanager
+def raw_connection():
+    """풀에서 꺼낸 pymysql 연결. 정상 종료면 commit, 오류면 rollback 후 풀로 반납"""
+    conn = get_engine().raw_connection()
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()  # 실제로 끊는 게 아니라 풀로 반납
+
+
+def fetchall(sql, params=None):
+    with raw_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def execute(sql, params=None):
+    """한 문장 실행 + commit → 영향받은 row 수"""
+    with raw_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def iter_cafes(columns="cafe_id, kakao_url, name", where=None, params=(), chunk_size=CHUNK_SIZE, start_after=0):
+    """
+    cafes 를 cafe_id 순서로 chunk_size 개씩 조회해서 row 를 하나씩 돌려주는 generator.
+    columns 의 첫 컬럼은 cafe_id, where / params 는 %s 바인딩 조건 (예: "kakao_url IS NOT NULL").
+    start_after 보다 큰 cafe_id 부터 시작 (중간에 끊긴 작업 이어서 하기)
+    """
+    condition = f" AND ({where})" if where else ""
+    sql = f"SELECT {columns} FROM cafes WHERE cafe_id > %s{condition} ORDER BY cafe_id LIMIT %s"
+    last = start_after
+    while True:
+        rows = _fetch_chunk(sql, (last, *params, chunk_size))
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        last = rows[-1][0]
+
+
+def _fetch_chunk(sql, params, retries=CHUNK_RETRIES):
+    """iter_cafes 의 chunk 하나 조회. 연결 오류면 잠시 쉬고 풀의 새 연결로 다시 시도 (last 기준이라 빠지는 row 없음)"""
+    for attempt in range(retries):
+        try:
+            return fetchall(sql, params)
+        except DB_ERRORS as e:
+            wait = min(60, RETRY_WAIT * 2 ** attempt)
+            print(f"⚠️ DB 조회 오류 → {wait}초 후 다시 시도 ({attempt + 1}/{retries}): {e}")
+            time.sleep(wait)
+    return fetchall(sql, params)  # 마지막 시도 : 실패하면 예외가 그대로 올라감
+
+
+def count_cafes(where=None, params=()):
+    """iter_cafes 와 같은 조건의 row 수 (진행률 표시용)"""
+    condition = f" WHERE {where}" if where else ""
+    return fetchall(f"SELECT COUNT(*) FROM cafes{condition}", params)[0][0]
+
+
+def dispose():
+    """풀에 있는 연결을 전부 닫음 (fork 한 자식 프로세스에서 부모 연결을 같이 쓰지 않도록)"""
+    global _engine
+    with _lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
@@ -0,0 +1,74 @@
+# 크롤링 1회 실행 동안의 kakao_id 중복 제거 + 중복 비율 통계
+# ------------------------------------------------------------
+# ✅ 반경 검색 격자는 셀끼리 겹쳐서 같은 카페가 여러 셀에서 반복해서 내려옴
+#    → 이미 DB에 넣은 kakao_id 는 insert_cafe 를 다시 호출하지 않음 (DB 왕복 / 트랜잭션 절약)
+# ✅ 구별로 "반환된 문서 수 vs 고유 카페 수" 를 세서 격자 겹침으로 낭비된 비율을 확인
+# ✅ store 로 multiprocessing Manager 의 dict 를 넘기면 여러 프로세스가 같은 저장 기록을 공유 (crawl_all.py)
+# ------------------------------------------------------------
+import threading
+from collections import Counter, defaultdict
+
+from crawler.insert_cafes import insert_cafe, insert_cafes_many
+
+
+class SeenSet:
+    def __init__(self, store=None):
+        self.inserted = {} if store is None else store  # 이번 실행에서 DB 에 저장한 kakao_id → 저장한 구
+        self.copies = Counter()                # 구별 API 가 돌려준 문서 수 (중복 포함)
+        self.unique = defaultdict(set)         # 구별 고유 kakao_id
+        self.skipped = Counter()               # 구별로 아낀 insert_cafe 호출 수
+        self._lock = threading.Lock()
+
+    def __contains__(self, kakao_id):
+        return kakao_id in self.inserted
+
+    def __len__(self):
+        return len(self.inserted)
+
+    def observe(self, district, kakao_id):
+        """API 결과 문서 1건 집계 (저장 대상 여부와 상관없이 모든 문서)"""
+        with self._lock:
+            self.copies[district] += 1
+            self.unique[district].add(kakao_id)
+
+    def insert(self, data, district, insert_fn=insert_cafe):
+        """처음 보는 kakao_id 면 insert_fn(data) 호출 후 True, 이미 저장한 카페면 False"""
+        kakao_id = data["kakao_id"]
+        with self._lock:
+            if kakao_id in self.inserted:
+                self.skipped[district] += 1
+                return False
+        insert_fn(data)  # 실패하면 예외 그대로 전달 → seen 에 기록하지 않음 (다음 셀에서 다시 시도)
+        with self._lock:
+            self.inserted[kakao_id] = district
+        return True
+
+    def insert_many(self, rows, district, insert_fn=insert_cafes_many):
+        """처음 보는 kakao_id 의 row 만 모아서 insert_fn(rows) 한 번 호출 → 새로 저장한 row 리스트"""
+        fresh, ids = [], set()
+        with self._lock:
+            for row in rows:
+                kakao_id = row["kakao_id"]
+                if kakao_id in self.inserted or kakao_id in ids:
+                    self.skipped[district] += 1
+                    continue
+                ids.add(kakao_id)
+                fresh.append(row)
+        if fresh:
+            insert_fn(fresh)  # 실패하면 예외 그대로 전달 → 아무것도 seen 에 기록하지 않음
+        with self._lock:
+            for kakao_id in ids:
+                self.inserted[kakao_id] = district
+        return fresh
+
+    def duplicate_ratio(self, district):
+        """구 하나에서 API 가 돌려준 문서 중 중복(이미 받은 카페)의 비율 (0 ~ 1)"""
+        copies = self.copies[district]
+        if not copies:
+            return 0.0
+        return 1 - len(self.unique[district]) / copies
+
+    def report(self, district):
+        print(f"🔁 {district} 중복 비율 {self.duplicate_ratio(district) * 100:.1f}% "
+              f"(반환 {self.copies[district]}건 / 고유 {len(self.unique[district])}건), "
+              f"DB 저장 생략 {self.skipped[district]}회")
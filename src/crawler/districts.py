@@ -0,0 +1,41 @@
+# 서울시 25개 구 크롤링 범위 테이블
+# - bbox : (xmin, xmax, ymin, ymax) = (경도 최소, 경도 최대, 위도 최소, 위도 최대)
+# - 기존 crawl_seoulsi/*.py 스크립트에 하드코딩돼 있던 대략 범위를 그대로 옮겨온 값
+# - 정확한 행정경계는 seoul_districts.geojson 참고
+districts = {
+    "강남구": {"slug": "gangnam", "bbox": (127.02, 127.10, 37.45, 37.55)},
+    "마포구": {"slug": "mapo", "bbox": (126.90, 126.97, 37.53, 37.58)},
+    "서초구": {"slug": "seocho", "bbox": (126.97, 127.05, 37.45, 37.51)},
+    "성동구": {"slug": "seongdong", "bbox": (127.02, 127.07, 37.54, 37.57)},
+    "광진구": {"slug": "gwangjin", "bbox": (127.07, 127.12, 37.53, 37.57)},
+    "송파구": {"slug": "songpa", "bbox": (127.09, 127.17, 37.48, 37.55)},
+    "용산구": {"slug": "yongsan", "bbox": (126.96, 127.02, 37.52, 37.56)},
+    "관악구": {"slug": "gwanak", "bbox": (126.91, 126.97, 37.45, 37.50)},
+    "금천구": {"slug": "geumcheon", "bbox": (126.88, 126.93, 37.43, 37.48)},
+    "영등포구": {"slug": "yeongdeungpo", "bbox": (126.88, 126.95, 37.50, 37.54)},
+    "구로구": {"slug": "guro", "bbox": (126.86, 126.91, 37.46, 37.51)},
+    "강서구": {"slug": "gangseo", "bbox": (126.80, 126.88, 37.52, 37.60)},
+    "양천구": {"slug": "yangcheon", "bbox": (126.83, 126.88, 37.51, 37.55)},
+    "동작구": {"slug": "dongjak", "bbox": (126.93, 126.98, 37.48, 37.52)},
+    "동대문구": {"slug": "dongdaemun", "bbox": (127.03, 127.08, 37.56, 37.60)},
+    "성북구": {"slug": "seongbuk", "bbox": (127.00, 127.04, 37.58, 37.63)},
+    "서대문구": {"slug": "seodaemun", "bbox": (126.93, 126.96, 37.56, 37.59)},
+    "종로구": {"slug": "jongro", "bbox": (126.96, 127.02, 37.56, 37.60)},
+    "중구": {"slug": "jung", "bbox": (126.97, 127.03, 37.55, 37.57)},
+    "강동구": {"slug": "gangdong", "bbox": (127.12, 127.18, 37.52, 37.57)},
+    "중랑구": {"slug": "jungnang", "bbox": (127.08, 127.12, 37.57, 37.63)},
+    "도봉구": {"slug": "dobong", "bbox": (127.01, 127.06, 37.64, 37.69)},
+    "은평구": {"slug": "eunpyeong", "bbox": (126.90, 126.96, 37.57, 37.64)},
+    "노원구": {"slug": "nowon", "bbox": (127.05, 127.12, 37.62, 37.68)},
+    "강북구": {"slug": "gangbuk", "bbox": (127.00, 127.04, 37.61, 37.67)},
+}
+
+
+def resolve_district(key):
+    """'강남구' 또는 'gangnam' → '강남구'"""
+    if key in districts:
+        return key
+    for name, info in districts.items():
+        if info["slug"] == key:
+            return name
+    raise KeyError(f"알 수 없는 구: {key}")
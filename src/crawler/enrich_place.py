@@ -0,0 +1,225 @@
+# 카카오맵 장소 상세페이지를 카페당 한 번만 열고 별점 / 대표 사진 / 운영시간을 한꺼번에 수집
+# ------------------------------------------------------------
+# ✅ 예전에는 같은 kakao_url 을 get_kakao_ratings / get_image_url / get_open_hours 에서 세 번 열었음 (매번 2~4초 렌더링 대기)
+#    → 한 번 열고 extractors.py 의 추출기를 같은 DOM 에 차례로 실행 → 카페당 브라우저 시간 약 1/3
+# ✅ 추출 결과는 UpdateBuffer 로 모았다가 한 번에 저장 (추출기마다 컬럼이 다르면 CASE UPDATE 하나로)
+# ✅ 작업 큐(workqueue.py) 사용 → 여러 터미널 / 서버에서 띄우면 카페를 나눠서 처리
+#    python -m crawler.enrich_place                       → 등록된 추출기 전부 (rating, photo, hours)
+#    python -m crawler.enrich_place --fields rating hours → 원하는 것만
+# ✅ 새 필드는 extractors.py 에 @extractor("이름", "컬럼") 함수 하나 추가하면 자동으로 포함
+# ✅ 브라우저 풀 : 헤드리스 크롬 BROWSERS 개를 동시에 띄워서 처리 (카페당 대부분이 렌더링 대기 → 브라우저 수만큼 빨라짐)
+#    - 메인 스레드가 작업 큐에서 batch 를 받아 카페를 나눠주고, 브라우저 워커(스레드 + 각자 드라이버)가 처리
+#    - 결과는 writer 스레드 하나(pipeline.BatchWriter)가 UpdateBuffer 에 모아서 저장
+#    - 드라이버가 죽으면(크롬 크래시 / 세션 끊김) 그 워커만 드라이버를 다시 띄우고 같은 카페를 한 번 더 시도
+#    python -m crawler.enrich_place --browsers 6          → 크롬 6개 (기본값 ENRICH_BROWSERS, 크롬 하나에 CPU 1개 / 메모리 약 500MB 기준)
+# ------------------------------------------------------------
+import argparse
+import os
+import queue
+import random
+import threading
+import time
+
+from dotenv import load_dotenv
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from crawler.extractors import EXTRACTORS, run_extractors
+from crawler.pipeline import BatchWriter
+from crawler.updatebuffer import UpdateBuffer
+from crawler.workqueue import BATCH_SIZE, WorkQueue
+
+load_dotenv(".env.local")
+
+PAGE_WAIT = (2, 4)       # 페이지 연 뒤 JS 렌더링 대기 (초, 랜덤)
+THROTTLE = (0.8, 1.3)    # 카페 사이 간격 (초, 랜덤) → 과도한 연속 요청으로 차단 방지
+RESTART_EVERY = 100      # 이만큼 처리할 때마다 드라이버 재시작 (메모리 안정성)
+BROWSERS = int(os.getenv("ENRICH_BROWSERS", str(max(1, (os.cpu_count() or 2) // 2))))  # 동시에 띄울 크롬 수
+RESTART_WAIT = (3, 60)   # 드라이버를 다시 못 띄우면 기다리는 시간 (초, 실패할 때마다 2배 → 최대값)
+
+_STOP = object()
+_driver_path = None
+_driver_lock = threading.Lock()
+
+
+def driver_path():
+    """chromedriver 경로 (다운로드는 한 번만 → 워커들이 동시에 install 하다가 파일이 깨지지 않게)"""
+    global _driver_path
+    with _driver_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+def new_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920x1080")
+    chrome_options.add_argument("--lang=ko-KR")
+    return webdriver.Chrome(service=Service(driver_path()), options=chrome_options)
+
+
+def enrich_place(driver, url, fields=None):
+    """장소 페이지를 한 번 열고 추출기 실행 → {컬럼: 값}"""
+    driver.get(url)
+    time.sleep(random.uniform(*PAGE_WAIT))
+    return run_extractors(driver, fields)
+
+
+class BrowserWorker(threading.Thread):
+    """
+    드라이버 하나를 가진 브라우저 워커. tasks 에서 (cafe_id, kakao_url, name) 을 꺼내 처리하고
+    (row, {컬럼: 값} 또는 None, 오류) 를 writer 로 넘김. 어떤 오류에도 스레드는 죽지 않음 (드라이버만 교체)
+    """
+
+    def __init__(self, index, tasks, writer, fields):
+        super().__init__(name=f"browser-{index}", daemon=True)
+        self.index = index
+        self.tasks = tasks
+        self.writer = writer
+        self.fields = fields
+        self.driver = None
+        self.used = 0         # 지금 드라이버로 처리한 카페 수
+        self.restarts = 0     # 크래시로 드라이버를 다시 띄운 횟수
+
+    def run(self):
+        try:
+            while True:
+                row = self.tasks.get()
+                if row is _STOP:
+                    self.tasks.task_done()
+                    return
+                try:
+                    self.writer.put_blocking(self.process(row))
+                finally:
+                    self.tasks.task_done()
+                time.sleep(random.uniform(*THROTTLE))
+        finally:
+            self.quit()
+
+    def process(self, row):
+        cafe_id, kakao_url, name = row
+        error = None
+        for attempt in (1, 2):   # 드라이버가 죽어서 실패했으면 새 드라이버로 한 번 더
+            try:
+                driver = self.start_driver()
+                values = enrich_place(driver, kakao_url, self.fields)
+                self.used += 1
+                if self.used >= RESTART_EVERY:
+                    print(f"♻️ [{self.name}] {RESTART_EVERY}개 완료 → 드라이버 재시작")
+                    self.quit()
+                return row, values, None
+            except Exception as e:
+                error = e
+                if self.alive():
+                    break        # 페이지 / 추출 오류 → 드라이버는 멀쩡하니 다음 카페로
+                print(f"💥 [{self.name}] 드라이버 종료됨 ({name}, {cafe_id}) → 다시 띄움: {e!r}")
+                self.quit()
+                self.restarts += 1
+        return row, None, error
+
+    def start_driver(self):
+        """드라이버가 없으면 띄워서 돌려줌. 실패하면 (크롬 메모리 부족 등) 기다렸다가 계속 재시도"""
+        wait = RESTART_WAIT[0]
+        while self.driver is None:
+            try:
+                self.driver = new_driver()
+                self.used = 0
+            except Exception as e:
+                print(f"❌ [{self.name}] 드라이버 시작 실패 → {wait}초 후 재시도: {e!r}")
+                time.sleep(wait)
+                wait = min(wait * 2, RESTART_WAIT[1])
+        return self.driver
+
+    def alive(self):
+        """드라이버(크롬)가 아직 응답하는지 (드라이버가 없으면 False → 다시 띄움)"""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass  # 이미 죽은 크롬
+            self.driver = None
+
+
+def enrich_all(fields=None, browsers=BROWSERS):
+    fields = [name for name in EXTRACTORS if name in (fields or EXTRACTORS)]  # 등록 순서대로 (운영시간 "더보기" 클릭은 마지막)
+    updates = UpdateBuffer()
+    # batch 가 브라우저 수보다 넉넉해야 batch 끝에서 노는 브라우저가 적음
+    cafes = WorkQueue(f"place:{'+'.join(fields)}", "cafe_id, kakao_url, name", "kakao_url IS NOT NULL",
+                      batch_size=max(BATCH_SIZE, browsers * 4), buffer=updates)
+    total = cafes.remaining()
+    stats = {"done": 0, "failed": 0}
+    print(f"📊 {total}개 카페 상세페이지 수집 시작 ({', '.join(fields)}) (브라우저 {browsers}개, 워커 {cafes.worker})")
+
+    def save(batch):   # writer 스레드 하나에서만 실행 → UpdateBuffer / 출력 / 통계를 한 곳에서
+        for (cafe_id, kakao_url, name), values, error in batch:
+            idx = stats["done"] + stats["failed"] + 1
+            if error is not None:
+                stats["failed"] += 1
+                print(f"❌ [{idx}/{total}] {name} ({cafe_id}) 오류: {error}")
+                continue
+            stats["done"] += 1
+            if values:
+                try:
+                    updates.add(cafe_id, **values)
+                except Exception as e:   # 저장 실패해도 결과는 버퍼에 남아 있음 → 다음 flush 때 다시 시도
+                    print(f"❌ 결과 저장 실패 (다음 flush 때 재시도): {e!r}")
+            print(f"✅ [{idx}/{total}] {name} ({cafe_id}) → {values or '찾은 값 없음'}")
+
+    tasks = queue.Queue()
+    writer = BatchWriter(save, name="enrich-writer")
+    workers = [BrowserWorker(i, tasks, writer, fields) for i in range(browsers)]
+    for w in workers:
+        w.start()
+    started = time.time()
+    try:
+        for rows in cafes.batches():
+            for row in rows:
+                tasks.put(row)
+            tasks.join()    # batch 의 카페를 브라우저들이 다 처리하고
+            writer.join()   # 결과가 전부 UpdateBuffer 에 들어가면 → 다음 batch 를 받을 때 flush 후 done 처리
+    finally:
+        while True:         # 중단된 경우 아직 안 나눠준 카페는 버림 (작업 큐에서 release → 다음 실행 때 다시 처리)
+            try:
+                tasks.get_nowait()
+                tasks.task_done()
+            except queue.Empty:
+                break
+        for _ in workers:
+            tasks.put(_STOP)
+        for w in workers:
+            w.join()
+        writer.close()
+        updates.close()
+
+    elapsed = time.time() - started
+    restarts = sum(w.restarts for w in workers)
+    print(f"\n🎉 {cafes.completed}개 카페 완료 ({elapsed:.0f}초, 브라우저 {browsers}개 → 카페당 {elapsed / max(cafes.completed, 1):.1f}초, "
+          f"실패 {stats['failed']}, 크래시 재시작 {restarts})")
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="카카오맵 장소 상세페이지를 한 번만 열고 여러 필드 수집")
+    parser.add_argument("--fields", nargs="+", choices=list(EXTRACTORS), help="실행할 추출기 (생략 시 전부)")
+    parser.add_argument("--browsers", type=int, default=BROWSERS, help="동시에 띄울 헤드리스 크롬 수")
+    args = parser.parse_args(argv)
+    enrich_all(args.fields, max(1, args.browsers))
+
+
+if __name__ == "__main__":
+    main()
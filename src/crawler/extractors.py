@@ -0,0 +1,217 @@
+# 카카오맵 장소 상세페이지(place.map.kakao.com)에서 값을 뽑는 추출기 모음
+# ------------------------------------------------------------
+# ✅ 이미 열려 있는 페이지(driver)에서 값만 읽음 → 페이지 한 번 열고 여러 추출기를 차례로 실행 (enrich_place.py)
+# ✅ 추출기 등록 : @extractor("이름", "저장할 cafes 컬럼") → EXTRACTORS 에 추가, 새 필드도 함수 하나만 추가하면 됨
+#    - 함수는 driver 를 받아서 저장할 값을 돌려줌, 못 찾으면 None (→ 그 컬럼은 갱신 안 함)
+#    - 등록 순서대로 실행 : 별점(렌더링 대기) → 사진 → 운영시간('더보기' 클릭으로 DOM 이 바뀌므로 마지막)
+# ✅ get_kakao_ratings.py / get_image_url.py / get_open_hours.py 도 여기 함수를 그대로 사용
+# ✅ JSON 경로(placeapi.py)는 구조화된 (요일, 시간) 목록을 format_weekly_hours 로 같은 모양의 값으로 만듦
+#    → selenium 은 페이지를 읽는 함수 안에서만 import (selenium 없이도 이 모듈을 import 할 수 있게)
+# ------------------------------------------------------------
+import re
+import time
+
+RATING_SELECTOR = "span.starred_grade span.num_star"
+RATING_WAIT = 8   # 별점 요소가 렌더링될 때까지 최대 대기 시간 (초)
+PHOTO_SELECTORS = [
+    "div.board_photo a.link_photo img",  # ✅ 새로 확인된 구조
+    "div.place_thumb img",
+    "div.photo_area img",
+    "div.bg_present img",
+    "div.wrap_thumb img",
+]
+OPEN_HOURS_SELECTORS = [
+    "#foldDetail2 .info_operation",
+    "#foldDetail2 .detail_info",
+    ".location_present",
+    ".txt_operation",
+]
+
+EXTRACTORS = {}   # 이름 → (cafes 컬럼, 함수)
+
+
+def extractor(name, column):
+    def register(fn):
+        EXTRACTORS[name] = (column, fn)
+        return fn
+    return register
+
+
+@extractor("rating", "kakao_rating")
+def extract_rating(driver, wait=RATING_WAIT):
+    """별점 숫자 (렌더링 완료될 때까지 최대 wait 초 기다림) → float, 없으면 None"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        elem = WebDriverWait(driver, wait).until(EC.visibility_of_element_located((By.CSS_SELECTOR, RATING_SELECTOR)))
+    except Exception:
+        return None  # 페이지 구조가 달라졌거나 별점이 없을 때
+    txt = elem.text.strip()
+    return float(txt) if txt else None
+
+
+@extractor("photo", "photo_url")
+def extract_photo_url(driver):
+    """대표 이미지 src (board_photo 전용 selector 부터)"""
+    from selenium.webdriver.common.by import By
+
+    for sel in PHOTO_SELECTORS:
+        try:
+            elems = driver.find_elements(By.CSS_SELECTOR, sel)
+            print(f"🔍 selector='{sel}' → {len(elems)}개 발견")
+            for e in elems:
+                src = e.get_attribute("src")
+                if src and src.startswith("http"):
+                    print(f"✅ 이미지 src 발견: {src[:90]}...")
+                    return src
+        except Exception as e:
+            print(f"❌ selector '{sel}' 오류: {e}")
+    return None
+
+
+def clean_open_hours(raw: str) -> str:
+    """카카오맵 영업시간 텍스트에서 불필요한 문구 제거 및 정규화"""
+    if not raw:
+        return "정보없음"
+
+    # 1) 불필요한 키워드 제거
+    raw = re.sub(r"(영업\s*중|영업\s*마감|곧\s*영업\s*마감|내일\s*\d{1,2}:\d{2}\s*오픈|수정제안|요기요\s*제공)", "", raw)
+
+    # 2) 날짜 패턴 제거 (예: (10/10), (10/12) 등)
+    raw = re.sub(r"\(\d{1,2}/\d{1,2}\)", "", raw)
+
+    # 3) 불필요한 공백 / 줄바꿈 정리
+    raw = re.sub(r"\s+", " ", raw).strip()
+
+    # 4) 라스트오더, 브레이크타임, 공휴일 등 보조정보는 유지 (핵심은 시간만)
+    return raw
+
+
+def extract_weekly_schedule(raw: str) -> str:
+    """정규표현식으로 '요일 + 시간' 패턴만 남기고, 월~일 순서로 정렬"""
+    if not raw or raw == "정보없음":
+        return raw
+
+    # (요일)(시작시간)(종료시간) 그룹으로 추출
+    matches = re.findall(r"(월|화|수|목|금|토|일)[^\d]*(\d{1,2}:\d{2})\s*[~\-]\s*(\d{1,2}:\d{2})", raw)
+
+    if not matches:
+        return raw  # 혹시 매칭 실패 시 원본 반환
+
+    # 요일 순서 기준
+    order = {"월": 1, "화": 2, "수": 3, "목": 4, "금": 5, "토": 6, "일": 7}
+
+    results = []
+    for day, start, end in matches:
+        results.append((order.get(day, 99), f"{day} {start} ~ {end}"))
+
+    # 중복 제거 + 요일순 정렬
+    unique = list(dict.fromkeys(results))
+    unique.sort(key=lambda x: x[0])
+
+    # 정렬된 문자열로 반환
+    return "\n".join([item[1] for item in unique])
+
+
+WEEKDAYS = "월화수목금토일"
+DAY_ALIASES = {"매일": WEEKDAYS, "평일": "월화수목금", "주말": "토일"}
+DAY_PATTERN = r"([월화수목금토일])(?:요일)?"
+
+
+def expand_days(text):
+    """요일 표기 → 요일 목록 ("매일" → 월~일, "월~금" → 월 화 수 목 금, "토,일" → 토 일). 모르는 표기면 빈 리스트"""
+    days = []
+    for part in re.split(r"[,/·]", text or ""):
+        part = part.strip()
+        if not part:
+            continue
+        if part in DAY_ALIASES:
+            days += DAY_ALIASES[part]
+            continue
+        m = re.fullmatch(rf"{DAY_PATTERN}(?:\s*[~\-]\s*{DAY_PATTERN})?", part)
+        if not m:
+            return []
+        start = WEEKDAYS.index(m.group(1))
+        end = WEEKDAYS.index(m.group(2) or m.group(1))
+        days += [WEEKDAYS[(start + i) % 7] for i in range((end - start) % 7 + 1)]  # "금~월" 처럼 주를 넘어가도 OK
+    return days
+
+
+def format_weekly_hours(entries):
+    """
+    [(요일 표기, "10:00 ~ 22:00"), ...] → extract_weekly_schedule 과 같은 "월 10:00 ~ 22:00" 줄 (월~일 순서)
+    요일 범위는 하루씩 펼쳐서 저장 (텍스트 정규식은 "매일" / "월~금" 을 첫 글자 하루로 읽어버림). 없으면 "정보없음"
+    """
+    hours, unknown = {}, []
+    for day_text, time_se in entries:
+        m = re.search(r"(\d{1,2}:\d{2})\s*[~\-]\s*(\d{1,2}:\d{2})", time_se or "")
+        span = f"{m.group(1)} ~ {m.group(2)}" if m else (time_se or "").strip()
+        days = expand_days(day_text)
+        if not days:
+            unknown.append(f"{day_text or ''} {span}".strip())  # 모르는 요일 표기는 원문 그대로 남김
+        for day in days:
+            hours.setdefault(day, span)  # 같은 요일이 두 번 나오면 먼저 나온 영업시간
+    lines = [f"{day} {hours[day]}" for day in WEEKDAYS if day in hours] + unknown
+    return "\n".join(lines) or "정보없음"
+
+
+def extract_open_hours(driver):
+    """ 카카오맵 카페 상세페이지에서 운영시간 텍스트를 추출하는 함수 """
+    from selenium.webdriver.common.by import By
+
+    try:
+        # 접혀있을 경우, '더보기' 버튼 클릭
+        btns = driver.find_elements(By.CSS_SELECTOR, 'button[aria-controls="foldDetail2"], button.btn_fold2')
+        if btns:
+            try:
+                btns[0].click()
+            except Exception:
+                driver.execute_script("arguments[0].click();", btns[0])  # 자바스크립트로 클릭 시도
+                time.sleep(0.5) # 클릭 후 잠시 대기
+
+        texts = []
+        for sel in OPEN_HOURS_SELECTORS:
+            elems = driver.find_elements(By.CSS_SELECTOR, sel)
+            for e in elems:
+                txt = e.get_attribute("textContent") or e.text
+                if txt and len(txt.strip()) > 4: # 너무 짧은 텍스트는 제외
+                    texts.append(txt.strip())
+
+            if texts:
+                break  # 유효한 텍스트를 찾았으면 더 이상 탐색하지 않음
+
+        if not texts:
+            return None
+
+        # 여러 줄 정리
+        raw = sorted(texts, key=len, reverse=True)[0]  # 가장 긴 텍스트 선택
+        raw = raw.replace("영업정보 전체보기", "").strip()
+        lines = [line.strip() for line in raw.splitlines() if line.strip()]
+        return "\n".join(lines)
+
+    except Exception as e:
+        print("extract_open_hours() 오류:", e)
+        return None
+
+
+@extractor("hours", "open_hours")
+def extract_weekly_open_hours(driver):
+    """운영시간 → 정제 + '요일 시간' 형태 (get_open_hours.py 와 같은 결과, 못 찾으면 "정보없음")"""
+    return extract_weekly_schedule(clean_open_hours(extract_open_hours(driver) or "정보없음"))
+
+
+def run_extractors(driver, names=None):
+    """열려 있는 페이지에 추출기들을 차례로 실행 → {컬럼: 값} (None 인 값은 제외, 추출기 하나가 실패해도 나머지는 계속)"""
+    values = {}
+    for name in names or EXTRACTORS:
+        column, fn = EXTRACTORS[name]
+        try:
+            value = fn(driver)
+        except Exception as e:
+            print(f"❌ 추출기 {name} 오류: {e}")
+            continue
+        if value is not None:
+            values[column] = value
+    return values
@@ -0,0 +1,81 @@
+# 격자 셀별 지문(fingerprint) 저장소 - 주간 갱신(refresh) 때 안 바뀐 셀은 1페이지만 보고 건너뛰기
+# ------------------------------------------------------------
+# ✅ 셀 하나를 끝까지 받고 DB 저장까지 끝나면 {"total": total_count, "ids": 정렬한 kakao_id 전체의 해시, "first": 1페이지 id 해시} 기록
+# ✅ --refresh 실행에서는 1페이지만 요청해서 total_count + 1페이지 id 가 지난번과 같으면 나머지 페이지는 요청 안 함
+#    → 갱신 비용이 서울 전체 크기가 아니라 "바뀐 셀 수" 를 따라감
+# ✅ 셀 키는 (검색 방식, 격자 원점, root_step, (i, j, path)) → 구가 달라도 같은 셀이면 같은 지문
+# ------------------------------------------------------------
+import hashlib
+import json
+import os
+import threading
+
+FINGERPRINT_PATH = os.getenv("KAKAO_FINGERPRINTS", "cell_fingerprints.json")
+
+
+def ids_hash(docs):
+    ids = sorted(str(d.get("id")) for d in docs)
+    return hashlib.sha1(",".join(ids).encode("utf-8")).hexdigest()
+
+
+def cell_key(origin, root_step, cell, mode="rect"):
+    i, j, path = cell
+    return f"{mode}:{origin[0]:.5f},{origin[1]:.5f},{root_step}:{i},{j},{path}"
+
+
+class CellFingerprints:
+    def __init__(self, path=FINGERPRINT_PATH, refresh=False):
+        self.path = path
+        self.refresh = refresh   # True 면 지문이 같은 셀은 1페이지만 받고 건너뜀
+        self.cells = {}          # 셀 키 → 확정된 지문
+        self.staged = {}         # 받았지만 아직 DB 저장 전인 셀의 지문
+        self.updated = {}        # 이번 실행에서 확정된 지문 (다른 프로세스의 결과를 합칠 때 사용)
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.cells = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def unchanged(self, key, first_docs, meta):
+        """1페이지 결과가 저장된 지문과 같은지 (refresh 모드에서만 True 가능)"""
+        old = self.cells.get(key)
+        if not self.refresh or old is None:
+            return False
+        return old["total"] == meta.get("total_count") and old["first"] == ids_hash(first_docs)
+
+    def stage(self, key, first_docs, meta, docs):
+        """셀을 끝까지 받았을 때 지문 준비 (DB 저장이 끝나면 commit). 이전과 달라졌으면 True"""
+        fp = {"total": meta.get("total_count"), "ids": ids_hash(docs), "first": ids_hash(first_docs)}
+        with self._lock:
+            self.staged[key] = fp
+            return self.cells.get(key) != fp
+
+    def commit(self, key):
+        """DB 저장까지 끝난 셀의 지문 확정 → 저장 실패한 셀은 다음 refresh 에서 반드시 다시 받음"""
+        with self._lock:
+            fp = self.staged.pop(key, None)
+            if fp is not None:
+                self.cells[key] = fp
+                self.updated[key] = fp
+
+    def pop_updates(self):
+        """이번 실행에서 확정된 지문을 꺼냄 (crawl_all 워커 → 부모 프로세스)"""
+        with self._lock:
+            updated, self.updated = self.updated, {}
+        return updated
+
+    def merge(self, updates):
+        with self._lock:
+            self.cells.update(updates)
+
+    def save(self):
+        with self._lock:
+            data = json.dumps(self.cells, ensure_ascii=False)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+
+    def __len__(self):
+        return len(self.cells)
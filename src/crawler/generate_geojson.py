@@ -1,7 +1,8 @@
-import requests
 import json
 import os
 from dotenv import load_dotenv
+from crawler import httpclient  # 공유 HTTP 세션 (keep-alive / 재시도 / timeout)
+from crawler.geo import GEOJSON_PATH  # 크롤러(geo.py)가 읽는 경로에 바로 저장 → 실행 위치와 상관없음
 load_dotenv(".env.local")
 
 # V-World API key
@@ -33,7 +34,7 @@ def get_district_geojson(district_name):
     "format": "geojson"
   }
 
-  res = requests.get(url, params=params).json()
+  res = httpclient.get(url, params=params).json()
 
   try:
     # item = res["response"]["result"]["items"][0]
@@ -59,15 +60,18 @@ def main():
     if feature:
       features.append(feature)
 
+  if not features:
+    raise RuntimeError(f"❌ 불러온 구 경계가 없음 → {GEOJSON_PATH} 는 그대로 둠")
+
   geojson = {
     "type": "FeatureCollection",
     "features": features
   }
 
-  with open("seoul_districts.geojson", "w", encoding="utf-8") as f:
+  with open(GEOJSON_PATH, "w", encoding="utf-8") as f:
     json.dump(geojson, f, ensure_ascii=False, indent=2)
 
-  print("✅ seoul_districts.geojson 파일 생성 완료!")
+  print(f"✅ {GEOJSON_PATH} 파일 생성 완료! (구 {len(features)}/{len(districts)}개)")
 
 if __name__ == "__main__":
   main()
@@ -0,0 +1,176 @@
+# 구 경계(polygon) 유틸 - seoul_districts.geojson (generate_geojson.py 로 생성) 기반
+# ------------------------------------------------------------
+# ✅ 구 경계를 한 번만 전처리(PreparedPolygon)해두고 좌표 배열 전체를 numpy 로 한 번에 판정
+# ✅ 검색 원(중심 + 반경)이 경계와 겹치는지 = "경계를 반경만큼 buffer 한 영역 안에 중심이 있는지"
+# ✅ 카페 좌표 → 소속 구 (point-in-polygon). 경계 파일이 없으면 주소의 "구" 토큰으로 판정
+#    ("중구" in "서울 종로구 중구청로" 같은 부분 문자열 매칭 오류 없음)
+# ⚠️ 저장소에 들어 있는 seoul_districts.geojson 은 feature 가 없는 빈 파일
+#    → generate_geojson.py (VWORLD_API_KEY 필요) 로 채우기 전에는 셀 masking 이 동작하지 않고 소속 구도 주소로만 판정
+# ------------------------------------------------------------
+import json
+import math
+import os
+from typing import List, Optional
+
+import numpy as np
+
+from crawler.districts import districts
+
+GEOJSON_PATH = os.path.join(os.path.dirname(__file__), "seoul_districts.geojson")
+
+M_PER_DEG_LAT = 110540   # 위도 1도 ≈ 110.54km
+M_PER_DEG_LON = 111320   # 경도 1도 ≈ 111.32km x cos(위도)
+CHUNK = 256              # 한 번에 판정할 좌표 수 (좌표 x 변 개수 행렬 메모리 제한용)
+
+
+class PreparedPolygon:
+    """
+    (Multi)Polygon 을 변(edge) 배열로 미리 펼쳐둔 구조.
+    좌표는 경계 중심 위도 기준의 평면 근사(m 단위)로 변환해서 계산한다 (구 하나 크기에서는 오차 무시 가능).
+    """
+
+    def __init__(self, polygons):
+        # polygons : [[외곽 ring, 구멍 ring, ...], ...]  (ring = [[경도, 위도], ...])
+        rings = [np.asarray(ring, dtype=float)[:, :2] for poly in polygons for ring in poly if len(ring) >= 3]
+        if not rings:
+            raise ValueError("빈 polygon")
+        points = np.vstack(rings)
+        self.bbox = (points[:, 0].min(), points[:, 1].min(), points[:, 0].max(), points[:, 1].max())
+        self.lat0 = (self.bbox[1] + self.bbox[3]) / 2
+        self.kx = M_PER_DEG_LON * math.cos(math.radians(self.lat0))
+
+        starts, ends = [], []
+        for ring in rings:
+            if not np.array_equal(ring[0], ring[-1]):
+                ring = np.vstack([ring, ring[:1]])  # 닫히지 않은 ring 은 닫아줌
+            starts.append(ring[:-1])
+            ends.append(ring[1:])
+        a, b = self._to_m(np.vstack(starts)), self._to_m(np.vstack(ends))
+        self.ax, self.ay = a[:, 0], a[:, 1]
+        self.bx, self.by = b[:, 0], b[:, 1]
+
+    def _to_m(self, lonlat):
+        lonlat = np.asarray(lonlat, dtype=float)
+        return np.column_stack([lonlat[:, 0] * self.kx, lonlat[:, 1] * M_PER_DEG_LAT])
+
+    def _contains_m(self, px, py):
+        # 짝홀 규칙 ray casting : 오른쪽으로 쏜 반직선이 변을 몇 번 지나는지 (구멍 ring 도 자동 처리)
+        px, py = px[:, None], py[:, None]
+        crosses = (self.ay > py) != (self.by > py)
+        dy = np.where(self.by == self.ay, 1.0, self.by - self.ay)
+        x_cross = self.ax + (py - self.ay) * (self.bx - self.ax) / dy
+        return (np.count_nonzero(crosses & (px < x_cross), axis=1) % 2) == 1
+
+    def _distance_m(self, px, py):
+        # 점 ↔ 모든 변(선분) 최단거리의 최솟값
+        px, py = px[:, None], py[:, None]
+        ex, ey = self.bx - self.ax, self.by - self.ay
+        length2 = np.where(ex * ex + ey * ey == 0, 1.0, ex * ex + ey * ey)
+        t = np.clip(((px - self.ax) * ex + (py - self.ay) * ey) / length2, 0.0, 1.0)
+        dx = px - (self.ax + t * ex)
+        dy = py - (self.ay + t * ey)
+        return np.sqrt(dx * dx + dy * dy).min(axis=1)
+
+    def contains(self, xs, ys):
+        """좌표 배열(경도 xs, 위도 ys) 각각이 polygon 안에 있는지 bool 배열"""
+        return self.intersects_circles(xs, ys, 0)
+
+    def intersects_circles(self, xs, ys, radius):
+        """중심 (xs, ys), 반경 radius(m, 스칼라 또는 배열) 원이 polygon 과 겹치는지 bool 배열"""
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        radius = np.broadcast_to(np.asarray(radius, dtype=float), xs.shape)
+        result = np.zeros(xs.shape, dtype=bool)
+
+        # bbox 를 반경만큼 넓힌 범위 밖은 계산할 필요 없음
+        xmin, ymin, xmax, ymax = self.bbox
+        rx, ry = radius / self.kx, radius / M_PER_DEG_LAT
+        near = (xs >= xmin - rx) & (xs <= xmax + rx) & (ys >= ymin - ry) & (ys <= ymax + ry)
+        idx = np.flatnonzero(near)
+
+        for start in range(0, len(idx), CHUNK):
+            part = idx[start:start + CHUNK]
+            px, py = xs[part] * self.kx, ys[part] * M_PER_DEG_LAT
+            hit = self._contains_m(px, py)
+            rest = ~hit
+            if rest.any():
+                hit[rest] = self._distance_m(px[rest], py[rest]) <= radius[part][rest]
+            result[part] = hit
+        return result
+
+
+def feature_polygons(feature):
+    """GeoJSON feature → [[ring, ...], ...] (Polygon / MultiPolygon 공통 형태)"""
+    geom = feature.get("geometry") or {}
+    if geom.get("type") == "Polygon":
+        return [geom["coordinates"]]
+    if geom.get("type") == "MultiPolygon":
+        return geom["coordinates"]
+    return []
+
+
+def feature_name(feature):
+    props = feature.get("properties") or {}
+    return props.get("name") or props.get("sig_kor_nm")
+
+
+_cache = {}
+
+
+def load_district_polygons(path=GEOJSON_PATH):
+    """seoul_districts.geojson → {구 이름: PreparedPolygon}. 파일이 없거나 비어 있으면 빈 dict"""
+    if path in _cache:
+        return _cache[path]
+    polygons = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            geojson = json.load(f)
+        for feature in geojson.get("features", []):
+            name, polys = feature_name(feature), feature_polygons(feature)
+            if name and polys:
+                polygons[name] = PreparedPolygon(polys)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ 구 경계 파일 로드 실패 ({path}): {e}")
+    if not polygons:
+        print(f"⚠️ 구 경계 없음 ({path}) → 셀 masking 비활성, 소속 구는 주소로 판정 (generate_geojson.py 로 생성 필요)")
+    _cache[path] = polygons
+    return polygons
+
+
+def district_polygon(name, path=GEOJSON_PATH):
+    """구 이름 → PreparedPolygon (없으면 None)"""
+    return load_district_polygons(path).get(name)
+
+
+def district_from_address(address):
+    """주소 → 구 이름 (공백으로 나눈 토큰이 구 이름과 정확히 같을 때만, 서울이 아니면 None)"""
+    tokens = (address or "").split()
+    if not tokens or not tokens[0].startswith("서울"):
+        return None
+    for token in tokens[1:3]:
+        if token in districts:
+            return token
+    return None
+
+
+def assign_districts(xs, ys, addresses=None, path=GEOJSON_PATH):
+    """
+    좌표 배열 → 소속 구 이름 리스트 (서울 밖이면 None).
+    구 경계 polygon 으로 판정하고, 경계 파일이 없거나 경계 사이 틈에 걸린 좌표는 주소(addresses)로 판정
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    owners: List[Optional[str]] = [None] * len(xs)
+    left = np.ones(len(xs), dtype=bool)
+    for name, polygon in load_district_polygons(path).items():
+        x0, y0, x1, y1 = polygon.bbox
+        idx = np.nonzero(left & (xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1))[0]
+        if not len(idx):
+            continue
+        inside = idx[polygon.contains(xs[idx], ys[idx])]
+        for i in inside:
+            owners[i] = name
+        left[inside] = False
+    if addresses is not None:
+        for i in np.nonzero(left)[0]:
+            owners[i] = district_from_address(addresses[i])
+    return owners
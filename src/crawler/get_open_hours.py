@@ -1,22 +1,16 @@
 from dotenv import load_dotenv
 from selenium import webdriver  # selenium : 브라우저 자동조작 (실제 크롬 창 띄워서 웹페이지 클릭/스크롤/텍스트 추출 등 가능) pip install selenium
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By # By : HTML요소를 찾을 때 사용하는 기준 (CSS_SELECTOR, XPATH 등)
-from sqlalchemy import create_engine, text  # SQLAlchemy : 파이썬 <-> MySQL 연결을 쉽게 해주는 ORM/DB 라이브러리 pip install SQLAlchemy pymysql
-import time, random, os, re # 파이썬 표준 모듈. 대기 시간(sleep), 랜덤 시간 설정할 때 사용
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import time, random # 파이썬 표준 모듈. 대기 시간(sleep), 랜덤 시간 설정할 때 사용
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+from crawler.extractors import clean_open_hours, extract_open_hours, extract_weekly_schedule
+from crawler.updatebuffer import UpdateBuffer  # 결과 모아서 저장 (공유 DB 연결 풀 사용) → src 에서 python -m crawler.get_open_hours 로 실행
+from crawler.workqueue import WorkQueue
+
 # 1. DB 연결 (SQLAlchemy)
 load_dotenv(".env.local")  # .env.local 파일에서 환경변수 불러오기
-DB_URL = os.getenv("DB_URL")
-DB_USER = os.getenv("DB_USER")
-DB_PW = os.getenv("DB_PW")
-
-DB_CONN_URL = f"mysql+pymysql://{DB_USER}:{DB_PW}@{DB_URL}:3306/cafeOn?charset=utf8mb4"
-engine = create_engine(DB_CONN_URL) # engine은 이후 쿼리를 실행할 때 쓰임 (engine.connect(), engine.begin() 등)
 
 # 2. 크롤링 준비 (Selenium + ChromeDriver로 실제 브라우저 렌더링)
 # Selenium 설정
@@ -29,95 +23,12 @@ driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), opti
 # 3. 운영시간 추출 로직 구현 (페이지 내에서 '영업시간' 또는 '운영시간'을 포함하는 element를 찾아서 텍스트만 뽑기)
 # 3-1. DB에서 open_hours 비어있는 카페 목록 가져오기
 # ※ 기존에는 open_hours가 비어있는 데이터만 불러왔지만, 지금은 전체를 다시 갱신하기 위해 조건을 제거함
-with engine.connect() as conn:
-    cafes = conn.execute(text("SELECT cafe_id, kakao_url, name FROM cafes LIMIT 15000")).fetchall()    # 전체 카페 데이터 대상으로 크롤링 수행
-
-wait = WebDriverWait(driver, 8) # 최대 8초 대기 (페이지 로딩 및 요소 탐색 시)
-
-def clean_open_hours(raw: str) -> str:
-    """카카오맵 영업시간 텍스트에서 불필요한 문구 제거 및 정규화"""
-    if not raw:
-        return "정보없음"
-
-    # 1) 불필요한 키워드 제거
-    raw = re.sub(r"(영업\s*중|영업\s*마감|곧\s*영업\s*마감|내일\s*\d{1,2}:\d{2}\s*오픈|수정제안|요기요\s*제공)", "", raw)
-
-    # 2) 날짜 패턴 제거 (예: (10/10), (10/12) 등)
-    raw = re.sub(r"\(\d{1,2}/\d{1,2}\)", "", raw)
-
-    # 3) 불필요한 공백 / 줄바꿈 정리
-    raw = re.sub(r"\s+", " ", raw).strip()
-
-    # 4) 라스트오더, 브레이크타임, 공휴일 등 보조정보는 유지 (핵심은 시간만)
-    return raw
-
-def extract_weekly_schedule(raw: str) -> str:
-    """정규표현식으로 '요일 + 시간' 패턴만 남기고, 월~일 순서로 정렬"""
-    if not raw or raw == "정보없음":
-        return raw
-
-    # (요일)(시작시간)(종료시간) 그룹으로 추출
-    matches = re.findall(r"(월|화|수|목|금|토|일)[^\d]*(\d{1,2}:\d{2})\s*[~\-]\s*(\d{1,2}:\d{2})", raw)
-
-    if not matches:
-        return raw  # 혹시 매칭 실패 시 원본 반환
-
-    # 요일 순서 기준
-    order = {"월": 1, "화": 2, "수": 3, "목": 4, "금": 5, "토": 6, "일": 7}
+# ※ 작업 큐(workqueue.py)에서 카페를 조금씩 맡아서 처리 → 이 스크립트를 여러 개(여러 서버) 띄우면 알아서 나눠서 크롤링
+updates = UpdateBuffer()   # 운영시간 결과 버퍼 (N개 / T초마다, 그리고 종료 시 저장)
+cafes = WorkQueue("open_hours", "cafe_id, kakao_url, name", buffer=updates)    # 전체 카페 데이터 대상으로 크롤링 수행 (개수 상한 없음)
+print(f"📊 이번 회차 남은 카페 {cafes.remaining()}개 (워커 {cafes.worker})")
 
-    results = []
-    for day, start, end in matches:
-        results.append((order.get(day, 99), f"{day} {start} ~ {end}"))
-
-    # 중복 제거 + 요일순 정렬
-    unique = list(dict.fromkeys(results))
-    unique.sort(key=lambda x: x[0])
-
-    # 정렬된 문자열로 반환
-    return "\n".join([item[1] for item in unique])
-
-def extract_open_hours(driver):
-    """ 카카오맵 카페 상세페이지에서 운영시간 텍스트를 추출하는 함수 """
-    try:
-        # 접혀있을 경우, '더보기' 버튼 클릭
-        btns = driver.find_elements(By.CSS_SELECTOR, 'button[aria-controls="foldDetail2"], button.btn_fold2')
-        if btns:
-            try:
-                btns[0].click()
-            except:
-                driver.execute_script("arguments[0].click();", btns[0])  # 자바스크립트로 클릭 시도
-                time.sleep(0.5) # 클릭 후 잠시 대기
-
-        selectors = [
-            "#foldDetail2 .info_operation",
-            "#foldDetail2 .detail_info",
-            ".location_present",
-            ".txt_operation"
-        ]
-
-        texts = []
-        for sel in selectors:
-            elems = driver.find_elements(By.CSS_SELECTOR, sel)
-            for e in elems:
-                txt = e.get_attribute("textContent") or e.text
-                if txt and len(txt.strip()) > 4: # 너무 짧은 텍스트는 제외
-                    texts.append(txt.strip())
-
-            if texts:
-                break  # 유효한 텍스트를 찾았으면 더 이상 탐색하지 않음
-
-        if not texts:
-            return None
-
-        # 여러 줄 정리
-        raw = sorted(texts, key=len, reverse=True)[0]  # 가장 긴 텍스트 선택
-        raw = raw.replace("영업정보 전체보기", "").strip()
-        lines = [line.strip() for line in raw.splitlines() if line.strip()]
-        return "\n".join(lines)
-
-    except Exception as e:
-        print("extract_open_hours() 오류:", e)
-        return None
+# 운영시간 추출 / 정제 함수 : extractors.py (extract_open_hours, clean_open_hours, extract_weekly_schedule)
 
 # 3-2. 가져온 카페들 하나씩 반복문 돌려, 각 URL에서 운영시간 가져오기
 for cafe_id, kakao_url, name in cafes:
@@ -130,12 +41,8 @@ for cafe_id, kakao_url, name in cafes:
         open_hours = clean_open_hours(open_hours)
         open_hours = extract_weekly_schedule(open_hours)  # ✅ 요일+시간 형태로 정제
 
-        # 3-5. DB 업데이트
-        with engine.begin() as conn:    # 트랜잭션 단위로 DB 연결 시작 (자동 commit/rollback)
-            conn.execute(
-                text("UPDATE cafes SET open_hours = :open_hours WHERE cafe_id = :cafe_id"),   # 파라미터 바인딩 방식으로 SQL Injection 방지
-                {"open_hours": open_hours, "cafe_id": cafe_id},  # cafe_id별로 3-5에서 추출한 open_hours 텍스트값으로 컬럼 업데이트
-            )
+        # 3-5. DB 업데이트 (바로 저장하지 않고 모았다가 여러 카페를 UPDATE 한 문장으로 저장, 파라미터 바인딩 방식 그대로)
+        updates.add(cafe_id, open_hours=open_hours)  # cafe_id별로 3-5에서 추출한 open_hours 텍스트값으로 컬럼 업데이트
 
         print(f"✅ [{name}] ({cafe_id}) -> {open_hours}")    # 콘솔에 성공 로그 출력
 
@@ -144,4 +51,5 @@ for cafe_id, kakao_url, name in cafes:
         print(f"❌ {cafe_id} 오류: {e}")
         continue    # 크롤링 중 에러가 나도 전체 코드 멈추지 않고 다음 카페로 넘어감
 
+updates.close()  # 아직 안 저장된 운영시간 저장
 driver.quit() # 브라우저 종료 (작업이 끝나면 Chrome 프로세스를 안전하게 닫음)
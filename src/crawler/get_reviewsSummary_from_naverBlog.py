@@ -1,12 +1,13 @@
 # get_reviewsSummary_from_naver.py
 # ------------------------------------------------------------
 # ✅ 네이버 블로그 리뷰를 수집하고 OpenRouter 무료 모델로 요약 후 DB에 저장
-# ✅ MySQL 자동 재연결 (ConnectionResetError, server gone away 완벽 대응)
+# ✅ MySQL 자동 재연결 (쿼리마다 풀의 살아 있는 연결 사용, 카페 목록 chunk 조회는 db.iter_cafes 가 재시도)
 # ✅ 모든 카페 대상 반복 실행
 # ------------------------------------------------------------
 
 from dotenv import load_dotenv
-import requests, pymysql, time, os, json, sys
+import requests, time, os, json
+from crawler import db, httpclient  # 공유 DB 연결 풀 / 공유 HTTP 세션 (keep-alive / 재시도 / timeout)
 
 # ① 환경변수 불러오기
 load_dotenv(".env.local")
@@ -14,26 +15,7 @@ client_id = os.getenv("NAVER_API_CLIENT_ID")
 client_secret = os.getenv("NAVER_API_SECRET_KEY")
 openrouter_key = os.getenv("OPENROUTER_API_KEY")
 
-DB_CONFIG = {
-    "host": os.getenv("DB_URL"),
-    "user": os.getenv("DB_USER"),
-    "password": os.getenv("DB_PW"),
-    "database": "cafeOn",
-    "charset": "utf8mb4",
-    "autocommit": False
-}
-
-# ② DB 연결 함수 (끊기면 자동 재연결)
-def get_connection():
-    try:
-        conn = pymysql.connect(**DB_CONFIG)
-        cursor = conn.cursor()
-        return conn, cursor
-    except Exception as e:
-        print(f"❌ DB 연결 실패: {e}")
-        sys.exit(1)
-
-conn, cursor = get_connection()
+# ② DB 연결 : 공유 연결 풀(db.py) → 쿼리마다 풀에서 꺼내고 반납 (pool_pre_ping 으로 끊긴 연결은 자동 교체)
 
 # ③ OpenRouter 요약 함수
 def summarize_text(text):
@@ -71,7 +53,7 @@ def summarize_text(text):
     }
 
     try:
-        res = requests.post(url, headers=headers, json=payload, timeout=60)
+        res = httpclient.post(url, headers=headers, json=payload, timeout=60)
 
         # OpenRouter 특정 에러 코드 처리
         if res.status_code == 402:
@@ -106,7 +88,7 @@ def get_blog_snippets(query):
     }
     params = {"query": query + " 카페 리뷰", "display": 5, "sort": "sim"}
     try:
-        res = requests.get("https://openapi.naver.com/v1/search/blog.json", headers=headers, params=params)
+        res = httpclient.get("https://openapi.naver.com/v1/search/blog.json", headers=headers, params=params)
         if res.status_code == 200:
             items = res.json().get("items", [])
             return [i["description"] for i in items]
@@ -118,48 +100,39 @@ def get_blog_snippets(query):
         return []
 
 # ⑤ 전체 카페 불러오기
-cursor.execute("SELECT cafe_id, name FROM cafes;")
-cafes = cursor.fetchall()
-print(f"📊 총 {len(cafes)}개 카페 요약 시작... (기존 데이터도 포함)")
+cafes = db.iter_cafes("cafe_id, name")  # cafe_id 순서로 조금씩 가져옴 (전체를 메모리에 올리지 않음)
+total = db.count_cafes()
+print(f"📊 총 {total}개 카페 요약 시작... (기존 데이터도 포함)")
 
 # ⑥ 메인 루프
 for idx, (cafe_id, name) in enumerate(cafes, start=1):
     try:
-        # 🔸 연결 유지 확인
-        conn.ping(reconnect=True)
-
         snippets = get_blog_snippets(name)
         if not snippets:
-            print(f"⚠️ ({idx}/{len(cafes)}) [{name}] 관련 블로그 없음, 건너뜀")
+            print(f"⚠️ ({idx}/{total}) [{name}] 관련 블로그 없음, 건너뜀")
             continue
 
         text = " ".join(snippets)
         summary = summarize_text(text)
 
         sql = "UPDATE cafes SET reviewsSummary = %s WHERE cafe_id = %s"
-        cursor.execute(sql, (summary, cafe_id))
-        conn.commit()
+        db.execute(sql, (summary, cafe_id))
 
         if "요약 실패" in summary:
-            print(f"⚠️ ({idx}/{len(cafes)}) [{name}] 요약 실패 → {summary}")
+            print(f"⚠️ ({idx}/{total}) [{name}] 요약 실패 → {summary}")
         else:
-            print(f"✅ ({idx}/{len(cafes)}) [{name}] 요약 완료 → {summary[:60]}...")
+            print(f"✅ ({idx}/{total}) [{name}] 요약 완료 → {summary[:60]}...")
 
         time.sleep(5)  # API 과부하 방지
 
-    except pymysql.err.OperationalError as e:
+    except db.DB_ERRORS as e:
         print(f"⚠️ DB 연결 끊김 감지 → 재연결 시도 중... ({e})")
-        time.sleep(3)
-        conn, cursor = get_connection()
+        time.sleep(3)  # 다음 쿼리는 풀이 새 연결로 실행 (다음 chunk 조회가 끊기면 iter_cafes 가 재시도)
         continue
 
     except Exception as e:
-        print(f"❌ ({idx}/{len(cafes)}) [{name}] 처리 중 오류 발생: {e}")
-        try:
-            conn.rollback()
-        except:
-            pass
-        continue
+        print(f"❌ ({idx}/{total}) [{name}] 처리 중 오류 발생: {e}")
+        continue  # db.execute 가 실패한 트랜잭션은 rollback 후 반납
 
-conn.close()
+db.dispose()
 print("🎉 모든 카페 요약 저장 완료!")
@@ -4,11 +4,12 @@
 # ✅ 진행률(%) + ETA(예상 완료 시간)
 # ✅ 네이버 Local로 상호/주소 정규화 → 블로그 다단계 쿼리
 # ✅ 블로그 없으면 중립 요약으로 폴백(재시도 악순환 방지)
-# ✅ MySQL 끊김 자동복구 / OpenRouter 무료 모델 사용
+# ✅ MySQL 끊김 자동복구 (카페 목록 chunk 조회는 db.iter_cafes 가 재시도) / OpenRouter 무료 모델 사용
 # ------------------------------------------------------------
 
 from dotenv import load_dotenv
-import requests, pymysql, time, os, json, sys, html, re
+import time, os, json, html, re
+from crawler import db, httpclient  # 공유 DB 연결 풀 / 공유 HTTP 세션 (keep-alive / 재시도 / timeout)
 from datetime import timedelta
 from typing import Optional
 
@@ -18,26 +19,7 @@ client_id = os.getenv("NAVER_API_CLIENT_ID")
 client_secret = os.getenv("NAVER_API_SECRET_KEY")
 openrouter_key = os.getenv("OPENROUTER_API_KEY")    # OpenRouter API 키의 크레딧이 모두 소진되었거나, 다른 계정/조직 키를 잘못 사용 중 에러
 
-DB_CONFIG = {
-    "host": os.getenv("DB_URL"),
-    "user": os.getenv("DB_USER"),
-    "password": os.getenv("DB_PW"),
-    "database": "cafeOn",
-    "charset": "utf8mb4",
-    "autocommit": False
-}
-
-# ② DB 연결
-def get_connection():
-    try:
-        conn = pymysql.connect(**DB_CONFIG)
-        cursor = conn.cursor()
-        return conn, cursor
-    except Exception as e:
-        print(f"❌ DB 연결 실패: {e}")
-        sys.exit(1)
-
-conn, cursor = get_connection()
+# ② DB 연결 : 공유 연결 풀(db.py) → 쿼리마다 풀에서 꺼내고 반납 (pool_pre_ping 으로 끊긴 연결은 자동 교체)
 
 # ③ 요약 (OpenRouter 크레딧소진 ->무료 HuggingFace API 사용)
 # + OpenRouter + HuggingFace fallback, 자동 전환
@@ -95,7 +77,7 @@ def summarize_text(text: str) -> str:
                 "max_tokens": 400,
                 "stop": ["\n\n", "요약:"]
             }
-            r = requests.post(OPENROUTER_URL, headers=headers, json=payload, timeout=60)
+            r = httpclient.post(OPENROUTER_URL, headers=headers, json=payload, timeout=60)
 
             # OpenRouter 특정 에러 코드 처리
             if r.status_code == 402:
@@ -134,7 +116,7 @@ def summarize_text(text: str) -> str:
         }
         # 503(loading) 대기 & 재시도: 최대 6회, 지수백오프
         for attempt in range(6):
-            resp = requests.post(url, headers=headers, json=payload, timeout=120)
+            resp = httpclient.post(url, headers=headers, json=payload, timeout=120)
             if resp.status_code == 503:
                 # 모델 로딩 중 → 대기 후 재시도
                 wait = min(5 * (2 ** attempt), 40)
@@ -201,7 +183,7 @@ def naver_local_normalize(name: str):
     }
     params = {"query": name, "display": 3}
     try:
-        r = requests.get("https://openapi.naver.com/v1/search/local.json", headers=headers, params=params, timeout=20)
+        r = httpclient.get("https://openapi.naver.com/v1/search/local.json", headers=headers, params=params, timeout=20)
         if r.status_code == 200:
             items = r.json().get("items", [])
             if items:
@@ -248,7 +230,7 @@ def get_blog_snippets(name: str, gu_or_dong: Optional[str]):
     for q in queries:
         params = {"query": q, "display": 5, "sort": "sim"}
         try:
-            res = requests.get("https://openapi.naver.com/v1/search/blog.json", headers=headers, params=params, timeout=20)
+            res = httpclient.get("https://openapi.naver.com/v1/search/blog.json", headers=headers, params=params, timeout=20)
             if res.status_code == 200:
                 items = res.json().get("items", [])
                 if items:
@@ -272,17 +254,14 @@ def get_blog_snippets(name: str, gu_or_dong: Optional[str]):
     return snippets[:5]
 
 # ⑦ 아직 요약 안 된 카페만
-cursor.execute("SELECT cafe_id, name, address FROM cafes WHERE reviewsSummary IS NULL;")
-cafes = cursor.fetchall()
-total = len(cafes)
+cafes = db.iter_cafes("cafe_id, name, address", "reviewsSummary IS NULL")  # cafe_id 순서로 조금씩 (저장하면서 조건에서 빠져도 건너뛰는 row 없음)
+total = db.count_cafes("reviewsSummary IS NULL")
 print(f"📊 아직 요약되지 않은 카페: {total}개 (NULL only)")
 
 # ⑧ 메인 루프
 start_time = time.time()
 for idx, (cafe_id, name, address) in enumerate(cafes, start=1):
     try:
-        conn.ping(reconnect=True)
-
         # 구/동 힌트 추출
         gu_hint = None
         if address:
@@ -296,8 +275,7 @@ for idx, (cafe_id, name, address) in enumerate(cafes, start=1):
             # 🔸 폴백: 리뷰 부족 중립 요약으로 채움(재시도 악순환 방지)
             summary = f"해당 매장에 대한 최근 블로그 리뷰가 매우 적거나 확인되지 않았습니다. 방문 환경과 메뉴는 시기에 따라 달라질 수 있으니 최신 정보를 확인해 보시길 권합니다."
             sql = "UPDATE cafes SET reviewsSummary = %s WHERE cafe_id = %s"
-            cursor.execute(sql, (summary, cafe_id))
-            conn.commit()
+            db.execute(sql, (summary, cafe_id))
 
             elapsed = time.time() - start_time
             avg_time = elapsed / idx
@@ -314,8 +292,7 @@ for idx, (cafe_id, name, address) in enumerate(cafes, start=1):
         summary = summarize_text(text)
 
         sql = "UPDATE cafes SET reviewsSummary = %s WHERE cafe_id = %s"
-        cursor.execute(sql, (summary, cafe_id))
-        conn.commit()
+        db.execute(sql, (summary, cafe_id))
 
         elapsed = time.time() - start_time
         avg_time = elapsed / idx
@@ -330,19 +307,14 @@ for idx, (cafe_id, name, address) in enumerate(cafes, start=1):
 
         time.sleep(5)  # API 과부하 방지
 
-    except pymysql.err.OperationalError as e:
+    except db.DB_ERRORS as e:
         print(f"⚠️ DB 연결 끊김 감지 → 재연결 중... ({e})")
-        time.sleep(3)
-        conn, cursor = get_connection()
+        time.sleep(3)  # 다음 쿼리는 풀이 새 연결로 실행 (다음 chunk 조회가 끊기면 iter_cafes 가 재시도)
         continue
 
     except Exception as e:
         print(f"❌ [{idx}/{total}] [{name}] 오류 발생: {e}")
-        try:
-            conn.rollback()
-        except:
-            pass
-        continue
+        continue  # db.execute 가 실패한 트랜잭션은 rollback 후 반납
 
-conn.close()
+db.dispose()
 print("🎉 누락된 카페 요약 저장 완료!")
@@ -0,0 +1,670 @@
+# 카카오 카테고리 검색 격자 크롤러 (quadtree 적응형 분할)
+# ------------------------------------------------------------
+# ✅ 카테고리 검색은 최대 45페이지 x 15개 = 675개까지만 내려줌
+#    → 첫 페이지 meta.total_count 가 675를 넘으면 셀을 4등분해서 다시 검색
+# ✅ 한강 위처럼 카페가 없는 셀은 첫 페이지 1번 호출로 끝
+# ✅ 셀은 (루트 격자 x 인덱스, y 인덱스, 분할 경로) 로 표현 → float 누적 오차 없음
+# ✅ 기본은 rect 모드 : 셀 사각형 그대로 rect 파라미터로 검색 → 셀끼리 겹치지 않아 카페 하나를 거의 한 번만 받음
+#    (--mode circle 이면 예전처럼 셀을 덮는 원(x/y/radius)으로 검색 → 이웃 셀과 원이 겹쳐 같은 카페를 여러 번 받음)
+# ✅ 여러 구를 한 프로세스에서 크롤링 (HTTP 세션 / rate limiter / 중복 제거 set 공유)
+#    python -m crawler.grid              → 25개 구 전체
+#    python -m crawler.grid 강남구 mapo   → 원하는 구만
+# ✅ 구 경계(seoul_districts.geojson)가 있으면 검색 원이 경계와 겹치지 않는 셀은 아예 요청하지 않음
+#    (저장소의 geojson 은 비어 있음 → generate_geojson.py 로 채우기 전에는 masking 없이 bbox 전체 탐색)
+# ✅ asyncio(aiohttp)로 여러 셀 / 페이지를 동시에 요청, 속도는 공유 token bucket 으로만 제한
+#    (search_cafes / search_cell / crawl_bbox 같은 동기 함수는 그대로 쓸 수 있는 얇은 wrapper)
+# ✅ 진행 상황은 crawl_journal.jsonl 에 기록 → 중단돼도 다시 실행하면 끊긴 셀 / 페이지부터 이어서 진행
+# ✅ 응답은 .cache/kakao 에 TTL 동안 캐시 (--replay 면 캐시만 사용, API 호출 0회)
+# ✅ KAKAO_REST_API_KEYS 에 키를 여러 개 넣으면 키 풀(keypool.py)이 돌려가며 사용, 429 / 한도 초과 시 자동 전환
+# ✅ 셀마다 지문(total_count + kakao_id 해시)을 cell_fingerprints.json 에 남김
+#    → --refresh 면 1페이지만 보고 지문이 같은 셀은 나머지 페이지 / DB 저장 생략 (fingerprint.py)
+# ✅ 셀에서 받은 카페는 구 경계(point-in-polygon, 경계가 없으면 주소의 구 이름)로 소속 구를 정해서 전부 저장
+#    (다른 구 카페도 버리지 않음)
+#    → 한 번 저장한 셀은 이웃 구를 크롤링할 때 다시 요청하지 않음
+# ✅ 셀 검색이 끝나는 대로 크기 제한 큐에 넣고 writer 스레드가 batch 로 DB 저장 (pipeline.py)
+#    → 수집과 저장이 동시에 진행되고, DB 가 밀리면 새 셀 요청이 멈춰서 메모리가 구 크기와 상관없이 일정
+# ------------------------------------------------------------
+import argparse
+import asyncio
+import math
+import os
+import time
+from collections import Counter, deque
+
+import aiohttp
+from dotenv import load_dotenv
+
+from crawler.dedup import SeenSet
+from crawler.fingerprint import FINGERPRINT_PATH, CellFingerprints, cell_key
+from crawler.districts import districts, resolve_district
+from crawler.geo import assign_districts, district_polygon
+from crawler.httpclient import MAX_RETRIES, RETRY_STATUS, async_session, backoff_delay
+from crawler.httpcache import DEFAULT_TTL, ResponseCache
+from crawler.journal import JOURNAL_PATH, CrawlJournal
+from crawler.keypool import KeyPool
+from crawler.pipeline import BatchWriter
+from crawler.ratelimit import TokenBucket
+
+load_dotenv(".env.local")
+
+CATEGORY_URL = "https://dapi.kakao.com/v2/local/search/category.json"
+CATEGORY_CODE = "CE7"  # 카페
+
+MAX_PAGE = 45       # API 최대 페이지
+PAGE_SIZE = 15      # 페이지당 최대 문서 수
+MAX_RESULTS = MAX_PAGE * PAGE_SIZE  # 한 번의 검색으로 받을 수 있는 최대 문서 수 (675)
+MAX_RADIUS = 20000  # API 최대 반경 (m)
+
+ROOT_STEP = 0.02    # 루트 셀 크기 (0.02도 ≈ 약 2km)
+MAX_DEPTH = 6       # 최대 분할 깊이 (0.02 / 2^6 ≈ 약 30m)
+SEOUL_ORIGIN = (126.76, 37.41)  # 서울 전체 공통 격자 원점 → 구끼리 겹치는 루트 셀이 같은 키를 가짐
+PROBE_BUFFER = 50   # 경계 판정 여유 (m) - 좌표/경계 오차로 경계 바로 옆 카페를 놓치지 않도록
+
+SEARCH_MODES = ("rect", "circle")
+SEARCH_MODE = os.getenv("KAKAO_SEARCH_MODE", "rect")  # 셀 검색 방식 (rect : 겹치지 않는 사각형 / circle : 셀을 덮는 원)
+
+CONCURRENCY = int(os.getenv("KAKAO_CONCURRENCY", "8"))   # 동시에 보내는 최대 요청 수 (셀 + 페이지)
+CELL_WINDOW = 2     # 동시에 검색 중인 셀 수 상한 = CONCURRENCY x 이 값 (결과를 들고 있는 셀 수도 이만큼으로 제한)
+RATE = float(os.getenv("KAKAO_RPS", "10"))               # 초당 최대 요청 수
+REQUEST_TIMEOUT = 5
+KEY_ERROR_STATUS = (401, 403, 429)  # 키 문제 (인증 실패 / 권한 / 한도 초과) → 다른 키로 전환
+
+# 실행 통계 (API 호출 수가 카페 밀도를 따라가는지 확인용)
+# - requests_saved : meta.is_end / pageable_count 로 마지막 페이지를 알아서 생략한 "빈 페이지 확인용" 요청 수
+# - cells_resumed / pages_resumed : 저널 덕분에 다시 요청하지 않은 셀 / 페이지 수
+# - cells_unchanged / cells_changed : refresh 에서 지문이 같아 1페이지로 끝난 셀 / 지문이 바뀐 셀
+# - cells_covered : 다른 구를 크롤링하면서 이미 받아서 저장한 셀이라 건너뛴 수
+# - cells_unsaved : DB 저장에 실패한 셀 수 (저널에 남겨 두고 다음 실행에서 다시 처리)
+stats = {"requests": 0, "requests_saved": 0, "cells": 0, "cells_reused": 0, "cells_masked": 0, "splits": 0,
+         "saturated_leaves": 0, "failed_pages": 0, "cells_resumed": 0, "pages_resumed": 0, "cache_hits": 0,
+         "cells_unchanged": 0, "cells_changed": 0, "cells_covered": 0, "cells_unsaved": 0}
+
+# 프로세스 전체에서 공유하는 자원
+limiter = TokenBucket(RATE)         # 모든 요청이 같은 bucket 에서 토큰을 꺼내 씀
+cache = ResponseCache()             # 디스크 응답 캐시 (None 이면 사용 안 함)
+keys = None                         # 카카오 API 키 풀 (키별 일일 사용량 장부 포함) - 처음 요청할 때 key_pool() 이 생성
+seen = SeenSet()                    # 이번 실행에서 이미 저장한 kakao_id + 구별 중복 비율
+fingerprints = CellFingerprints()   # 셀별 지문 (refresh=True 면 안 바뀐 셀 건너뜀)
+cell_cache = {}                     # 이번 실행에서 이미 검색한 셀 → 결과 (겹치는 구끼리 재사용)
+covered = {}                        # 저장까지 끝난 셀 키 → 저장한 구 (crawl_all 에서는 프로세스 간 공유 dict)
+
+
+def key_pool():
+    """공유 키 풀. import 만으로 장부(kakao_key_ledger.json)를 건드리지 않도록 실제로 요청할 때 처음 만듦"""
+    global keys
+    if keys is None:
+        keys = KeyPool.from_env()
+    return keys
+
+
+def cell_bounds(origin, cell, root_step=ROOT_STEP):
+    """셀 키 (i, j, path) → (x0, y0, x1, y1). path 의 각 자리는 사분면 번호(0~3)"""
+    xmin, ymin = origin
+    i, j, path = cell
+    size = root_step
+    x0 = xmin + i * root_step
+    y0 = ymin + j * root_step
+    for q in path:
+        size /= 2
+        q = int(q)
+        x0 += size * (q % 2)
+        y0 += size * (q // 2)
+    return x0, y0, x0 + size, y0 + size
+
+
+def split_cell(cell):
+    """셀을 4개의 사분면 셀로 분할"""
+    i, j, path = cell
+    return [(i, j, path + str(q)) for q in range(4)]
+
+
+def cell_circle(bounds):
+    """셀을 완전히 덮는 검색 원 (중심 x, 중심 y, 반경 m) - 반경은 셀 대각선의 절반"""
+    x0, y0, x1, y1 = bounds
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    dx = (x1 - x0) * 111320 * math.cos(math.radians(cy))  # 경도 1도 ≈ 111.32km x cos(위도)
+    dy = (y1 - y0) * 110540                               # 위도 1도 ≈ 110.54km
+    radius = math.ceil(math.hypot(dx, dy) / 2)
+    return cx, cy, min(radius, MAX_RADIUS)
+
+
+def cell_rect(bounds):
+    """셀 사각형 → rect 파라미터 ("왼쪽 x,아래 y,오른쪽 x,위 y")"""
+    return ",".join(f"{v:.7f}" for v in bounds)
+
+
+def is_saturated(meta):
+    """첫 페이지 meta 로 이 셀이 45페이지 상한에 걸리는지 판단"""
+    total = meta.get("total_count", 0)
+    pageable = meta.get("pageable_count", total)
+    return total > min(pageable, MAX_RESULTS)
+
+
+def root_cells(xmin, xmax, ymin, ymax, origin, root_step=ROOT_STEP):
+    """bounding box 를 덮는 루트 셀 목록 (origin 기준 정수 격자)"""
+    ox, oy = origin
+    i0 = math.floor(round((xmin - ox) / root_step, 9))
+    i1 = max(i0 + 1, math.ceil(round((xmax - ox) / root_step, 9)))
+    j0 = math.floor(round((ymin - oy) / root_step, 9))
+    j1 = max(j0 + 1, math.ceil(round((ymax - oy) / root_step, 9)))
+    return [(i, j, "") for i in range(i0, i1) for j in range(j0, j1)]
+
+
+def mask_cells(cells, origin, polygon, root_step=ROOT_STEP, buffer=PROBE_BUFFER):
+    """검색 원이 polygon(+buffer) 과 겹치는 셀만 남김 - 셀 전체를 한 번에 판정"""
+    if polygon is None or not cells:
+        return cells
+    circles = [cell_circle(cell_bounds(origin, cell, root_step)) for cell in cells]
+    xs, ys, radii = zip(*circles)
+    keep = polygon.intersects_circles(xs, ys, [r + buffer for r in radii])
+    stats["cells_masked"] += len(cells) - int(keep.sum())
+    return [cell for cell, k in zip(cells, keep) if k]
+
+
+def last_page_of(meta):
+    """첫 페이지 meta → 받아야 하는 마지막 페이지 번호 (is_end 면 1페이지로 끝)"""
+    if meta.get("is_end"):
+        return 1
+    pageable = min(meta.get("pageable_count", 0), MAX_RESULTS)
+    return min(MAX_PAGE, max(1, math.ceil(pageable / PAGE_SIZE)))
+
+
+async def error_body(res):
+    """오류 응답 본문 (카카오는 {"code": ..., "msg"/"message": ...} 형태), 파싱 실패 시 빈 dict"""
+    try:
+        body = await res.json(content_type=None)
+    except ValueError:
+        return {}
+    if isinstance(body, dict):
+        body.setdefault("message", body.get("msg", ""))
+        return body
+    return {}
+
+
+def print_stats():
+    print(f"📊 셀 {stats['cells']}개 (재사용 {stats['cells_reused']}개, 경계 밖 제외 {stats['cells_masked']}개)"
+          f" / 분할 {stats['splits']}회"
+          f" / API 호출 {stats['requests']}회 (빈 페이지 요청 절약 {stats['requests_saved']}회)"
+          f" / 실패 페이지 {stats['failed_pages']}개"
+          f" / 저널에서 이어받은 셀 {stats['cells_resumed']}개, 페이지 {stats['pages_resumed']}개"
+          f" / 다른 구에서 저장한 셀 {stats['cells_covered']}개"
+          f" / 캐시 적중 {stats['cache_hits']}회")
+    if fingerprints.refresh:
+        print(f"🔁 refresh : 변경 없는 셀 {stats['cells_unchanged']}개 (1페이지만 요청), 바뀐 셀 {stats['cells_changed']}개")
+
+
+class AsyncGridCrawler:
+    """
+    aiohttp 세션 하나 + 동시 요청 수 제한(semaphore) + 공유 token bucket 으로 카테고리 검색을 수행.
+        async with AsyncGridCrawler(concurrency=8) as crawler:
+            results = await crawler.crawl_bbox(...)
+    journal(CrawlJournal) 을 주면 받은 페이지 / 분할 여부를 기록하고, 이미 기록된 작업은 다시 요청하지 않음
+    mode="rect" 면 셀을 사각형(rect)으로, "circle" 이면 셀을 덮는 원(x/y/radius)으로 검색
+    """
+
+    def __init__(self, concurrency=CONCURRENCY, journal=None, mode=None):
+        mode = mode or SEARCH_MODE
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"알 수 없는 검색 방식: {mode} ({', '.join(SEARCH_MODES)} 중 하나)")
+        self.concurrency = concurrency
+        self.journal = journal
+        self.mode = mode
+        self.http = None
+        self.sem = None
+
+    async def __aenter__(self):
+        self.http = async_session(concurrency=self.concurrency, timeout=REQUEST_TIMEOUT)
+        self.sem = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc):
+        if self.http is not None:
+            await self.http.close()
+
+    def _session(self):
+        """(aiohttp 세션, semaphore) - async with 밖에서 호출하면 RuntimeError"""
+        if self.http is None or self.sem is None:
+            raise RuntimeError("AsyncGridCrawler 는 async with 안에서 사용해야 함 (세션이 열려 있지 않음)")
+        return self.http, self.sem
+
+    async def fetch_page(self, params, page, max_retries=MAX_RETRIES):
+        """카테고리 검색 한 페이지 요청 → (documents, meta). 재시도 초과 시 (None, None)"""
+        query = {k: str(v) for k, v in dict(params, page=page, size=PAGE_SIZE).items()}
+        if cache is not None:
+            body = cache.get(CATEGORY_URL, query)
+            if body is not None:
+                stats["cache_hits"] += 1
+                return body.get("documents", []), body.get("meta", {})
+            if cache.replay:
+                print(f"⚠️ replay 모드 캐시 없음 (page={page}, {params})")
+                stats["failed_pages"] += 1
+                return None, None
+
+        http, sem = self._session()
+        pool = key_pool()
+        attempt = 0
+        while attempt <= max_retries:
+            key = pool.acquire()  # 모든 키가 오늘 한도를 다 쓰면 QuotaExhausted → 크롤링 중단 (저널은 남음)
+            if key is None:
+                await asyncio.sleep(pool.wait_time())  # 모든 키가 429 휴식 중
+                continue
+            try:
+                async with sem:
+                    await limiter.acquire_async()
+                    stats["requests"] += 1
+                    async with http.get(CATEGORY_URL, params=query,
+                                             headers={"Authorization": f"KakaoAK {key}"}) as res:
+                        if res.status in KEY_ERROR_STATUS:
+                            pool.report(key, res.status, await error_body(res))
+                            continue  # 다른 키로 바로 다시 요청 (재시도 횟수 차감 없음)
+                        res.raise_for_status()
+                        body = await res.json()
+                if cache is not None:
+                    cache.put(CATEGORY_URL, query, body)
+                return body.get("documents", []), body.get("meta", {})
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                print(f"⚠️ 네트워크 오류 (page={page}, 재시도 {attempt + 1}/{max_retries}): {e!r}")
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRY_STATUS:
+                    print(f"⚠️ 요청 오류 (page={page}): {e.status} {e.message}")
+                    break
+                print(f"⚠️ {e.status} 응답 (page={page}, 재시도 {attempt + 1}/{max_retries})")
+            except aiohttp.ClientError as e:
+                print(f"⚠️ 기타 요청 오류 (page={page}): {e}")
+                break
+            attempt += 1
+            if attempt <= max_retries:
+                await asyncio.sleep(backoff_delay(attempt))  # 지수 백오프 + jitter (httpclient 와 같은 정책)
+        stats["failed_pages"] += 1
+        return None, None
+
+    async def search_circle(self, x, y, radius, stop_if_saturated=False, key=None, fp_key=None):
+        """원 하나 검색 (x, y 중심 반경 radius m)"""
+        params = {"category_group_code": CATEGORY_CODE, "x": x, "y": y, "radius": radius}
+        return await self.search(params, stop_if_saturated, key, fp_key)
+
+    async def search_rect(self, bounds, stop_if_saturated=False, key=None, fp_key=None):
+        """사각형 하나 검색 (bounds = (x0, y0, x1, y1))"""
+        params = {"category_group_code": CATEGORY_CODE, "rect": cell_rect(bounds)}
+        return await self.search(params, stop_if_saturated, key, fp_key)
+
+    async def search(self, params, stop_if_saturated=False, key=None, fp_key=None):
+        """
+        검색 영역 하나(원 / 사각형) 전체 페이지 수집.
+        첫 페이지 meta.is_end / pageable_count 로 마지막 페이지를 정하고 나머지 페이지는 동시에 요청.
+        → "documents 가 빌 때까지" 한 페이지 더 요청하던 방식의 빈 페이지 호출이 없음
+        stop_if_saturated=True 면 포화(675개 초과)일 때 나머지 페이지는 받지 않고 (None, meta) 반환
+        key=(구, cell) 과 저널이 있으면 받은 페이지를 기록하고, 이미 받은 페이지는 저널에서 꺼냄
+        fp_key 를 주면 끝까지 받은 셀의 지문을 준비하고, refresh 모드에서 1페이지가 지문과 같으면 ([], meta) 반환
+        """
+        journal = self.journal if key is not None else None
+        done = journal.done_pages(*key) if journal is not None and key is not None else {}
+        failed = []
+
+        async def get_page(page):
+            if page in done:
+                stats["pages_resumed"] += 1
+                return done[page]
+            page_docs, page_meta = await self.fetch_page(params, page)
+            if page_docs is None:
+                failed.append(page)
+            elif journal is not None and key is not None:
+                journal.record_page(*key, page, page_docs, page_meta)
+            return page_docs, page_meta
+
+        docs, meta = await get_page(1)
+        if docs is None:
+            return [], None
+        if stop_if_saturated and is_saturated(meta):
+            return None, meta
+        if fp_key and fingerprints.unchanged(fp_key, docs, meta):
+            stats["cells_unchanged"] += 1
+            return [], meta  # 지난번과 같은 셀 → 나머지 페이지도, DB 저장도 필요 없음
+
+        last_page = last_page_of(meta)
+        pages = await asyncio.gather(*(get_page(page) for page in range(2, last_page + 1)))
+
+        results = list(docs)
+        last_meta = meta
+        for page_docs, page_meta in pages:
+            if page_docs:
+                results.extend(page_docs)
+            if page_meta is not None:
+                last_meta = page_meta
+
+        # pageable_count 가 그 사이 늘어난 경우 : is_end 가 나올 때까지 이어서 요청
+        page = last_page
+        while not last_meta.get("is_end", True) and page < MAX_PAGE:
+            page += 1
+            page_docs, page_meta = await get_page(page)
+            if not page_docs:
+                break
+            results.extend(page_docs)
+            last_meta = page_meta
+
+        if page < MAX_PAGE and page not in done:
+            stats["requests_saved"] += 1  # 예전 방식이라면 page+1 을 요청해서 빈 결과를 확인했을 것
+        if fp_key and not failed:  # 빠진 페이지가 있으면 지문을 남기지 않음 (다음 refresh 에서 다시 받음)
+            if fingerprints.stage(fp_key, docs, meta, results) and fingerprints.refresh:
+                stats["cells_changed"] += 1
+        return results, meta
+
+    async def search_cell(self, bounds, force=False, key=None, fp_key=None):
+        """
+        셀 하나 검색.
+        - 포화(675개 초과)면 (None, meta) 반환 → 호출 측에서 분할
+        - force=True 면 포화여도 가능한 만큼(45페이지) 받음 (최대 깊이 셀)
+        """
+        if self.mode == "rect":
+            return await self.search_rect(bounds, stop_if_saturated=not force, key=key, fp_key=fp_key)
+        cx, cy, radius = cell_circle(bounds)
+        return await self.search_circle(cx, cy, radius, stop_if_saturated=not force, key=key, fp_key=fp_key)
+
+    async def _visit(self, cell, origin, root_step, max_depth, district=None):
+        bounds = cell_bounds(origin, cell, root_step)
+        journal = self.journal if district else None
+        if district and cell_key(origin, root_step, cell, self.mode) in covered:
+            stats["cells_covered"] += 1
+            return None  # 이번 실행에서 다른 구가 이미 받아서 소속 구별로 저장한 셀
+        if journal and journal.is_covered(cell):
+            stats["cells_resumed"] += 1
+            return None  # 지난 실행에서 (어느 구에서든) DB 저장까지 끝난 셀
+        if journal and journal.is_split(district, cell):
+            stats["cells_resumed"] += 1
+            return cell, bounds, None, None
+
+        cache_key = (self.mode, origin, root_step, cell)
+        if cache_key in cell_cache:
+            stats["cells_reused"] += 1
+            return cell, bounds, cell_cache[cache_key], None
+
+        at_max_depth = len(cell[2]) >= max_depth
+        cafes, meta = await self.search_cell(bounds, force=at_max_depth, key=(district, cell) if journal else None,
+                                             fp_key=cell_key(origin, root_step, cell, self.mode) if district else None)
+        stats["cells"] += 1
+        if meta is not None:
+            cell_cache[cache_key] = cafes  # 포화 셀은 None 으로 기록 → 재사용 시 바로 분할
+        if journal and cafes is None:
+            journal.record_split(district, cell)
+
+        if at_max_depth and meta and is_saturated(meta):
+            stats["saturated_leaves"] += 1
+            print(f"⚠️ 최대 분할 깊이 도달, 일부 누락 가능: {cell} (total_count={meta.get('total_count')})")
+        return cell, bounds, cafes, meta
+
+    async def crawl_bbox(self, xmin, xmax, ymin, ymax, root_step=ROOT_STEP, max_depth=MAX_DEPTH,
+                         origin=None, polygon=None, district=None, on_cell=None):
+        """
+        bounding box 전체를 quadtree 로 탐색해서 [(cell, bounds, cafes), ...] 반환 (셀 키 순 정렬).
+        on_cell 을 주면 결과를 모으지 않고 셀이 끝날 때마다 await on_cell(cell, bounds, cafes) 호출 (빈 리스트 반환)
+        → on_cell 이 기다리는 동안은 새 셀을 시작하지 않음 (저장 쪽 backpressure)
+        셀들은 동시에 검색하되 한 번에 concurrency x CELL_WINDOW 개까지만 시작하고, 나머지 셀은 키만 대기열에 둔다
+        → 구가 아무리 커도 요청 중이거나 결과를 들고 있는 셀 수는 일정 (메모리 일정).
+        포화된 셀은 끝나는 즉시 4등분한 하위 셀을 대기열 앞에 넣어서 먼저 검색한다.
+        origin 을 공유하면 이번 실행에서 이미 검색한 셀은 API 호출 없이 cell_cache 에서 꺼낸다.
+        polygon(PreparedPolygon) 을 주면 검색 원이 경계와 겹치지 않는 셀(분할된 하위 셀 포함)은 건너뛴다.
+        district 를 주면 저널에 (구, 셀, 페이지) 단위로 진행 상황을 기록하고, 저장 끝난 셀은 결과에서 빠진다.
+        """
+        origin = origin or (xmin, ymin)
+        roots = root_cells(xmin, xmax, ymin, ymax, origin, root_step)
+        todo = mask_cells(roots, origin, polygon, root_step)
+        print(f"🧭 루트 셀 {len(todo)}개로 탐색 시작 (전체 {len(roots)}개, root_step={root_step})")
+
+        results = []
+        pending = set()
+        waiting = deque(todo)   # 아직 시작하지 않은 셀 (키만 들고 있음)
+        window = max(1, self.concurrency * CELL_WINDOW)
+
+        def schedule():
+            while waiting and len(pending) < window:
+                cell = waiting.popleft()
+                pending.add(asyncio.ensure_future(self._visit(cell, origin, root_step, max_depth, district)))
+
+        schedule()
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.result() is None:
+                        continue
+                    cell, bounds, cafes, meta = task.result()
+                    if cafes is None:
+                        # 포화 → 4등분해서 다시 탐색
+                        if meta is not None:
+                            stats["splits"] += 1
+                            print(f"🔀 셀 {cell} 포화 (total_count={meta.get('total_count')}) → 4분할")
+                        waiting.extendleft(reversed(mask_cells(split_cell(cell), origin, polygon, root_step)))
+                        continue
+                    if on_cell is not None:
+                        await on_cell(cell, bounds, cafes)
+                    else:
+                        results.append((cell, bounds, cafes))
+                schedule()  # 끝난 셀 수만큼만 새로 시작 (on_cell 이 기다리는 동안은 시작하지 않음)
+        finally:
+            # 셀 하나가 실패하거나 중단되면 나머지 셀 작업도 세션이 닫히기 전에 정리 (저널 기록도 여기서 멈춤)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results.sort(key=lambda r: r[0])
+        print_stats()
+        return results
+
+
+def _run(fn, concurrency=CONCURRENCY, journal=None):
+    """동기 코드에서 AsyncGridCrawler 메서드 하나를 실행"""
+    async def runner():
+        async with AsyncGridCrawler(concurrency, journal) as crawler:
+            return await fn(crawler)
+    try:
+        return asyncio.run(runner())
+    finally:
+        if keys is not None:
+            keys.save()  # 이번 실행에서 쓴 키 사용량을 장부에 남김 (요청을 안 했으면 키 풀도 없음)
+
+
+def fetch_page(params, page, max_retries=MAX_RETRIES):
+    """(동기 wrapper) 카테고리 검색 한 페이지 → (documents, meta)"""
+    return _run(lambda c: c.fetch_page(params, page, max_retries))
+
+
+def search_cafes(x, y, radius=1000):
+    """(동기 wrapper) 좌표 x, y 반경 radius(m) 안의 카페 전체 (최대 45페이지)"""
+    cafes, _ = _run(lambda c: c.search_circle(x, y, radius))
+    return cafes
+
+
+def search_cafes_in_rect(x0, y0, x1, y1):
+    """(동기 wrapper) 사각형 (x0, y0) ~ (x1, y1) 안의 카페 전체 (최대 45페이지)"""
+    cafes, _ = _run(lambda c: c.search_rect((x0, y0, x1, y1)))
+    return cafes
+
+
+def search_cell(bounds, force=False):
+    """(동기 wrapper) 셀 하나 검색 → (docs 또는 포화 시 None, meta)"""
+    return _run(lambda c: c.search_cell(bounds, force))
+
+
+def crawl_bbox(xmin, xmax, ymin, ymax, root_step=ROOT_STEP, max_depth=MAX_DEPTH, origin=None, polygon=None):
+    """(동기 wrapper) bounding box 전체를 quadtree 로 탐색한 뒤 [(cell, bounds, cafes), ...] 반환 (셀 키 순 정렬)
+    탐색이 다 끝나야 돌려줌 → 셀마다 바로 처리하려면 AsyncGridCrawler.crawl_bbox(on_cell=...) 사용"""
+    return _run(lambda c: c.crawl_bbox(xmin, xmax, ymin, ymax, root_step, max_depth, origin, polygon))
+
+
+def to_row(c, address):
+    """카카오 검색 결과 문서 → cafes 테이블 row"""
+    return {
+        "kakao_id": c.get("id"),
+        "name": c.get("place_name"),
+        "address": address,
+        "latitude": float(c.get("y")),
+        "longitude": float(c.get("x")),
+        "phone": c.get("phone"),
+        "open_hours": None,
+        "avg_rating": None,
+        "kakao_url": c.get("place_url"),
+        "source": "KAKAO"
+    }
+
+
+def cell_rows(name, cafes):
+    """셀 결과 → [(cafes row, 소속 구), ...]. 좌표로 소속 구를 정해서 전부 남기고, 서울 밖 카페만 버림"""
+    addresses = [c.get("road_address_name") or c.get("address_name") for c in cafes]
+    owners = assign_districts([float(c.get("x")) for c in cafes], [float(c.get("y")) for c in cafes], addresses)
+    rows = []
+    for c, address, owner in zip(cafes, addresses, owners):
+        seen.observe(name, c.get("id"))
+        if address and owner is not None:
+            rows.append((to_row(c, address), owner))
+    return rows
+
+
+def mark_saved(crawler, name, cell):
+    """셀 저장 완료 처리 : 지문 확정, 이웃 구가 건너뛰도록 기록, 메모리 정리, 저널 기록"""
+    key = cell_key(SEOUL_ORIGIN, ROOT_STEP, cell, crawler.mode)
+    fingerprints.commit(key)
+    covered[key] = name       # 이 셀의 카페는 소속 구와 상관없이 전부 저장됨 → 이웃 구는 건너뜀
+    cell_cache.pop((crawler.mode, SEOUL_ORIGIN, ROOT_STEP, cell), None)  # 저장 끝난 셀 결과는 메모리에 둘 필요 없음
+    if crawler.journal:
+        crawler.journal.record_saved(name, cell)
+
+
+def save_cells(batch):
+    """
+    writer 스레드 : [(crawler, 구, cell, cafes, 구별 저장 수 Counter), ...] 저장.
+    batch 안의 모든 셀 row 를 모아서 insert_cafes_many 로 한 번에 upsert (셀마다 / 카페마다 트랜잭션 X)
+    저장에 실패하면 batch 의 셀 전부 저장 완료로 기록하지 않고 예외를 그대로 올림
+    → BatchWriter.failed 에 잡혀서 crawl_districts 가 저널을 지우지 않음 → 다음 실행에서 그 셀부터 다시 처리
+    """
+    prepared = []
+    for crawler, name, cell, cafes, saved in batch:
+        print(f"\n=== {name} 셀 {cell} → {len(cafes)}개 ===")
+        prepared.append((crawler, name, cell, cell_rows(name, cafes), saved))
+
+    fresh = set()
+    for name in dict.fromkeys(p[1] for p in prepared):  # 보통 batch 하나는 한 구의 셀들
+        rows = [row for _, n, _, pairs, _ in prepared if n == name for row, _ in pairs]
+        try:
+            fresh.update(row["kakao_id"] for row in seen.insert_many(rows, name))  # 이미 저장한 카페는 DB 호출 생략
+        except Exception as e:
+            print(f"❌ DB 저장 오류 (셀 {len(prepared)}개, {len(rows)}건): {e}")
+            raise
+
+    for crawler, name, cell, rows, saved in prepared:
+        for data, owner in rows:
+            if data["kakao_id"] in fresh:
+                fresh.discard(data["kakao_id"])
+                saved[owner] += 1
+                print(f"[{data['name']}] {data['address']} ({data['latitude']}, {data['longitude']})")
+        mark_saved(crawler, name, cell)
+
+
+async def crawl_district_async(crawler, name):
+    """
+    구 하나 크롤링 + DB 저장. 저장한 카페 수 반환 (이웃 구 소속 카페 포함)
+    검색이 끝난 셀은 바로 writer 큐로 넘기고 다음 셀을 계속 검색 → 구 전체 결과를 메모리에 모으지 않음
+    """
+    polygon = district_polygon(name)
+    if polygon is not None:
+        xmin, ymin, xmax, ymax = polygon.bbox  # 실제 경계의 bbox 로 탐색
+    else:
+        print(f"⚠️ {name} 경계 정보 없음 (generate_geojson.py 실행 필요) → 대략 범위(bbox) 전체 탐색")
+        xmin, xmax, ymin, ymax = districts[name]["bbox"]
+    print(f"\n📍 {name} 전체 크롤링 시작 (quadtree 분할 탐색)")
+
+    saved = Counter()  # 소속 구 → 저장한 카페 수 (writer 스레드가 채움)
+    writer = BatchWriter(save_cells, name=f"writer-{districts[name]['slug']}")
+
+    async def on_cell(cell, bounds, cafes):
+        await writer.put((crawler, name, cell, cafes, saved))
+
+    try:
+        await crawler.crawl_bbox(xmin, xmax, ymin, ymax, origin=SEOUL_ORIGIN, polygon=polygon, district=name,
+                                 on_cell=on_cell)
+        await writer.drain()
+    finally:
+        writer.close()  # 중단돼도 이미 받은 셀은 저장하고 끝냄
+        stats["cells_unsaved"] += writer.failed
+
+    others = ", ".join(f"{gu} {n}개" for gu, n in saved.most_common() if gu != name)
+    print(f"\n✅ {name} 카페 수집 완료 & DB 저장 완료 ({saved[name]}개" + (f", 이웃 구 {others}" if others else "") + ")")
+    print(f"💾 저장 batch {writer.batches}회 (셀 {writer.items}개), DB 가 밀려서 수집이 멈춘 시간 {writer.blocked:.1f}초")
+    seen.report(name)
+    return sum(saved.values())
+
+
+def crawl_district(name, concurrency=CONCURRENCY, journal_path=JOURNAL_PATH):
+    """(동기 wrapper) 구 하나 크롤링 + DB 저장"""
+    return crawl_districts([name], concurrency, journal_path)
+
+
+def crawl_districts(names=None, concurrency=CONCURRENCY, journal_path=JOURNAL_PATH, save_fingerprints=True):
+    """
+    여러 구를 한 프로세스 / 한 HTTP 세션에서 순서대로 크롤링 (names 가 없으면 25개 구 전체)
+    journal_path 에 진행 상황을 남기고, 전부 끝나면 저널을 지움 (중간에 끊기면 남아 있다가 다음 실행에서 이어받음)
+    save_fingerprints=False 면 셀 지문 파일을 쓰지 않음 (crawl_all 워커 : 부모 프로세스가 모아서 저장)
+    """
+    names = [resolve_district(n) for n in (names or districts)]
+    started = time.time()
+    journal = CrawlJournal(journal_path) if journal_path else None
+    unsaved = stats["cells_unsaved"]
+
+    async def runner(crawler):
+        for name in names:
+            await crawl_district_async(crawler, name)
+
+    try:
+        _run(runner, concurrency, journal)
+    except BaseException:
+        if journal:
+            journal.close()
+            print(f"⏸️ 중단됨 → 다시 실행하면 {journal_path} 기준으로 이어서 진행")
+        raise
+    finally:
+        if save_fingerprints:
+            fingerprints.save()  # DB 저장까지 끝난 셀의 지문은 중단돼도 남김
+    unsaved = stats["cells_unsaved"] - unsaved
+    if unsaved:
+        print(f"⚠️ DB 저장 실패 셀 {unsaved}개" + (f" → 저널({journal_path})을 남겨 둠, 다시 실행하면 그 셀부터 이어서 진행"
+                                                 if journal else " (저널 없음 → 다시 크롤링 필요)"))
+        if journal:
+            journal.close()
+    elif journal:
+        journal.clear()
+    print(f"\n🎉 {len(names)}개 구 크롤링 완료 - 총 {len(seen)}개 카페, "
+          f"API 호출 {stats['requests']}회, {time.time() - started:.0f}초")
+    print(f"🔑 키별 오늘 사용량: {key_pool().summary()}")
+
+
+def main(argv=None):
+    global limiter, cache, fingerprints, SEARCH_MODE
+    parser = argparse.ArgumentParser(description="카카오 카테고리 검색으로 서울시 구별 카페 수집")
+    parser.add_argument("districts", nargs="*", help="크롤링할 구 이름 또는 slug (생략 시 25개 구 전체)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="동시 요청 수")
+    parser.add_argument("--mode", choices=SEARCH_MODES, default=SEARCH_MODE,
+                        help="셀 검색 방식 (rect : 겹치지 않는 사각형, circle : 셀을 덮는 원)")
+    parser.add_argument("--rps", type=float, default=RATE, help="초당 최대 요청 수")
+    parser.add_argument("--journal", default=JOURNAL_PATH, help="진행 상황 저널 파일 (빈 문자열이면 기록 안 함)")
+    parser.add_argument("--fresh", action="store_true", help="남아 있는 저널을 무시하고 처음부터 실행")
+    parser.add_argument("--cache-ttl", type=int, default=DEFAULT_TTL, help="응답 캐시 유효 시간(초), 0 이면 캐시 사용 안 함")
+    parser.add_argument("--replay", action="store_true", help="API 호출 없이 캐시된 응답만으로 실행")
+    parser.add_argument("--refresh", action="store_true",
+                        help="갱신 실행: 1페이지가 지난번 지문과 같은 셀은 나머지 페이지를 요청하지 않음")
+    parser.add_argument("--fingerprints", default=FINGERPRINT_PATH, help="셀 지문 파일")
+    args = parser.parse_args(argv)
+    limiter = TokenBucket(args.rps)
+    SEARCH_MODE = args.mode
+    fingerprints = CellFingerprints(args.fingerprints, refresh=args.refresh)
+    if args.replay:
+        cache = ResponseCache(replay=True)
+    elif args.cache_ttl <= 0:
+        cache = None
+    else:
+        cache = ResponseCache(ttl=args.cache_ttl)
+    if args.fresh and args.journal and os.path.exists(args.journal):
+        os.remove(args.journal)
+    crawl_districts(args.districts, args.concurrency, args.journal)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# API 응답 디스크 캐시 (TTL + 오프라인 replay)
+# ------------------------------------------------------------
+# ✅ 키 = sha256(URL + 정렬된 쿼리 파라미터) → 같은 요청이면 같은 파일 (인증 헤더는 키에 넣지 않음)
+# ✅ 본문은 gzip 으로 압축한 JSON 으로 저장 : <캐시 폴더>/ab/abcdef....json.gz
+# ✅ ttl 초보다 오래된 파일은 무시하고 다시 요청
+# ✅ replay=True 면 캐시에 있는 것만 사용하고 API 는 절대 호출하지 않음 (TTL 무시)
+#    → 파서 / DB 저장 로직을 바꿨을 때 API 호출 없이 서울 전체 규모로 다시 돌려볼 수 있음
+# ------------------------------------------------------------
+import gzip
+import hashlib
+import json
+import os
+import time
+from urllib.parse import urlencode
+
+CACHE_DIR = os.getenv("KAKAO_CACHE_DIR", ".cache/kakao")
+DEFAULT_TTL = int(os.getenv("KAKAO_CACHE_TTL", str(24 * 3600)))  # 기본 하루
+
+
+class ResponseCache:
+    def __init__(self, directory=CACHE_DIR, ttl=DEFAULT_TTL, replay=False):
+        self.directory = directory
+        self.ttl = ttl
+        self.replay = replay
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(url, params):
+        query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return hashlib.sha256(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json.gz")
+
+    def get(self, url, params):
+        """캐시된 응답 본문(dict) 또는 None"""
+        path = self._path(self.key(url, params))
+        try:
+            if not self.replay and time.time() - os.path.getmtime(path) > self.ttl:
+                self.misses += 1
+                return None
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                body = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return body
+
+    def put(self, url, params, body):
+        path = self._path(self.key(url, params))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(body, f, ensure_ascii=False)
+        os.replace(tmp, path)  # 쓰는 도중 끊겨도 깨진 캐시 파일이 남지 않도록
@@ -0,0 +1,84 @@
+# 모든 크롤러 모듈이 같이 쓰는 HTTP 클라이언트
+# ------------------------------------------------------------
+# ✅ requests.Session 하나를 공유 → 호스트별 연결 풀 + keep-alive (매 요청마다 TCP/TLS 연결 새로 안 맺음)
+# ✅ gzip 응답 압축, 기본 timeout (연결 5초 / 읽기 30초)
+# ✅ 재시도 정책 통일 : 연결 오류 + 429/5xx 는 지수 백오프 + jitter 로 최대 MAX_RETRIES 번 재시도
+#    (POST 는 중복 실행 방지를 위해 연결 자체가 안 된 경우만 재시도)
+# ✅ asyncio 용 aiohttp 세션도 같은 정책(timeout / 풀 크기 / 헤더)으로 생성
+#    ※ 파일 이름을 http.py 로 하면 src/crawler 에서 스크립트를 직접 실행할 때 표준 라이브러리 http 를 가려서 httpclient.py
+# ------------------------------------------------------------
+import random
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+DEFAULT_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+MAX_RETRIES = 3
+RETRY_STATUS = (429, 500, 502, 503, 504)
+BACKOFF_BASE = 0.5   # 첫 재시도 대기 상한 (초) → 0.5, 1, 2, 4 ... 배로 증가
+BACKOFF_CAP = 30     # 대기 상한 (초)
+POOL_SIZE = 32       # 호스트별 연결 풀 크기
+DEFAULT_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """attempt 번째 재시도 전 대기 시간 (full jitter : 0 ~ base*2^attempt 사이 랜덤)"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class JitterRetry(Retry):
+    """urllib3 Retry 의 지수 백오프에 full jitter 적용 (여러 워커가 동시에 재시도하며 몰리는 것 방지)"""
+
+    def get_backoff_time(self):
+        backoff = min(BACKOFF_CAP, super().get_backoff_time())
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
+
+class _TimeoutSession(requests.Session):
+    """timeout 을 지정하지 않은 요청에도 기본 timeout 적용"""
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+
+def make_session(pool_size=POOL_SIZE, retries=MAX_RETRIES):
+    retry = JitterRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=BACKOFF_BASE,
+        status_forcelist=RETRY_STATUS,
+        raise_on_status=False,  # 재시도 후에도 실패하면 마지막 응답을 그대로 돌려줌 (status_code 로 판단)
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    s = _TimeoutSession()
+    s.headers.update(DEFAULT_HEADERS)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+session = make_session()
+
+
+def get(url, **kwargs):
+    return session.get(url, **kwargs)
+
+
+def post(url, **kwargs):
+    return session.post(url, **kwargs)
+
+
+def async_session(headers=None, concurrency=POOL_SIZE, timeout=READ_TIMEOUT):
+    """같은 정책의 aiohttp 세션 (async with 로 사용). aiohttp 는 asyncio 경로에서만 필요해서 여기서 import"""
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency, keepalive_timeout=60)
+    client_timeout = aiohttp.ClientTimeout(total=timeout, connect=CONNECT_TIMEOUT)
+    return aiohttp.ClientSession(headers=dict(DEFAULT_HEADERS, **(headers or {})),
+                                 connector=connector, timeout=client_timeout)
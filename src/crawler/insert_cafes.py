@@ -1,38 +1,83 @@
 # DB 연결, insert/select 함수
-# - create_engine : SQLAlchemy에서 DB 연결 객체를 만드는 함수
 # - text : SQL문을 문자열 그대로 작성할 때 사용하는 래퍼(안전하게 파라미터 바인딩 가능)
-from sqlalchemy import create_engine, text
-import os
-from dotenv import load_dotenv
-
-load_dotenv(".env.local")
-
-DB_USER = os.getenv("DB_USER")
-DB_PW = os.getenv("DB_PW")
-DB_URL = os.getenv("DB_URL")
-
-DB_URL = f"mysql+pymysql://{DB_USER}:{DB_PW}@{DB_URL}:3306/cafeOn"  # mysql+pymysql : MySQL을 PyMySQL드라이버로 연결
-engine = create_engine(DB_URL, echo=True, future=True)
-# ㄴecho=True : SQLAlchemy가 실행하는 SQL쿼리를 콘솔에 찍어줌 (디버깅 편함)
-# ㄴfuture=True : 최신 SQLAlchemy API 스타일 사용
-
-def insert_cafe(data):  # data : 딕셔너리 형태로 넘겨줄 예정(예: {"kakao_id: "123", "name": "스타벅스", ...})
-  with engine.begin() as conn:  # => 이 안에서 SQL을 실행하면 자동으로 안전하게 커밋됨
-    # conn(SQL실행할 연결 객체) / engine.begin()(DB트랜잭션을 시작) / with구문(블록이 끝나면 자동으로 commit/rollback 처리)
-    sql = text("""
-               INSERT INTO cafes (kakao_id, name, address, latitude, longitude, phone, open_hours, avg_rating, kakao_url, source)
+# - DB 연결(engine)은 db.py 에서 공유 → 크롤러 writer 스레드 / 보강 스크립트가 같은 연결 풀을 씀
+from functools import lru_cache
+from sqlalchemy import text
+
+from crawler import db
+
+COLUMNS = ["kakao_id", "name", "address", "latitude", "longitude", "phone", "open_hours", "avg_rating", "kakao_url", "source"]
+BATCH_SIZE = 500  # insert_cafes_many 가 INSERT 한 문장에 넣는 최대 row 수
+
+# 컬럼별 소유 정책 : 이미 있는 카페(kakao_id 중복)를 다시 저장할 때 컬럼을 어떻게 갱신할지
+# ㄴ"crawl"  : 크롤러가 주인인 컬럼 → 항상 새 값으로 덮어씀
+# ㄴ"enrich" : 보강 스크립트(get_open_hours.py 등)가 채우는 컬럼 → 새 값이 NULL 이면 기존 값 유지
+#             (크롤러는 open_hours / avg_rating 을 항상 None 으로 보내므로, 재크롤링해도 Selenium 으로 모은 값이 안 지워짐)
+# ㄴ"insert" : 처음 INSERT 때만 쓰고 이후에는 건드리지 않음
+COLUMN_POLICY = {
+  "name": "crawl",
+  "address": "crawl",
+  "latitude": "crawl",
+  "longitude": "crawl",
+  "phone": "crawl",
+  "open_hours": "enrich",
+  "avg_rating": "enrich",
+  "kakao_url": "crawl",
+  "source": "insert",
+}
+
+
+def update_clause(policy=COLUMN_POLICY):
+  # ON DUPLICATE KEY UPDATE 뒤에 올 "컬럼=값" 목록
+  # ㄴVALUES(컬럼) : 중복된 row 에 대해 "이번에 넣으려던 값" 을 가리킴
+  # ㄴCOALESCE(a, b) : a 가 NULL 이면 b → 새 값이 NULL 이면 기존 값 그대로
+  parts = []
+  for col in COLUMNS:
+    rule = policy.get(col, "crawl")
+    if col == "kakao_id" or rule == "insert":
+      continue
+    if rule == "enrich":
+      parts.append(f"{col}=COALESCE(VALUES({col}), {col})")
+    elif rule == "crawl":
+      parts.append(f"{col}=VALUES({col})")
+    else:
+      raise ValueError(f"알 수 없는 컬럼 정책: {col}={rule}")
+  return ",\n".join(parts)
+
+
+UPDATE_CLAUSE = update_clause()
+
+def insert_cafe(data, table="cafes"):  # data : 딕셔너리 형태로 넘겨줄 예정(예: {"kakao_id: "123", "name": "스타벅스", ...})
+  with db.begin() as conn:  # => 이 안에서 SQL을 실행하면 자동으로 안전하게 커밋됨
+    # conn(SQL실행할 연결 객체) / db.begin()(공유 연결 풀에서 연결을 꺼내 DB트랜잭션을 시작) / with구문(블록이 끝나면 자동으로 commit/rollback 처리)
+    sql = text(f"""
+               INSERT INTO {table} (kakao_id, name, address, latitude, longitude, phone, open_hours, avg_rating, kakao_url, source)
                VALUES (:kakao_id, :name, :address, :latitude, :longitude, :phone, :open_hours, :avg_rating, :kakao_url, :source)
                ON DUPLICATE KEY UPDATE
-                name=:name,
-                address=:address,
-                latitude=:latitude,
-                longitude=:longitude,
-                phone=:phone,
-                open_hours=:open_hours,
-                avg_rating=:avg_rating,
-                kakao_url=:kakao_url,
-                source=:source
+               {UPDATE_CLAUSE}
     """)
     # :kakao_id, :name 등은 자리표시자(placeholder) = data 딕셔너리의 key랑 매칭됨
-    # ON DUPLICATE KEY UPDATE: 테이블의 UNIQUE KEY(kakao_id)가 이미 DB에 있으면 새 값으로 갱신 -> 즉, 중복 방지 + 최신화 기능
+    # ON DUPLICATE KEY UPDATE: 테이블의 UNIQUE KEY(kakao_id)가 이미 DB에 있으면 갱신 -> 즉, 중복 방지 + 최신화 기능
+    # ㄴ어떤 컬럼을 덮어쓸지는 COLUMN_POLICY 기준 (보강 컬럼은 NULL 로 덮어쓰지 않음)
     conn.execute(sql, data) # 두번째 인자 data를 넘겨주면, SQL문 안의 :kakao_id, :name 같은 placeholder에 값이 채워짐
+
+
+@lru_cache(maxsize=32)  # 같은 크기의 batch 는 SQL 문을 다시 만들지 않음
+def upsert_sql(n, table="cafes"):
+  # row n개짜리 INSERT ... VALUES (...), (...), ... ON DUPLICATE KEY UPDATE 문
+  # ㄴplaceholder 는 row 번호를 붙여서 구분 (:kakao_id_0, :kakao_id_1, ...)
+  values = ",\n".join("(" + ", ".join(f":{col}_{i}" for col in COLUMNS) + ")" for i in range(n))
+  return text(f"INSERT INTO {table} ({', '.join(COLUMNS)})\nVALUES {values}\nON DUPLICATE KEY UPDATE\n{UPDATE_CLAUSE}")
+
+
+def insert_cafes_many(rows, batch_size=BATCH_SIZE, table="cafes"):
+  # rows : insert_cafe 에 넘기던 딕셔너리 리스트
+  # ㄴbatch_size 개씩 묶어서 INSERT 한 문장 + 트랜잭션 하나로 저장 → DB 왕복이 row 수가 아니라 batch 수만큼
+  # ㄴ같은 kakao_id 가 여러 번 있으면 마지막 값만 남김 (한 문장 안의 중복은 의미 없는 UPDATE 만 늘어남)
+  rows = list({row["kakao_id"]: row for row in rows}.values())
+  for start in range(0, len(rows), batch_size):
+    chunk = rows[start:start + batch_size]
+    params = {f"{col}_{i}": row.get(col) for i, row in enumerate(chunk) for col in COLUMNS}
+    with db.begin() as conn:
+      conn.execute(upsert_sql(len(chunk), table), params)
+  return len(rows)
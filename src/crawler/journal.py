@@ -0,0 +1,98 @@
+# 크롤링 진행 상황 저널 (중단 후 이어서 실행용)
+# ------------------------------------------------------------
+# ✅ START_INDEX 를 손으로 고치는 대신, 끝난 작업을 한 줄씩 append 하는 JSON Lines 파일
+#    {"t": "page",  "d": 구, "c": [i, j, path], "p": 페이지, "docs": [...], "meta": {...}}  페이지 수신 완료
+#    {"t": "split", "d": 구, "c": [i, j, path]}                                           포화 → 4분할
+#    {"t": "saved", "d": 구, "c": [i, j, path]}                                           셀 결과 DB 저장 완료
+# ✅ 셀은 정수 격자 인덱스 + 분할 경로로 기록 → 다음 실행에서도 같은 키
+# ✅ 재실행 시 저장 끝난 셀은 건너뛰고, 중간에 끊긴 셀은 받은 페이지는 저널에서 꺼내고 실패한 페이지부터 다시 요청
+# ------------------------------------------------------------
+import json
+import os
+import threading
+from collections import defaultdict
+
+JOURNAL_PATH = "crawl_journal.jsonl"
+
+
+def _key(district, cell):
+    i, j, path = cell
+    return district, int(i), int(j), str(path)
+
+
+class CrawlJournal:
+    def __init__(self, path=JOURNAL_PATH):
+        self.path = path
+        self.pages = defaultdict(dict)   # (구, i, j, path) → {page: (docs, meta)}
+        self.split = set()
+        self.saved = set()
+        self.covered = set()             # 어느 구에서든 저장까지 끝난 셀 (i, j, path)
+        self._lock = threading.Lock()
+        self._load()
+        self._f = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        count = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue  # 강제 종료로 잘린 마지막 줄
+                key = _key(rec["d"], rec["c"])
+                if rec["t"] == "page":
+                    self.pages[key][rec["p"]] = (rec["docs"], rec["meta"])
+                elif rec["t"] == "split":
+                    self.split.add(key)
+                elif rec["t"] == "saved":
+                    self.saved.add(key)
+                    self.covered.add(key[1:])
+                count += 1
+        for key in self.saved:  # 저장까지 끝난 셀의 페이지 내용은 더 필요 없음
+            self.pages.pop(key, None)
+        print(f"📒 저널 {self.path} 불러옴 ({count}줄, 저장 완료 셀 {len(self.saved)}개, 분할 셀 {len(self.split)}개)")
+
+    def _append(self, rec):
+        line = json.dumps(rec, ensure_ascii=False)
+        with self._lock:
+            self._f.write(line + "\n")
+            self._f.flush()
+
+    def record_page(self, district, cell, page, docs, meta):
+        self._append({"t": "page", "d": district, "c": list(cell), "p": page, "docs": docs, "meta": meta})
+
+    def record_split(self, district, cell):
+        self.split.add(_key(district, cell))
+        self._append({"t": "split", "d": district, "c": list(cell)})
+
+    def record_saved(self, district, cell):
+        key = _key(district, cell)
+        self.saved.add(key)
+        self.covered.add(key[1:])
+        self.pages.pop(key, None)
+        self._append({"t": "saved", "d": district, "c": list(cell)})
+
+    def is_split(self, district, cell):
+        return _key(district, cell) in self.split
+
+    def is_saved(self, district, cell):
+        return _key(district, cell) in self.saved
+
+    def is_covered(self, cell):
+        """다른 구 크롤링에서라도 이미 저장까지 끝난 셀인지 (결과를 소속 구별로 전부 저장하므로 다시 받을 필요 없음)"""
+        return _key("", cell)[1:] in self.covered
+
+    def done_pages(self, district, cell):
+        """이미 받은 페이지 {page: (docs, meta)}"""
+        return self.pages.get(_key(district, cell), {})
+
+    def close(self):
+        self._f.close()
+
+    def clear(self):
+        """전체 작업이 끝나면 저널 삭제 → 다음 실행은 처음부터"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
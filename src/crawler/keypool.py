@@ -0,0 +1,132 @@
+# 카카오 REST API 키 여러 개를 돌려 쓰는 키 풀 + 키별 사용량 장부(ledger)
+# ------------------------------------------------------------
+# ✅ .env.local 의 KAKAO_REST_API_KEYS=키1,키2,... (없으면 기존 KAKAO_REST_API_KEY 하나)
+# ✅ 요청마다 오늘 가장 적게 쓴 키를 골라서 사용 → 처리량이 키 개수만큼 늘어남
+# ✅ 키별 사용량은 kakao_key_ledger.json 에 저장 → 재시작해도 오늘 쓴 양을 기억 (한국 시간 자정에 초기화)
+#    (장부에는 키 원문 대신 sha256 앞 12자리만 기록)
+#    (장부는 사용하는 쪽이 save() 로 저장 : grid._run 이 끝날 때, crawl_all 은 manager 의 키 풀 하나만)
+# ✅ 429 → 그 키만 잠시 쉬게 하고 다른 키로 전환 / 일일 한도 초과 응답 → 오늘은 그 키 제외
+# ------------------------------------------------------------
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+LEDGER_PATH = os.getenv("KAKAO_KEY_LEDGER", "kakao_key_ledger.json")
+DAILY_QUOTA = int(os.getenv("KAKAO_DAILY_QUOTA", "100000"))  # 로컬 API 키당 일일 호출 한도
+COOLDOWN = 60        # 429 받은 키를 쉬게 하는 시간 (초)
+SAVE_EVERY = 50      # 장부를 디스크에 쓰는 주기 (요청 수)
+KST = timezone(timedelta(hours=9))
+
+
+class QuotaExhausted(RuntimeError):
+    """모든 키가 오늘 한도를 다 썼을 때"""
+
+
+def fingerprint(key):
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+
+
+def today():
+    return datetime.now(KST).date().isoformat()
+
+
+def keys_from_env():
+    raw = os.getenv("KAKAO_REST_API_KEYS") or os.getenv("KAKAO_REST_API_KEY") or ""
+    return [k.strip() for k in raw.split(",") if k.strip()]
+
+
+class KeyPool:
+    def __init__(self, keys, daily_quota: int = DAILY_QUOTA, ledger_path=LEDGER_PATH, cooldown: float = COOLDOWN):
+        self.keys = list(dict.fromkeys(keys))
+        self.daily_quota = daily_quota
+        self.ledger_path = ledger_path
+        self.cooldown = cooldown
+        self.cooling = {}          # 키 → 다시 써도 되는 시각 (monotonic)
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        self._load()
+
+    @classmethod
+    def from_env(cls):
+        return cls(keys_from_env())
+
+    def _load(self):
+        self.date = today()
+        self.usage = {}
+        try:
+            with open(self.ledger_path, "r", encoding="utf-8") as f:
+                ledger = json.load(f)
+            if ledger.get("date") == self.date:
+                self.usage = ledger.get("keys", {})
+        except (OSError, ValueError):
+            pass
+        for key in self.keys:
+            self.usage.setdefault(fingerprint(key), {"used": 0, "exhausted": False})
+
+    def _roll_date(self):
+        if today() != self.date:  # 자정이 지나면 한도 초기화
+            self.date = today()
+            self.usage = {fingerprint(k): {"used": 0, "exhausted": False} for k in self.keys}
+
+    def save(self):
+        with self._lock:
+            ledger = {"date": self.date, "keys": self.usage}
+            self._unsaved = 0
+        tmp = f"{self.ledger_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(ledger, f, indent=2)
+        os.replace(tmp, self.ledger_path)
+
+    def _available(self, now):
+        for key in self.keys:
+            u = self.usage[fingerprint(key)]
+            if not u["exhausted"] and u["used"] < self.daily_quota and self.cooling.get(key, 0) <= now:
+                yield key, u
+
+    def acquire(self):
+        """이번 요청에 쓸 키 (사용량 1 증가). 전부 쉬는 중이면 None, 오늘 한도를 모두 썼으면 QuotaExhausted"""
+        if not self.keys:
+            raise QuotaExhausted("KAKAO_REST_API_KEY(S) 가 설정되지 않았습니다.")
+        with self._lock:
+            self._roll_date()
+            now = time.monotonic()
+            candidates = list(self._available(now))
+            if not candidates:
+                if all(u["exhausted"] or u["used"] >= self.daily_quota
+                       for u in (self.usage[fingerprint(k)] for k in self.keys)):
+                    raise QuotaExhausted(f"키 {len(self.keys)}개 모두 오늘({self.date}) 한도 소진")
+                return None
+            key, u = min(candidates, key=lambda c: c[1]["used"])
+            u["used"] += 1
+            self._unsaved += 1
+            save = self._unsaved >= SAVE_EVERY
+        if save:
+            self.save()
+        return key
+
+    def wait_time(self):
+        """쉬는 중인 키 중 가장 먼저 풀리는 키까지 남은 시간 (초)"""
+        now = time.monotonic()
+        waits = [until - now for until in self.cooling.values() if until > now]
+        return max(0.1, min(waits)) if waits else 0.1
+
+    def report(self, key, status, body=None):
+        """키 관련 오류 응답 처리 (429 / 일일 한도 초과 / 인증 실패)"""
+        body = body or {}
+        message = str(body.get("message", ""))
+        with self._lock:
+            u = self.usage[fingerprint(key)]
+            if body.get("code") == -10 or "limit" in message.lower() or status in (401, 403):
+                if not u["exhausted"]:  # 동시에 보낸 요청들이 같은 오류를 받아도 한 번만 출력
+                    print(f"🔑 키 {fingerprint(key)} 제외 (status={status}, {message or body})")
+                u["exhausted"] = True   # 오늘은 이 키 사용 안 함
+            else:
+                self.cooling[key] = time.monotonic() + self.cooldown
+                print(f"🔑 키 {fingerprint(key)} {self.cooldown}초 휴식 (status={status})")
+        self.save()
+
+    def summary(self):
+        return ", ".join(f"{fingerprint(k)}={self.usage[fingerprint(k)]['used']}" for k in self.keys)
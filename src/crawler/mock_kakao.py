@@ -0,0 +1,192 @@
+# 카카오 로컬 API 카테고리 검색(/v2/local/search/category.json) 로컬 대역 서버
+# ------------------------------------------------------------
+# ✅ 실제 API 를 쓰지 않고 크롤러 처리량 / 요청 수를 재기 위한 가짜 서버 (aiohttp)
+# ✅ 구별 bbox(districts.py) 안에 실제와 비슷한 밀도로 가짜 카페를 생성 (seed 고정 → 매번 같은 데이터)
+#    - 구별 카페 수는 대략적인 실제 규모, 구마다 번화가 몇 곳에 몰려 있고 나머지는 고르게 분포
+# ✅ 실제 API 처럼 동작하는 부분
+#    - x / y / radius(최대 20km) 또는 rect 로 영역 지정, page(1~45) / size(1~15), sort=distance
+#    - 45페이지 상한 : pageable_count = min(total_count, 45 x size), 마지막 페이지에서 is_end=true
+#    - Authorization: KakaoAK <키> 없으면 401
+# ✅ 장애 주입 : --latency (평균 응답 지연 ms), --error-rate (일시적 429 비율), --quota (키당 호출 한도 → code -10)
+#    python -m crawler.mock_kakao --port 8765 --latency 30 --error-rate 0.02
+#    → grid.py 의 CATEGORY_URL 을 http://127.0.0.1:8765/v2/local/search/category.json 로 바꿔서 사용 (bench_crawl.py)
+# ------------------------------------------------------------
+import argparse
+import asyncio
+import math
+import random
+import threading
+from collections import Counter
+
+import numpy as np
+from aiohttp import web
+
+from crawler.districts import districts
+
+CATEGORY_PATH = "/v2/local/search/category.json"
+MAX_PAGE = 45
+MAX_SIZE = 15
+MAX_RADIUS = 20000
+SEED = 20240501
+
+# 구별 카페 수 (대략적인 실제 규모, 서울 전체 약 2.5만 개)
+CAFE_COUNTS = {
+    "강남구": 2900, "마포구": 2300, "서초구": 1700, "송파구": 1600, "중구": 1500, "종로구": 1400,
+    "영등포구": 1300, "강서구": 1100, "용산구": 1100, "성동구": 1000, "관악구": 900, "광진구": 900,
+    "강동구": 900, "서대문구": 800, "성북구": 800, "동작구": 700, "구로구": 700, "은평구": 700,
+    "동대문구": 700, "양천구": 700, "노원구": 600, "금천구": 500, "중랑구": 500, "강북구": 450, "도봉구": 400,
+}
+HOTSPOT_SHARE = 0.7   # 번화가(가우시안 클러스터)에 몰린 카페 비율, 나머지는 bbox 안에 고르게
+HOTSPOT_SIGMA = 0.004  # 번화가 퍼짐 정도 (도) ≈ 400m
+
+
+def generate_cafes(seed=SEED, counts=None):
+    """가짜 카페 목록 → (경도 배열, 위도 배열, 문서 리스트)"""
+    rng = random.Random(seed)
+    xs, ys, docs = [], [], []
+    for name, count in (counts or CAFE_COUNTS).items():
+        if name not in districts:
+            continue
+        xmin, xmax, ymin, ymax = districts[name]["bbox"]
+        hotspots = [(rng.uniform(xmin, xmax), rng.uniform(ymin, ymax)) for _ in range(rng.randint(2, 4))]
+        for n in range(count):
+            if rng.random() < HOTSPOT_SHARE:
+                hx, hy = rng.choice(hotspots)
+                x = min(xmax, max(xmin, rng.gauss(hx, HOTSPOT_SIGMA)))
+                y = min(ymax, max(ymin, rng.gauss(hy, HOTSPOT_SIGMA)))
+            else:
+                x, y = rng.uniform(xmin, xmax), rng.uniform(ymin, ymax)
+            kakao_id = str(10000000 + len(docs))
+            xs.append(x)
+            ys.append(y)
+            docs.append({
+                "id": kakao_id,
+                "place_name": f"테스트카페 {districts[name]['slug']} {n + 1}호점",
+                "category_group_code": "CE7",
+                "category_group_name": "카페",
+                "category_name": "음식점 > 카페",
+                "phone": f"02-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+                "address_name": f"서울 {name} 테스트동 {rng.randint(1, 999)}",
+                "road_address_name": f"서울 {name} 테스트로 {rng.randint(1, 300)}",
+                "x": f"{x:.7f}",
+                "y": f"{y:.7f}",
+                "place_url": f"http://place.map.kakao.com/{kakao_id}",
+                "distance": "",
+            })
+    return np.array(xs), np.array(ys), docs
+
+
+class MockKakao:
+    """
+    가짜 카테고리 검색 서버.
+        mock = MockKakao(latency=0.03, error_rate=0.01)
+        url = mock.start_in_thread(port=8765)   # → 카테고리 검색 URL
+    """
+
+    def __init__(self, latency=0.0, error_rate=0.0, quota=None, seed=SEED):
+        self.latency = latency          # 평균 응답 지연 (초), 실제 지연은 0.5 ~ 1.5 배 랜덤
+        self.error_rate = error_rate    # 일시적 429 응답 비율 (0 ~ 1)
+        self.quota = quota              # 키당 최대 호출 수 (None 이면 무제한)
+        self.xs, self.ys, self.docs = generate_cafes(seed)
+        self.requests = Counter()       # 키별 받은 요청 수
+        self.throttled = 0
+        self._rng = random.Random(seed)
+
+    def __len__(self):
+        return len(self.docs)
+
+    def query(self, params):
+        """쿼리 파라미터 → 조건에 맞는 문서 인덱스 배열 (정렬 포함)"""
+        if "rect" in params:
+            x0, y0, x1, y1 = map(float, params["rect"].split(","))
+            mask = (self.xs >= min(x0, x1)) & (self.xs <= max(x0, x1)) & (self.ys >= min(y0, y1)) & (self.ys <= max(y0, y1))
+            idx = np.nonzero(mask)[0]
+            return idx, None
+        cx, cy = float(params["x"]), float(params["y"])
+        radius = min(float(params.get("radius", MAX_RADIUS)), MAX_RADIUS)
+        dx = (self.xs - cx) * 111320 * math.cos(math.radians(cy))
+        dy = (self.ys - cy) * 110540
+        dist = np.hypot(dx, dy)
+        idx = np.nonzero(dist <= radius)[0]
+        if params.get("sort") == "distance":
+            idx = idx[np.argsort(dist[idx], kind="stable")]
+        return idx, dist
+
+    async def handle(self, request):
+        q = request.query
+        auth = request.headers.get("Authorization", "")
+        if not auth.startswith("KakaoAK "):
+            return web.json_response({"errorType": "AccessDeniedError", "message": "cannot find appkey"}, status=401)
+        key = auth[len("KakaoAK "):]
+        self.requests[key] += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency * self._rng.uniform(0.5, 1.5))
+        if self.quota is not None and self.requests[key] > self.quota:
+            return web.json_response({"code": -10, "msg": "API limit has been exceeded."}, status=429)
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.throttled += 1
+            return web.json_response({"errorType": "TooManyRequests", "message": "too many requests"}, status=429)
+
+        try:
+            page = int(q.get("page", 1))
+            size = int(q.get("size", MAX_SIZE))
+            if q.get("category_group_code") != "CE7" or not ("rect" in q or ("x" in q and "y" in q)):
+                raise ValueError
+        except ValueError:
+            return web.json_response({"errorType": "InvalidArgument", "message": "invalid parameter"}, status=400)
+        if not (1 <= page <= MAX_PAGE and 1 <= size <= MAX_SIZE):
+            return web.json_response({"errorType": "InvalidArgument", "message": "page/size out of range"}, status=400)
+
+        idx, dist = self.query(q)
+        total = len(idx)
+        pageable = min(total, MAX_PAGE * size)
+        docs = []
+        for i in idx[:pageable][(page - 1) * size:page * size]:
+            doc = dict(self.docs[i])
+            if dist is not None:
+                doc["distance"] = str(int(dist[i]))
+            docs.append(doc)
+        meta = {"total_count": total, "pageable_count": pageable, "is_end": page * size >= pageable,
+                "same_name": None}
+        return web.json_response({"documents": docs, "meta": meta})
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get(CATEGORY_PATH, self.handle)
+        return app
+
+    def start_in_thread(self, host="127.0.0.1", port=8765):
+        """별도 스레드의 이벤트 루프에서 서버 실행 → 카테고리 검색 URL 반환 (프로세스가 끝나면 같이 종료)"""
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            runner = web.AppRunner(self.app())
+            loop.run_until_complete(runner.setup())
+            loop.run_until_complete(web.TCPSite(runner, host, port).start())
+            started.set()
+            loop.run_forever()
+
+        threading.Thread(target=run, daemon=True).start()
+        if not started.wait(10):
+            raise RuntimeError(f"가짜 카카오 서버 시작 실패 ({host}:{port})")
+        return f"http://{host}:{port}{CATEGORY_PATH}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="카카오 카테고리 검색 가짜 서버 (로컬 부하 테스트용)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0, help="평균 응답 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0, help="일시적 429 응답 비율 (0 ~ 1)")
+    parser.add_argument("--quota", type=int, default=None, help="키당 최대 호출 수 (넘으면 code -10 한도 초과 응답)")
+    args = parser.parse_args(argv)
+    mock = MockKakao(args.latency / 1000, args.error_rate, args.quota)
+    print(f"☕ 가짜 카페 {len(mock)}개 생성 → http://{args.host}:{args.port}{CATEGORY_PATH}")
+    web.run_app(mock.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# 카카오맵 장소 상세 JSON(place.map.kakao.com/main/v/<id>) 로컬 대역 서버
+# ------------------------------------------------------------
+# ✅ 실제 사이트 없이 placeapi.py 를 테스트 / 부하 측정하기 위한 가짜 서버 (aiohttp, mock_kakao.py 와 같은 구조)
+# ✅ 응답은 전부 실제로 기록한 JSON (python -m crawler.placeapi record <id> → fixtures/place/<id>.json) 기반
+#    1) 기록한 id 면 그 파일 그대로 응답
+#    2) mock_kakao.py 의 가짜 카페 id 면 기록한 응답 중 하나(id 로 고정)를 골라 cid / 이름만 바꿔서 응답
+#       → 응답 구조를 여기서 지어내지 않음, 별점 / 사진 / 운영시간(빠진 필드 포함)도 기록한 값 그대로
+#    3) 그 외는 404
+#    기록한 응답이 하나도 없으면 가짜 카페 id 에는 응답할 수 없으므로 시작할 때 오류
+#    (지금 들어 있는 90000001 ~ 90000003 은 손으로 작성한 샘플 → fixtures/place/README.md)
+# ✅ 장애 주입 : --latency (평균 응답 지연 ms), --block-rate (JSON 대신 HTML 차단 페이지 비율 → Selenium 폴백 경로 확인)
+#    python -m crawler.mock_place --port 8775 --latency 40 --block-rate 0.02
+#    → KAKAO_PLACE_URL=http://127.0.0.1:8775/main/v/{place_id} python -m crawler.placeapi
+# ------------------------------------------------------------
+import argparse
+import asyncio
+import copy
+import random
+import threading
+
+from aiohttp import web
+
+from crawler.mock_kakao import SEED, generate_cafes
+from crawler.placeapi import FIXTURE_DIR, load_recording, recorded_ids
+
+PLACE_PATH = "/main/v/{place_id}"
+BLOCK_PAGE = "<html><body>비정상적인 접근이 감지되었습니다.</body></html>"
+
+
+def fake_place(doc, template):
+    """mock_kakao 가짜 카페 문서 + 기록한 응답 → 같은 응답에 cid / 이름만 가짜 카페 것으로 바꾼 JSON"""
+    data = copy.deepcopy(template)
+    info = data.get("basicInfo")
+    if isinstance(info, dict):
+        info["cid"] = int(doc["id"])
+        info["placenamefull"] = doc["place_name"]
+    return data
+
+
+class MockPlace:
+    """
+    가짜 장소 상세 서버.
+        mock = MockPlace(latency=0.04)
+        url = mock.start_in_thread(port=8775)   # → placeapi.PLACE_URL 로 사용할 주소 템플릿
+    """
+
+    def __init__(self, latency=0.0, block_rate=0.0, fixture_dir=FIXTURE_DIR, seed=SEED):
+        self.latency = latency          # 평균 응답 지연 (초), 실제 지연은 0.5 ~ 1.5 배 랜덤
+        self.block_rate = block_rate    # JSON 대신 HTML 차단 페이지를 주는 비율 (0 ~ 1)
+        self.fixture_dir = fixture_dir
+        self.recordings = {place_id: load_recording(place_id, fixture_dir) for place_id in recorded_ids(fixture_dir)}
+        if not self.recordings:
+            raise RuntimeError(f"기록된 장소 응답 없음 ({fixture_dir}) → python -m crawler.placeapi record <장소 id> ... 먼저 실행")
+        self.templates = list(self.recordings.values())
+        _, _, docs = generate_cafes(seed)
+        self.docs = {d["id"]: d for d in docs}
+        self.requests = 0
+        self.blocked = 0
+        self._rng = random.Random(seed)
+
+    def place(self, place_id):
+        if place_id in self.recordings:
+            return self.recordings[place_id]
+        doc = self.docs.get(place_id)
+        if doc is None:
+            return None
+        return fake_place(doc, self.templates[int(place_id) % len(self.templates)])
+
+    async def handle(self, request):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency * self._rng.uniform(0.5, 1.5))
+        if self.block_rate and self._rng.random() < self.block_rate:
+            self.blocked += 1
+            return web.Response(text=BLOCK_PAGE, content_type="text/html")
+        data = self.place(request.match_info["place_id"])
+        if data is None:
+            return web.json_response({"isExist": False}, status=404)
+        return web.json_response(data)
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get(PLACE_PATH, self.handle)
+        return app
+
+    def start_in_thread(self, host="127.0.0.1", port=8775):
+        """별도 스레드의 이벤트 루프에서 서버 실행 → 장소 상세 URL 템플릿 반환 (프로세스가 끝나면 같이 종료)"""
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            runner = web.AppRunner(self.app())
+            loop.run_until_complete(runner.setup())
+            loop.run_until_complete(web.TCPSite(runner, host, port).start())
+            started.set()
+            loop.run_forever()
+
+        threading.Thread(target=run, daemon=True).start()
+        if not started.wait(10):
+            raise RuntimeError(f"가짜 장소 상세 서버 시작 실패 ({host}:{port})")
+        return f"http://{host}:{port}{PLACE_PATH}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="카카오맵 장소 상세 JSON 가짜 서버 (오프라인 테스트용)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8775)
+    parser.add_argument("--latency", type=float, default=0, help="평균 응답 지연 (ms)")
+    parser.add_argument("--block-rate", type=float, default=0, help="HTML 차단 페이지 응답 비율 (0 ~ 1)")
+    args = parser.parse_args(argv)
+    mock = MockPlace(args.latency / 1000, args.block_rate)
+    print(f"☕ 기록한 응답 {len(mock.recordings)}개, 가짜 카페 {len(mock.docs)}개 → http://{args.host}:{args.port}{PLACE_PATH}")
+    web.run_app(mock.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
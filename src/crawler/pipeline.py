@@ -0,0 +1,99 @@
+# API 수집(asyncio) ↔ DB 저장(스레드) 사이의 크기 제한 큐 (producer / consumer)
+# ------------------------------------------------------------
+# ✅ 셀 검색이 끝나는 대로 결과를 큐에 넣고, writer 스레드가 모아서(batch) 저장 → 네트워크 대기와 DB 대기가 겹쳐서 진행
+# ✅ 큐 크기 제한 : DB 가 밀리면 큐가 차고 put 이 기다림 → 새 셀 요청도 멈춤 (backpressure)
+#    → 구가 아무리 커도 메모리에 올라가는 결과는 "큐 크기 + 요청 중인 셀" 만큼
+# ✅ drain() 으로 지금까지 넣은 항목이 전부 저장될 때까지 기다림 (구 하나 끝날 때 / 종료 시)
+# ------------------------------------------------------------
+import asyncio
+import os
+import queue
+import threading
+import time
+
+QUEUE_SIZE = int(os.getenv("CRAWL_QUEUE_SIZE", "64"))   # 큐에 쌓아둘 수 있는 최대 항목 수 (셀 단위)
+BATCH_SIZE = int(os.getenv("CRAWL_BATCH_SIZE", "16"))   # writer 가 한 번에 꺼내서 저장하는 최대 항목 수
+POLL = 0.05          # 큐가 꽉 찼을 때 다시 넣어보는 간격 (초)
+
+_STOP = object()
+
+
+class BatchWriter:
+    """
+    handle(batch) 를 별도 스레드에서 실행하는 writer.
+        writer = BatchWriter(save_batch)
+        await writer.put(item)      # asyncio 쪽 (큐가 꽉 차면 자리가 날 때까지 대기)
+        await writer.drain()        # 넣은 항목이 전부 처리될 때까지 대기
+        writer.close()              # 남은 항목 처리 후 스레드 종료
+    스레드에서 쓸 때는 writer.put_blocking(item) / writer.join()
+    """
+
+    def __init__(self, handle, maxsize=QUEUE_SIZE, batch_size=BATCH_SIZE, name="writer"):
+        self.handle = handle
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize)
+        self.batches = 0
+        self.items = 0
+        self.blocked = 0.0       # 큐가 꽉 차서 producer 가 기다린 시간 합계 (초) - DB 가 병목인지 확인용
+        self.failed = 0          # handle 이 예외를 낸 batch 의 항목 수 (저장 안 됨 → 호출 측에서 완료 처리하면 안 됨)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                self.queue.task_done()
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                self.handle(batch)
+                self.batches += 1
+                self.items += len(batch)
+            except Exception as e:  # 저장 오류로 writer 가 죽으면 producer 가 영원히 기다리게 되므로 기록만 하고 계속
+                self.failed += len(batch)
+                print(f"❌ 저장 batch 처리 오류 ({len(batch)}개): {e!r}")
+            for _ in range(len(batch) + stop):
+                self.queue.task_done()
+            if stop:
+                return
+
+    async def put(self, item):
+        started = None
+        while True:
+            try:
+                self.queue.put_nowait(item)
+                break
+            except queue.Full:
+                started = started or time.monotonic()
+                await asyncio.sleep(POLL)
+        if started:
+            self.blocked += time.monotonic() - started
+
+    def put_blocking(self, item):
+        """스레드 쪽 put (큐가 꽉 차면 자리가 날 때까지 대기)"""
+        started = time.monotonic()
+        self.queue.put(item)
+        self.blocked += time.monotonic() - started
+
+    def join(self):
+        """스레드 쪽 drain : 넣은 항목이 전부 처리될 때까지 대기"""
+        self.queue.join()
+
+    async def drain(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.queue.join)
+
+    def close(self):
+        if self._thread.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join()
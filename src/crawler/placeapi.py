@@ -0,0 +1,239 @@
+# 브라우저 없이 카카오맵 장소 상세 JSON 으로 별점 / 대표 사진 / 운영시간 수집
+# ------------------------------------------------------------
+# ✅ place.map.kakao.com 상세페이지 프론트엔드가 불러오는 JSON (PLACE_URL) 을 직접 요청해서 파싱
+#    → 헤드리스 크롬 렌더링(카페당 수 초) 대신 HTTP 요청 한 번 (수십 ms)
+#    - 별점 : basicInfo.feedback.scoresum / scorecnt
+#    - 대표 사진 : basicInfo.mainphotourl (없으면 photo.photoList 첫 사진)
+#    - 운영시간 : basicInfo.openHour.periodList[].timeList[] 의 (dayOfWeek, timeSE) → 요일별로 펼쳐서 Selenium 경로와 같은 모양으로 저장
+#      (텍스트 정제 정규식을 다시 태우면 "매일" / "월~금" 이 첫 글자 하루로 줄어듦 → extractors.format_weekly_hours 사용)
+# ✅ 공유 HTTP 세션(httpclient.py, keep-alive 연결 풀 + 재시도) 하나로 스레드 CONCURRENCY 개가 동시에 요청, token bucket 으로 속도 제한
+# ✅ JSON 을 못 받은 카페(차단 / 응답 구조 변경 / 오류)만 Selenium(enrich_place.py)으로 다시 처리 (--no-fallback 이면 안 함)
+# ✅ 작업 큐(workqueue.py) + UpdateBuffer 사용 → 여러 개 띄우면 나눠서 처리, 결과는 모아서 저장
+#    python -m crawler.placeapi                        → 전체 카페
+#    python -m crawler.placeapi --fields rating photo  → 원하는 필드만
+#    python -m crawler.placeapi record 26338954 ...    → 실제 응답을 fixtures/place/<id>.json 으로 저장 (fixtures/place/README.md 참고)
+# ✅ 오프라인 테스트 : mock_place.py (기록한 응답으로만 응답하는 로컬 서버), tests/test_placeapi.py (기록한 응답으로 파서 확인)
+# ------------------------------------------------------------
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from crawler import httpclient
+from crawler.extractors import EXTRACTORS, format_weekly_hours
+from crawler.ratelimit import TokenBucket
+from crawler.updatebuffer import UpdateBuffer
+from crawler.workqueue import BATCH_SIZE, WorkQueue
+
+PLACE_URL = os.getenv("KAKAO_PLACE_URL", "https://place.map.kakao.com/main/v/{place_id}")
+PLACE_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Referer": "https://place.map.kakao.com/",
+    "Accept": "application/json",
+}
+CONCURRENCY = int(os.getenv("PLACE_CONCURRENCY", "16"))  # 동시에 보내는 요청 수 (httpclient 연결 풀 크기 이하)
+RATE = float(os.getenv("PLACE_RPS", "8"))                 # 초당 최대 요청 수
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "place")
+
+limiter = TokenBucket(RATE)
+
+
+class PlaceFetchError(Exception):
+    """JSON 을 못 받았거나 예상한 구조가 아님 → Selenium 으로 다시 처리할 카페"""
+
+
+def place_id_from_url(kakao_url):
+    """http://place.map.kakao.com/26338954 → "26338954" """
+    m = re.search(r"(\d+)/?$", kakao_url or "")
+    return m.group(1) if m else None
+
+
+def fetch_place(place_id, session=None):
+    """장소 상세 JSON (dict). 실패하면 PlaceFetchError"""
+    limiter.acquire()
+    try:
+        res = (session or httpclient.session).get(PLACE_URL.format(place_id=place_id), headers=PLACE_HEADERS)
+    except Exception as e:
+        raise PlaceFetchError(f"요청 실패: {e!r}")
+    if res.status_code != 200:
+        raise PlaceFetchError(f"HTTP {res.status_code}")
+    try:
+        data = res.json()
+    except ValueError:
+        raise PlaceFetchError("JSON 아님 (차단 페이지 또는 주소 변경)")
+    if not isinstance(data, dict) or not isinstance(data.get("basicInfo"), dict):
+        raise PlaceFetchError("basicInfo 없음 (응답 구조 변경)")
+    return data
+
+
+def parse_rating(data):
+    feedback = data["basicInfo"].get("feedback") or {}
+    count = feedback.get("scorecnt") or 0
+    if not count:
+        return None
+    return round(feedback.get("scoresum", 0) / count, 1)
+
+
+def parse_photo(data):
+    url = data["basicInfo"].get("mainphotourl")
+    if not url:
+        for group in (data.get("photo") or {}).get("photoList") or []:
+            for photo in group.get("list") or []:
+                url = photo.get("orgurl")
+                if url:
+                    break
+            if url:
+                break
+    return url if url and url.startswith("http") else None
+
+
+def parse_open_hours(data):
+    """영업시간 목록 → "월 10:00 ~ 22:00" 요일별 줄 (Selenium 경로와 같은 모양, 없으면 "정보없음")"""
+    entries = []
+    for period in (data["basicInfo"].get("openHour") or {}).get("periodList") or []:
+        for t in period.get("timeList") or []:
+            if "영업" in (t.get("timeName") or "영업") and t.get("timeSE"):
+                entries.append((t.get("dayOfWeek"), t["timeSE"]))
+    return format_weekly_hours(entries)
+
+
+PARSERS = {"rating": parse_rating, "photo": parse_photo, "hours": parse_open_hours}  # 추출기 이름 → JSON 파서
+
+
+def parse_place(data, fields=None):
+    """장소 상세 JSON → {컬럼: 값} (extractors.run_extractors 와 같은 모양, None 인 값은 제외)"""
+    values = {}
+    for name in fields or PARSERS:
+        value = PARSERS[name](data)
+        if value is not None:
+            values[EXTRACTORS[name][0]] = value
+    return values
+
+
+def enrich_one(row, fields):
+    """(cafe_id, kakao_url, name) → (row, {컬럼: 값} 또는 None, 오류)"""
+    cafe_id, kakao_url, name = row
+    place_id = place_id_from_url(kakao_url)
+    try:
+        if not place_id:
+            raise PlaceFetchError(f"장소 id 없음 ({kakao_url})")
+        return row, parse_place(fetch_place(place_id), fields), None
+    except Exception as e:
+        return row, None, e
+
+
+class SeleniumFallback:
+    """JSON 으로 못 받은 카페만 브라우저로 처리. 드라이버는 처음 필요할 때 띄움 (selenium 도 그때 import)"""
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.driver = None
+        self.used = 0
+
+    def enrich(self, kakao_url):
+        from crawler.enrich_place import enrich_place, new_driver
+
+        if self.driver is None:
+            self.driver = new_driver()
+        self.used += 1
+        return enrich_place(self.driver, kakao_url, self.fields)
+
+    def close(self):
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+
+def enrich_all(fields=None, concurrency=CONCURRENCY, fallback=True):
+    fields = [name for name in PARSERS if name in (fields or PARSERS)]
+    updates = UpdateBuffer()
+    # 작업 큐 task 이름은 enrich_place.py 와 같게 → 둘을 같이 띄워도 같은 카페를 두 번 처리하지 않음
+    cafes = WorkQueue(f"place:{'+'.join(fields)}", "cafe_id, kakao_url, name", "kakao_url IS NOT NULL",
+                      batch_size=max(BATCH_SIZE, concurrency * 4), buffer=updates)
+    total = cafes.remaining()
+    browser = SeleniumFallback(fields) if fallback else None
+    stats = {"json": 0, "fallback": 0, "failed": 0}
+    print(f"📊 {total}개 카페 상세 JSON 수집 시작 ({', '.join(fields)}, 동시 요청 {concurrency}, {limiter.rate:g} req/s)")
+
+    started = time.time()
+    try:
+        with ThreadPoolExecutor(concurrency) as pool:
+            for rows in cafes.batches():
+                for (cafe_id, kakao_url, name), values, error in pool.map(lambda r: enrich_one(r, fields), rows):
+                    if error is not None and browser is not None:
+                        try:
+                            values = browser.enrich(kakao_url)
+                            stats["fallback"] += 1
+                            print(f"🌐 [{name}] ({cafe_id}) JSON 실패({error}) → 브라우저로 수집 {values}")
+                        except Exception as e:
+                            error = e
+                            values = None
+                    elif error is None:
+                        stats["json"] += 1
+                    if values is None:
+                        stats["failed"] += 1
+                        print(f"❌ [{name}] ({cafe_id}) 오류: {error}")
+                        continue
+                    if values:
+                        updates.add(cafe_id, **values)
+                done = sum(stats.values())
+                print(f"✅ {done}/{total} (JSON {stats['json']}, 브라우저 {stats['fallback']}, 실패 {stats['failed']}) "
+                      f"{done / max(time.time() - started, 1e-9):.1f} 카페/s")
+    finally:
+        if browser is not None:
+            browser.close()
+        updates.close()
+    print(f"\n🎉 완료 {time.time() - started:.0f}초 - {stats}")
+    return stats
+
+
+def recorded_ids(fixture_dir=FIXTURE_DIR):
+    """fixtures/place 에 기록된 장소 id 목록 (<id>.json 파일만, id 순)"""
+    try:
+        names = os.listdir(fixture_dir)
+    except OSError:
+        return []
+    return sorted(name[:-5] for name in names if name.endswith(".json") and name[:-5].isdigit())
+
+
+def load_recording(place_id, fixture_dir=FIXTURE_DIR):
+    with open(os.path.join(fixture_dir, f"{place_id}.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def record(place_ids, fixture_dir=FIXTURE_DIR):
+    """실제 응답을 fixture 로 저장 → mock_place.py 가 같은 id 요청에 그대로 응답 (기대값은 페이지와 대조해서 expected.json 에)"""
+    os.makedirs(fixture_dir, exist_ok=True)
+    for place_id in place_ids:
+        try:
+            data = fetch_place(place_id)
+        except PlaceFetchError as e:
+            print(f"❌ {place_id}: {e}")
+            continue
+        with open(os.path.join(fixture_dir, f"{place_id}.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"💾 {place_id} → {parse_place(data)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="카카오맵 장소 상세 JSON 으로 별점 / 사진 / 운영시간 수집 (브라우저 없이)")
+    parser.add_argument("command", nargs="?", choices=["run", "record"], default="run")
+    parser.add_argument("place_ids", nargs="*", help="record 할 장소 id")
+    parser.add_argument("--fields", nargs="+", choices=list(PARSERS), help="수집할 필드 (생략 시 전부)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="동시 요청 수")
+    parser.add_argument("--rps", type=float, default=RATE, help="초당 최대 요청 수")
+    parser.add_argument("--no-fallback", action="store_true", help="JSON 실패한 카페를 브라우저로 다시 처리하지 않음")
+    args = parser.parse_args(argv)
+
+    global limiter
+    limiter = TokenBucket(args.rps)
+    if args.command == "record":
+        record(args.place_ids)
+    else:
+        enrich_all(args.fields, args.concurrency, fallback=not args.no_fallback)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# 요청 속도 제한 (token bucket)
+# ------------------------------------------------------------
+# ✅ 초당 rate 개씩 토큰이 채워지고, 요청 1번에 토큰 1개 사용
+# ✅ 토큰이 모자라면 "다음 토큰이 생기는 시각"을 예약하고 그때까지만 대기 → 고정 sleep 없이 최대 속도 유지
+# ✅ 스레드(acquire) / asyncio(acquire_async) 어느 쪽에서 불러도 같은 bucket 을 공유
+# ✅ SharedTokenBucket : 토큰 상태를 공유 메모리에 둬서 여러 프로세스가 bucket 하나를 같이 씀 (crawl_all.py)
+# ------------------------------------------------------------
+import asyncio
+import multiprocessing
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)                   # 초당 토큰 충전 속도 (= 초당 최대 요청 수)
+        self.capacity = float(capacity or rate)   # 한 번에 몰아서 쓸 수 있는 최대 토큰 수 (burst)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """토큰 1개 예약 → 기다려야 하는 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate  # 음수만큼 채워질 때까지 대기
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    프로세스 간 공유 token bucket. [토큰 수, 마지막 충전 시각] 을 multiprocessing.Array 에 두고 그 lock 으로 보호.
+    프로세스 풀의 initializer 인자로 넘겨서 사용 (time.monotonic 은 같은 머신의 프로세스끼리 공통 시계)
+    """
+
+    def __init__(self, rate, capacity=None):  # threading.Lock 은 다른 프로세스로 넘길 수 없어서 부모 __init__ 안 씀
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self._state = multiprocessing.Array("d", [self.capacity, time.monotonic()])
+
+    def _reserve(self):
+        with self._state.get_lock():
+            now = time.monotonic()
+            tokens = min(self.capacity, self._state[0] + (now - self._state[1]) * self.rate) - 1
+            self._state[0] = tokens
+            self._state[1] = now
+        return 0.0 if tokens >= 0 else -tokens / self.rate
@@ -1,4 +1,5 @@
-import os, json, time, random, pymysql, requests, re
+import os, json, time, random, re
+from crawler import db, httpclient  # 공유 DB 연결 풀 / 공유 HTTP 세션 (keep-alive / 재시도 / timeout)
 from datetime import datetime, timedelta
 from difflib import get_close_matches
 from dotenv import load_dotenv
@@ -9,14 +10,6 @@ from dotenv import load_dotenv
 load_dotenv(".env.local")
 openrouter_key = os.getenv("OPENROUTER_API_KEY")
 
-DB_CONFIG = {
-    "host": os.getenv("DB_URL"),
-    "user": os.getenv("DB_USER"),
-    "password": os.getenv("DB_PW"),
-    "database": "cafeOn",
-    "charset": "utf8mb4"
-}
-
 # ✅ 오로지 이 리스트 안에서만 태그 선택 가능
 CANDIDATE_TAGS = [
     # 분위기 / 무드
@@ -61,11 +54,14 @@ ERROR_LOG = "tag_errors.log"
 # ==============================
 # ② DB 연결
 # ==============================
-def get_conn():
+SUMMARY_CONDITION = "reviews_summary IS NOT NULL"
+
+def count_cafes():
+    """공유 연결 풀(db.py)에서 요약이 있는 카페 수 조회 (DB 가 잠깐 안 되면 10초 후 재시도)"""
     while True:
         try:
-            return pymysql.connect(**DB_CONFIG)
-        except Exception as e:
+            return db.count_cafes(SUMMARY_CONDITION)
+        except db.DB_ERRORS as e:
             print("❌ DB 연결 실패:", e)
             time.sleep(10)
 
@@ -105,7 +101,7 @@ def extract_tags(summary: str):
 
     for attempt in range(3):
         try:
-            res = requests.post(url, headers=headers, json=payload, timeout=80)
+            res = httpclient.post(url, headers=headers, json=payload, timeout=80)
             res.raise_for_status()
             text = res.json()["choices"][0]["message"]["content"].strip()
             text_clean = re.sub(r"[^가-힣,\s]", " ", text)
@@ -123,7 +119,7 @@ def extract_tags(summary: str):
 
     for attempt in range(3):
         try:
-            res = requests.post(url, headers=headers, json=payload, timeout=80)
+            res = httpclient.post(url, headers=headers, json=payload, timeout=80)
             res.raise_for_status()
             text = res.json()["choices"][0]["message"]["content"].strip()
             text_clean = re.sub(r"[^가-힣,\s]", " ", text)
@@ -180,11 +176,8 @@ def save_progress(done_list):
 # ⑥ 메인 루프
 # ==============================
 def main():
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute("SELECT cafe_id, name, reviews_summary FROM cafes WHERE reviews_summary IS NOT NULL")
-    cafes = cur.fetchall()
-    total = len(cafes)
+    total = count_cafes()
+    cafes = db.iter_cafes("cafe_id, name, reviews_summary", SUMMARY_CONDITION)  # cafe_id 순서로 조금씩 가져옴
 
     done = load_progress()["done"]
     start_time = datetime.now()
@@ -209,12 +202,13 @@ def main():
             continue
 
         print("  → 추출된 태그:", tags)
-        insert_cafe_tags(conn, cafe_id, tags)
+        with db.raw_connection() as conn:  # 카페마다 풀에서 연결을 꺼내고 반납 → 오래 돌아도 끊긴 연결을 붙잡고 있지 않음
+            insert_cafe_tags(conn, cafe_id, tags)
         done.append(str(cafe_id))
         save_progress(done)
         time.sleep(random.uniform(0.6, 1.2))
 
-    conn.close()
+    db.dispose()
     print("\n✅ 모든 카페 태그 매핑 완료!")
 
 
@@ -0,0 +1,109 @@
+# 보강 스크립트 결과를 모아서 한 번에 UPDATE (batch flush)
+# ------------------------------------------------------------
+# ✅ 카페 하나 끝날 때마다 UPDATE + commit 하지 않고 메모리에 모았다가
+#    FLUSH_ROWS 개가 모이거나 첫 결과 후 FLUSH_SECONDS 초가 지나면 UPDATE 한 문장으로 저장
+#      UPDATE cafes SET open_hours = CASE cafe_id WHEN 1 THEN '...' WHEN 2 THEN '...' ELSE open_hours END
+#      WHERE cafe_id IN (1, 2)
+#    → DB 왕복 / commit 이 카페 N 개당 한 번 → 페이지 로딩 시간에 비하면 DB 시간은 거의 0
+# ✅ 시간 조건은 타이머 스레드도 확인 → 워커가 느린 페이지에서 멈춰 add 가 한동안 없어도
+#    이미 뽑은 결과는 FLUSH_SECONDS 안에 저장 (작업 큐 lease(ENRICH_LEASE_SECONDS) 가 끝나기 훨씬 전)
+# ✅ 카페마다 채운 컬럼이 달라도 됨 (add(1, photo_url=...), add(2, open_hours=..., kakao_rating=...))
+#    → 컬럼별 CASE 에 ELSE 원래 값 → 그 카페에 없는 컬럼은 그대로
+# ✅ 종료할 때(정상 종료 / 예외 / Ctrl+C) atexit 으로 남은 결과 저장, WorkQueue 는 카페를 done 처리하기 전에 flush
+#    → "저장 안 된 결과인데 작업 큐에서는 끝난 카페" 가 생기지 않음
+# ✅ 저장 실패하면 결과를 버리지 않고 들고 있다가 다음 flush 때 다시 시도
+# ------------------------------------------------------------
+import atexit
+import os
+import threading
+import time
+
+from crawler import db
+
+FLUSH_ROWS = int(os.getenv("ENRICH_FLUSH_ROWS", "50"))          # 이만큼 모이면 저장
+FLUSH_SECONDS = float(os.getenv("ENRICH_FLUSH_SECONDS", "60"))  # 첫 결과 후 이 시간(초)이 지나면 저장
+CHECK_EVERY = 5      # 타이머 스레드가 오래된 결과가 있는지 확인하는 간격 (초)
+
+
+class UpdateBuffer:
+    """
+    cafe_id 별 컬럼 값을 모아서 CASE UPDATE 한 문장으로 저장.
+        buffer = UpdateBuffer()
+        buffer.add(cafe_id, open_hours="...")   # 조건이 되면 알아서 flush
+        buffer.flush()                          # 바로 저장
+    """
+
+    def __init__(self, table="cafes", key="cafe_id", max_rows=FLUSH_ROWS, max_seconds=FLUSH_SECONDS):
+        self.table = table
+        self.key = key
+        self.max_rows = max_rows
+        self.max_seconds = max_seconds
+        self.pending = {}      # cafe_id → {컬럼: 값}
+        self.first_at = None   # 지금 모여 있는 결과 중 가장 오래된 것이 들어온 시각
+        self.flushes = 0
+        self.rows = 0
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._timer = threading.Thread(target=self._flush_loop, name="update-buffer", daemon=True)
+        self._timer.start()
+        atexit.register(self.close)
+
+    def __len__(self):
+        return len(self.pending)
+
+    def _due(self):
+        return self.first_at is not None and time.monotonic() - self.first_at >= self.max_seconds
+
+    def add(self, cafe_id, **values):
+        with self._lock:
+            self.pending.setdefault(cafe_id, {}).update(values)
+            self.first_at = self.first_at or time.monotonic()
+            if len(self.pending) >= self.max_rows or self._due():
+                self.flush()
+
+    def _flush_loop(self):
+        """타이머 스레드 : add 가 없어도 max_seconds 가 지난 결과는 저장 (실패하면 들고 있다가 다음에 다시)"""
+        while not self._stop.wait(max(0.1, min(CHECK_EVERY, self.max_seconds))):
+            with self._lock:
+                if not self._due():
+                    continue
+                try:
+                    self.flush()
+                except Exception as e:
+                    print(f"❌ 결과 {len(self.pending)}건 저장 실패 (다음 flush 때 다시 시도): {e!r}")
+
+    def update_sql(self, rows):
+        """{cafe_id: {컬럼: 값}} → (UPDATE 문, 파라미터)"""
+        columns = sorted({col for values in rows.values() for col in values})
+        sets, params = [], []
+        for col in columns:
+            cases = [(cafe_id, values[col]) for cafe_id, values in rows.items() if col in values]
+            sets.append(f"{col} = CASE {self.key} {' '.join(['WHEN %s THEN %s'] * len(cases))} ELSE {col} END")
+            params += [v for case in cases for v in case]
+        ids = list(rows)
+        sql = f"UPDATE {self.table} SET {', '.join(sets)} WHERE {self.key} IN ({', '.join(['%s'] * len(ids))})"
+        return sql, params + ids
+
+    def flush(self):
+        """모인 결과 저장 → 저장한 카페 수 (실패하면 결과는 그대로 두고 예외)"""
+        with self._lock:
+            if not self.pending:
+                return 0
+            sql, params = self.update_sql(self.pending)
+            db.execute(sql, params)
+            n = len(self.pending)
+            self.pending = {}
+            self.first_at = None
+            self.flushes += 1
+            self.rows += n
+            return n
+
+    def close(self):
+        self._stop.set()
+        try:
+            n = self.flush()
+            if n:
+                print(f"💾 남은 결과 {n}건 저장")
+        except Exception as e:
+            print(f"❌ 남은 결과 {len(self.pending)}건 저장 실패: {e!r}")
+        atexit.unregister(self.close)
@@ -0,0 +1,236 @@
+# 보강 스크립트(get_open_hours / get_image_url / get_kakao_ratings) 여러 개가 cafes 를 나눠서 처리하는 작업 큐
+# ------------------------------------------------------------
+# ✅ 같은 스크립트를 여러 터미널 / 여러 서버에서 그냥 여러 번 실행하면 알아서 카페를 나눠 가짐 (수동 분할 필요 없음)
+# ✅ cafe_leases 테이블에 (작업, cafe_id) 별로 "누가 언제까지 맡았는지 / 끝났는지" 기록 (lease)
+#    - claim : 아직 아무도 안 맡았거나 맡은 기간이 지난 카페를 BATCH_SIZE 개 골라서 LEASE_SECONDS 동안 내 것으로 표시
+#              SELECT ... FOR UPDATE SKIP LOCKED 로 고르기 때문에 동시에 claim 해도 다른 워커가 고르는 중인 카페는 건너뜀
+#    - complete : 처리한 카페는 done=1 → 이번 회차에서는 다시 안 나눠줌
+#    - 워커가 죽으면 lease 가 만료된 뒤 다른 워커가 다시 가져감 (lease 시간은 DB 의 NOW() 기준 → 서버끼리 시계가 달라도 OK)
+#    - Ctrl+C 등으로 끝나면 아직 시작 안 한 카페는 바로 반납
+# ✅ 회차(round) : 기본은 이번 주(ISO 주차) → 같은 주에 띄운 워커끼리 공유, 다음 주에는 처음부터 다시 (주 1회 갱신)
+#    ENRICH_ROUND=... 로 직접 지정 가능
+#    python -m crawler.workqueue status            → 작업별 진행 상황
+#    python -m crawler.workqueue prune             → 지난 회차 기록 삭제
+#    python -m crawler.workqueue reset open_hours  → 이번 회차 처음부터 다시
+# ✅ MySQL 8.0 이상 필요 (SKIP LOCKED)
+# ------------------------------------------------------------
+import argparse
+import datetime
+import os
+import socket
+import time
+
+import pymysql
+
+from crawler import db
+
+LEASE_TABLE = "cafe_leases"
+BATCH_SIZE = int(os.getenv("ENRICH_BATCH_SIZE", "20"))         # 한 번에 맡는 카페 수
+LEASE_SECONDS = int(os.getenv("ENRICH_LEASE_SECONDS", "900"))  # 맡은 카페를 이 시간 안에 못 끝내면 다른 워커가 가져감
+POLL = 30   # 나눠줄 카페는 없는데 다른 워커가 처리 중인 카페가 남아 있을 때 다시 확인하는 간격 (초)
+RETRY_ERRORS = (1205, 1213)   # lock wait timeout / deadlock → claim 을 처음부터 다시
+
+CREATE_SQL = f"""
+CREATE TABLE IF NOT EXISTS {LEASE_TABLE} (
+  task VARCHAR(64) NOT NULL,
+  cafe_id BIGINT NOT NULL,
+  worker VARCHAR(128) NOT NULL,
+  leased_until DATETIME NOT NULL,
+  done TINYINT(1) NOT NULL DEFAULT 0,
+  PRIMARY KEY (task, cafe_id)
+)
+"""
+
+_table_ready = False
+
+
+def current_round():
+    year, week, _ = datetime.date.today().isocalendar()
+    return os.getenv("ENRICH_ROUND") or f"{year}-W{week:02d}"
+
+
+def worker_id():
+    return os.getenv("ENRICH_WORKER_ID") or f"{socket.gethostname()}:{os.getpid()}"
+
+
+def ensure_table():
+    global _table_ready
+    if not _table_ready:
+        db.execute(CREATE_SQL)
+        _table_ready = True
+
+
+def in_clause(ids):
+    return ", ".join(["%s"] * len(ids))
+
+
+class WorkQueue:
+    """
+    여러 워커가 나눠 쓰는 cafes 작업 큐. iter_cafes 대신 그대로 for 문에 넣으면 됨.
+        cafes = WorkQueue("open_hours", "cafe_id, kakao_url, name")
+        for cafe_id, kakao_url, name in cafes: ...
+    columns 의 첫 컬럼은 cafe_id, where / params 는 %s 바인딩 조건 (iter_cafes 와 같음)
+    buffer 를 주면 batch 를 done 처리하기 전에 buffer.flush() → 저장 안 된 카페가 끝난 것으로 표시되지 않음
+    """
+
+    def __init__(self, task, columns="cafe_id, kakao_url, name", where=None, params=(), batch_size=BATCH_SIZE,
+                 lease_seconds=LEASE_SECONDS, wait=True, buffer=None):
+        self.task = f"{task}:{current_round()}"
+        self.columns = columns
+        self.where = where
+        self.params = tuple(params)
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.wait = wait   # True 면 다른 워커가 맡은 카페가 끝나거나 만료될 때까지 기다렸다가 남은 것 처리
+        self.buffer = buffer   # 결과를 모아서 저장하는 UpdateBuffer → done 처리 전에 먼저 flush
+        self.worker = worker_id()
+        self.claimed = 0
+        self.completed = 0
+        ensure_table()
+
+    def claim(self):
+        """아직 안 끝났고 아무도 맡지 않은(또는 lease 가 만료된) 카페를 최대 batch_size 개 맡음 → row 리스트"""
+        condition = f" AND ({self.where})" if self.where else ""
+        select_sql = (f"SELECT {self.columns} FROM cafes WHERE NOT EXISTS ("
+                      f"SELECT 1 FROM {LEASE_TABLE} l WHERE l.task = %s AND l.cafe_id = cafes.cafe_id "
+                      f"AND (l.done = 1 OR l.leased_until >= NOW())){condition} "
+                      f"ORDER BY cafes.cafe_id LIMIT %s FOR UPDATE SKIP LOCKED")
+        while True:
+            try:
+                rows = self._claim_once(select_sql)
+            except pymysql.err.OperationalError as e:
+                if e.args and e.args[0] in RETRY_ERRORS:
+                    time.sleep(0.1)
+                    continue
+                raise
+            if rows is None:
+                return []
+            if rows:
+                self.claimed += len(rows)
+                return rows
+
+    def _claim_once(self, select_sql):
+        """claim 트랜잭션 한 번 → 맡은 row 리스트 (전부 다른 워커에게 뺏겼으면 [], 남은 카페가 없으면 None)"""
+        with db.raw_connection() as conn:
+            cursor = conn.cursor()
+            # READ COMMITTED : 없는 lease row 를 확인할 때 gap lock 을 안 잡음 → 워커끼리 INSERT 하다 deadlock 나는 것 방지
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL READ COMMITTED")
+            cursor.execute(select_sql, (self.task, *self.params, self.batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                return None
+            ids = [row[0] for row in rows]
+            # 방금 다른 워커가 commit 한 lease 는 위 SELECT 가 못 봤을 수 있음 → 잠그고 최신 값으로 한 번 더 확인
+            cursor.execute(f"SELECT cafe_id FROM {LEASE_TABLE} WHERE task = %s AND cafe_id IN ({in_clause(ids)}) "
+                           f"AND (done = 1 OR leased_until >= NOW()) FOR UPDATE", (self.task, *ids))
+            busy = {r[0] for r in cursor.fetchall()}
+            rows = [row for row in rows if row[0] not in busy]
+            if rows:
+                values = ", ".join(["(%s, %s, %s, NOW() + INTERVAL %s SECOND)"] * len(rows))
+                params = [v for row in rows for v in (self.task, row[0], self.worker, self.lease_seconds)]
+                cursor.execute(f"INSERT INTO {LEASE_TABLE} (task, cafe_id, worker, leased_until) VALUES {values} "
+                               f"ON DUPLICATE KEY UPDATE worker = VALUES(worker), leased_until = VALUES(leased_until)",
+                               params)
+        return rows
+
+    def complete(self, cafe_ids):
+        """처리 끝난 카페 → 이번 회차에서는 다시 안 나눠줌"""
+        if cafe_ids:
+            db.execute(f"UPDATE {LEASE_TABLE} SET done = 1 WHERE task = %s AND worker = %s AND cafe_id IN ({in_clause(cafe_ids)})",
+                       (self.task, self.worker, *cafe_ids))
+            self.completed += len(cafe_ids)
+
+    def release(self, cafe_ids):
+        """맡았지만 처리 안 한 카페를 바로 반납 (lease 만료를 기다리지 않고 다른 워커가 가져감)"""
+        if cafe_ids:
+            db.execute(f"DELETE FROM {LEASE_TABLE} WHERE task = %s AND worker = %s AND done = 0 AND cafe_id IN ({in_clause(cafe_ids)})",
+                       (self.task, self.worker, *cafe_ids))
+
+    def pending(self):
+        """다른 워커가 처리 중인 (lease 가 살아 있는) 카페 수"""
+        return db.fetchall(f"SELECT COUNT(*) FROM {LEASE_TABLE} WHERE task = %s AND done = 0 AND leased_until >= NOW()",
+                           (self.task,))[0][0]
+
+    def remaining(self):
+        """이번 회차에서 아직 안 끝난 카페 수 (진행률 표시용)"""
+        condition = f" AND ({self.where})" if self.where else ""
+        return db.fetchall(f"SELECT COUNT(*) FROM cafes WHERE NOT EXISTS (SELECT 1 FROM {LEASE_TABLE} l "
+                           f"WHERE l.task = %s AND l.cafe_id = cafes.cafe_id AND l.done = 1){condition}",
+                           (self.task, *self.params))[0][0]
+
+    def _claims(self):
+        """맡을 batch 를 계속 claim (남은 게 없으면 다른 워커의 lease 가 끝나거나 만료될 때까지 기다림)"""
+        while True:
+            rows = self.claim()
+            if rows:
+                yield rows
+            elif self.wait and self.pending():
+                time.sleep(POLL)
+            else:
+                return
+
+    def __iter__(self):
+        for rows in self._claims():
+            done = 0
+            try:
+                for row in rows:
+                    yield row
+                    done += 1
+            finally:
+                # 끝까지 돌았으면 전부 완료, 중간에 멈췄으면 (처리 중이던 것 포함) 남은 카페는 반납
+                if self.buffer is not None:
+                    self.buffer.flush()
+                self.complete([row[0] for row in rows[:done]])
+                self.release([row[0] for row in rows[done:]])
+
+    def batches(self):
+        """
+        claim 한 batch 를 리스트 통째로 돌려줌 (batch 안의 카페를 동시에 처리할 때).
+        다음 batch 를 달라고 하면 이전 batch 전부 완료, 중간에 멈추면 전부 반납
+        """
+        for rows in self._claims():
+            finished = False
+            try:
+                yield rows
+                finished = True
+            finally:
+                if self.buffer is not None:
+                    self.buffer.flush()
+                ids = [row[0] for row in rows]
+                if finished:
+                    self.complete(ids)
+                else:
+                    self.release(ids)
+
+
+def status():
+    ensure_table()
+    rows = db.fetchall(f"SELECT task, SUM(done), SUM(done = 0 AND leased_until >= NOW()), "
+                       f"SUM(done = 0 AND leased_until < NOW()), COUNT(DISTINCT worker) FROM {LEASE_TABLE} GROUP BY task ORDER BY task")
+    for task, done, active, expired, workers in rows:
+        print(f"📋 {task}: 완료 {int(done)}, 처리 중 {int(active)}, 만료(다시 나눠줄 것) {int(expired)}, 워커 {workers}개")
+    if not rows:
+        print("📋 기록 없음")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="보강 스크립트 작업 큐(cafe_leases) 관리")
+    parser.add_argument("command", choices=["status", "prune", "reset"])
+    parser.add_argument("task", nargs="?", help="reset 할 작업 이름 (open_hours, image_url, kakao_rating)")
+    args = parser.parse_args(argv)
+
+    ensure_table()
+    if args.command == "status":
+        status()
+    elif args.command == "prune":
+        n = db.execute(f"DELETE FROM {LEASE_TABLE} WHERE task NOT LIKE %s", (f"%:{current_round()}",))
+        print(f"🧹 지난 회차 기록 {n}건 삭제")
+    else:
+        if not args.task:
+            parser.error("reset 할 작업 이름이 필요합니다")
+        n = db.execute(f"DELETE FROM {LEASE_TABLE} WHERE task = %s", (f"{args.task}:{current_round()}",))
+        print(f"♻️ {args.task} 이번 회차({current_round()}) 기록 {n}건 삭제")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+# 저장소 루트에서 pytest 실행 → src 의 crawler 패키지를 import 할 수 있게
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
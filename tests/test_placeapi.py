@@ -0,0 +1,69 @@
+# 장소 상세 JSON 파서 (crawler/placeapi.py) 테스트
+# ------------------------------------------------------------
+# ✅ 운영시간 : 구조화된 (dayOfWeek, timeSE) 가 요일 범위 그대로 요일별 줄로 펼쳐지는지
+# ✅ 기록한 응답(fixtures/place/<id>.json) → 페이지와 대조해 적어 둔 기대값(expected.json) 과 같은지
+#    (지금은 손으로 작성한 샘플 3개 → fixtures/place/README.md)
+# ✅ 가짜 서버(mock_place.py)를 띄워서 fetch_place → parse_place 가 HTTP 를 거쳐서도 같은 값인지 (오프라인)
+# ------------------------------------------------------------
+import json
+import os
+import socket
+
+import pytest
+
+from crawler import placeapi
+from crawler.mock_place import MockPlace
+from crawler.placeapi import FIXTURE_DIR, load_recording, parse_open_hours, parse_place, recorded_ids
+
+
+def place_with_hours(*entries):
+    return {"basicInfo": {"openHour": {"periodList": [{"timeList": [
+        {"timeName": "영업시간", "dayOfWeek": day, "timeSE": time_se} for day, time_se in entries]}]}}}
+
+
+def test_open_hours_every_day():
+    assert parse_open_hours(place_with_hours(("매일", "10:00 ~ 22:00"))) == "\n".join(
+        f"{day} 10:00 ~ 22:00" for day in "월화수목금토일")
+
+
+def test_open_hours_weekday_range_and_weekend_list():
+    hours = parse_open_hours(place_with_hours(("월~금", "08:00 ~ 21:00"), ("토,일", "10:00 ~ 20:00")))
+    assert hours == "\n".join([f"{day} 08:00 ~ 21:00" for day in "월화수목금"] +
+                              [f"{day} 10:00 ~ 20:00" for day in "토일"])
+
+
+def test_open_hours_missing():
+    assert parse_open_hours({"basicInfo": {}}) == "정보없음"
+
+
+def expected_values():
+    with open(os.path.join(FIXTURE_DIR, "expected.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("place_id", recorded_ids() or [pytest.param(None, marks=pytest.mark.skip(
+    reason="기록된 장소 응답 없음 (fixtures/place/README.md 참고)"))])
+def test_recorded_place(place_id):
+    expected = expected_values()
+    assert place_id in expected, f"{place_id}.json 의 기대값이 expected.json 에 없음"
+    assert parse_place(load_recording(place_id)) == expected[place_id]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def mock_url():
+    return MockPlace().start_in_thread(port=free_port())
+
+
+def test_fetch_through_mock(mock_url, monkeypatch):
+    monkeypatch.setattr(placeapi, "PLACE_URL", mock_url)
+    expected = expected_values()
+    for place_id in recorded_ids():
+        assert parse_place(placeapi.fetch_place(place_id)) == expected[place_id]
+    with pytest.raises(placeapi.PlaceFetchError):
+        placeapi.fetch_place("1")   # 기록도 가짜 카페도 아닌 id → 404